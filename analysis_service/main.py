@@ -8,26 +8,83 @@ Start:
     python -m uvicorn analysis_service.main:app --host 127.0.0.1 --port 8000
 """
 
-import json
 import sys
 import os
 import asyncio
-import threading
-import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import List
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+# Optional binary wire format for /analyze/stream
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Add project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+# Heartbeat frames are identical on every request and tick; serialize them once
+STARTED_BYTES = orjson.dumps({"agent": "__HEARTBEAT__", "content": "Analysis started"}) + b"\n"
+HEARTBEAT_BYTES = orjson.dumps({"agent": "__HEARTBEAT__", "content": ""}) + b"\n"
+STARTED_STREAM_BYTES = orjson.dumps(
+    {"type": "heartbeat", "agent": None, "content": "Analysis started"}
+) + b"\n"
+HEARTBEAT_STREAM_BYTES = orjson.dumps({"type": "heartbeat", "agent": None, "content": None}) + b"\n"
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def encode_ndjson_frame(event: dict) -> bytes:
+    """Encode a stream event as one NDJSON line"""
+    return orjson.dumps(event) + b"\n"
+
+
+def encode_msgpack_frame(event: dict) -> bytes:
+    """Encode a stream event as a msgpack map prefixed with its 4-byte big-endian length"""
+    body = msgpack.packb(event, use_bin_type=True)
+    return len(body).to_bytes(4, "big") + body
+
+
+if msgpack is not None:
+    STARTED_STREAM_MSGPACK = encode_msgpack_frame(
+        {"type": "heartbeat", "agent": None, "content": "Analysis started"}
+    )
+    HEARTBEAT_STREAM_MSGPACK = encode_msgpack_frame(
+        {"type": "heartbeat", "agent": None, "content": None}
+    )
+
+# Token frames are batched until this many bytes are pending or the interval elapses
+TOKEN_FLUSH_BYTES = 4096
+TOKEN_FLUSH_INTERVAL = 0.01  # seconds
+
+# Upper bound on concurrently running /analyze workers
+ANALYSIS_MAX_WORKERS = 32
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the worker pool that runs blocking /analyze jobs"""
+    app.state.analysis_pool = ThreadPoolExecutor(
+        max_workers=ANALYSIS_MAX_WORKERS,
+        thread_name_prefix="analysis",
+    )
+    yield
+    app.state.analysis_pool.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
     title="TradingCrew Analysis Service",
     description="Internal analysis service providing NDJSON streaming output",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -41,14 +98,18 @@ class AnalyzeRequest(BaseModel):
 
 
 def run_analysis_in_thread(
-    result_queue: queue.Queue,
+    loop: asyncio.AbstractEventLoop,
+    result_queue: asyncio.Queue,
     ticker: str,
     date: str,
     market: str,
     analysts: List[str],
     model: str,
 ):
-    """Run analysis in a separate thread, putting results into the queue"""
+    """Run analysis in a worker thread, handing results to the event loop's queue"""
+    def put(item):
+        loop.call_soon_threadsafe(result_queue.put_nowait, item)
+
     try:
         from .service import AnalysisService
         service = AnalysisService()
@@ -60,12 +121,12 @@ def run_analysis_in_thread(
             selected_analysts=analysts,
             model=model,
         ):
-            result_queue.put(("data", agent_name, content))
+            put(("data", agent_name, content))
 
         # Mark completion
-        result_queue.put(("done", None, None))
+        put(("done", None, None))
     except Exception as e:
-        result_queue.put(("error", str(e), None))
+        put(("error", str(e), None))
 
 
 @app.post("/analyze")
@@ -82,65 +143,51 @@ async def analyze(req: AnalyzeRequest):
     """
 
     async def generate():
-        # Create result queue
-        result_queue = queue.Queue()
-
-        # Start analysis in background thread
-        thread = threading.Thread(
-            target=run_analysis_in_thread,
-            args=(result_queue, req.ticker, req.date, req.market, req.analysts, req.model),
-            daemon=True,
+        loop = asyncio.get_running_loop()
+        result_queue = asyncio.Queue()
+
+        # Run analysis on the shared worker pool; results arrive via call_soon_threadsafe
+        loop.run_in_executor(
+            app.state.analysis_pool,
+            run_analysis_in_thread,
+            loop, result_queue, req.ticker, req.date, req.market, req.analysts, req.model,
         )
-        thread.start()
 
         # Send initial heartbeat
-        yield json.dumps({
-            "agent": "__HEARTBEAT__",
-            "content": "Analysis started",
-        }, ensure_ascii=False) + "\n"
+        yield STARTED_BYTES
 
         heartbeat_interval = 15  # Send heartbeat every 15 seconds
-        last_heartbeat = asyncio.get_event_loop().time()
 
         while True:
             try:
-                # Non-blocking get with 1 second timeout
+                # Block until a result arrives; a timeout means it is time for a heartbeat
                 try:
-                    msg_type, agent_name, content = result_queue.get(timeout=1.0)
-
-                    if msg_type == "done":
-                        break
-                    elif msg_type == "error":
-                        yield json.dumps({
-                            "agent": "__ERROR__",
-                            "content": agent_name,  # Error message is in agent_name field
-                        }, ensure_ascii=False) + "\n"
-                        break
-                    elif msg_type == "data":
-                        yield json.dumps({
-                            "agent": agent_name,
-                            "content": content,
-                        }, ensure_ascii=False) + "\n"
-                        last_heartbeat = asyncio.get_event_loop().time()
-
-                except queue.Empty:
-                    # Queue empty, check if heartbeat needed
-                    current_time = asyncio.get_event_loop().time()
-                    if current_time - last_heartbeat >= heartbeat_interval:
-                        yield json.dumps({
-                            "agent": "__HEARTBEAT__",
-                            "content": "",
-                        }, ensure_ascii=False) + "\n"
-                        last_heartbeat = current_time
-
-                    # Yield control
-                    await asyncio.sleep(0.1)
+                    msg_type, agent_name, content = await asyncio.wait_for(
+                        result_queue.get(), timeout=heartbeat_interval
+                    )
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_BYTES
+                    continue
+
+                if msg_type == "done":
+                    break
+                elif msg_type == "error":
+                    yield orjson.dumps({
+                        "agent": "__ERROR__",
+                        "content": agent_name,  # Error message is in agent_name field
+                    }) + b"\n"
+                    break
+                elif msg_type == "data":
+                    yield orjson.dumps({
+                        "agent": agent_name,
+                        "content": content,
+                    }) + b"\n"
 
             except Exception as e:
-                yield json.dumps({
+                yield orjson.dumps({
                     "agent": "__ERROR__",
                     "content": str(e),
-                }, ensure_ascii=False) + "\n"
+                }) + b"\n"
                 break
 
     return StreamingResponse(
@@ -154,10 +201,17 @@ async def analyze(req: AnalyzeRequest):
 
 
 @app.post("/analyze/stream")
-async def analyze_stream(req: AnalyzeRequest):
+async def analyze_stream(
+    req: AnalyzeRequest,
+    request: Request,
+    format: str = Query("ndjson", description="Wire format: ndjson or msgpack"),
+):
     """
     Token-level streaming analysis (new endpoint)
 
+    With ?format=msgpack or "Accept: application/x-msgpack" (and msgpack installed),
+    each event is instead sent as a msgpack map prefixed by its 4-byte big-endian length.
+
     Returns NDJSON format:
     {"type": "node_start", "agent": "Market Analyst", "content": null}
     {"type": "token", "agent": "Market Analyst", "content": "The"}
@@ -169,61 +223,107 @@ async def analyze_stream(req: AnalyzeRequest):
     """
     from .service import AnalysisService
 
+    use_msgpack = msgpack is not None and (
+        format == "msgpack" or MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+    )
+    if use_msgpack:
+        media_type = MSGPACK_MEDIA_TYPE
+        encode_frame = encode_msgpack_frame
+        started_frame, heartbeat_frame = STARTED_STREAM_MSGPACK, HEARTBEAT_STREAM_MSGPACK
+    else:
+        media_type = "application/x-ndjson"
+        encode_frame = encode_ndjson_frame
+        started_frame, heartbeat_frame = STARTED_STREAM_BYTES, HEARTBEAT_STREAM_BYTES
+
     async def generate():
         service = AnalysisService()
 
         # Send initial heartbeat
-        yield json.dumps({
-            "type": "heartbeat",
-            "agent": None,
-            "content": "Analysis started",
-        }, ensure_ascii=False) + "\n"
+        yield started_frame
 
         heartbeat_interval = 15
-        last_heartbeat = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time
+
+        events = service.analyze_stream_tokens(
+            ticker=req.ticker,
+            date=req.date,
+            market=req.market,
+            selected_analysts=req.analysts,
+            model=req.model,
+        )
+        next_event = None
+
+        # Token frames are coalesced and sent together; other events flush immediately
+        pending = bytearray()
+        flush_at = None
 
         try:
-            async for event_type, agent_name, content in service.analyze_stream_tokens(
-                ticker=req.ticker,
-                date=req.date,
-                market=req.market,
-                selected_analysts=req.analysts,
-                model=req.model,
-            ):
-                # Send event
-                yield json.dumps({
+            while True:
+                # Keep one pending read on the token stream across heartbeats
+                if next_event is None:
+                    next_event = asyncio.ensure_future(anext(events, None))
+
+                # Heartbeats fire on the clock, even while the LLM is silent
+                if flush_at is None:
+                    timeout = heartbeat_interval
+                else:
+                    timeout = max(0.0, flush_at - now())
+                done, _ = await asyncio.wait({next_event}, timeout=timeout)
+                if not done:
+                    if pending:
+                        yield bytes(pending)
+                        pending.clear()
+                        flush_at = None
+                    else:
+                        yield heartbeat_frame
+                    continue
+
+                event = next_event.result()
+                next_event = None
+                if event is None:
+                    break
+
+                event_type, agent_name, content = event
+                pending += encode_frame({
                     "type": event_type,
                     "agent": agent_name,
                     "content": content,
-                }, ensure_ascii=False) + "\n"
+                })
 
-                # Update heartbeat time
-                last_heartbeat = asyncio.get_event_loop().time()
+                if event_type == "token":
+                    if flush_at is None:
+                        flush_at = now() + TOKEN_FLUSH_INTERVAL
+                    if len(pending) < TOKEN_FLUSH_BYTES and now() < flush_at:
+                        continue
+
+                # Send buffered events
+                yield bytes(pending)
+                pending.clear()
+                flush_at = None
 
                 # Exit on completion or error
                 if event_type in ("complete", "error", "quota_error", "timeout_error"):
                     break
 
-                # Check if heartbeat needed
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_heartbeat >= heartbeat_interval:
-                    yield json.dumps({
-                        "type": "heartbeat",
-                        "agent": None,
-                        "content": None,
-                    }, ensure_ascii=False) + "\n"
-                    last_heartbeat = current_time
-
         except Exception as e:
-            yield json.dumps({
+            pending += encode_frame({
                 "type": "error",
                 "agent": None,
                 "content": str(e),
-            }, ensure_ascii=False) + "\n"
+            })
+
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+                await asyncio.gather(next_event, return_exceptions=True)
+            await events.aclose()
+
+        if pending:
+            yield bytes(pending)
 
     return StreamingResponse(
         generate(),
-        media_type="application/x-ndjson",
+        media_type=media_type,
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
@@ -239,4 +339,12 @@ async def health():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+
+    # uvloop/httptools come with uvicorn[standard] (not available on Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "h11"
+
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop=loop, http=http)
@@ -4,33 +4,134 @@ Analysis service wrapper
 Wraps TradingCrewGraph and provides a streaming output interface.
 """
 
-from typing import Dict, Any, List, Generator, AsyncGenerator
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Callable, Generator, AsyncGenerator
+from collections import deque
+from datetime import date
+import threading
 import traceback
 import sys
 import os
+import re
 
 # Add project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
-# Agent display name mapping
-AGENT_DISPLAY_NAMES = {
-    "Market Analyst": "Market Analyst",
-    "Social Analyst": "Social Analyst",
-    "News Analyst": "News Analyst",
-    "Fundamentals Analyst": "Fundamentals Analyst",
-    "Bull Researcher": "Bull Researcher",
-    "Bear Researcher": "Bear Researcher",
-    "Research Manager": "Research Manager",
-    "Trader": "Trader",
-    "Risky Analyst": "Risky Analyst",
-    "Safe Analyst": "Safe Analyst",
-    "Neutral Analyst": "Neutral Analyst",
-    "Risk Manager": "Risk Manager",
-    "Portfolio Manager": "Portfolio Manager",
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from tradingcrew.agents.registry import AGENT_DISPLAY_NAMES, NODE_TO_AGENT
+from tradingcrew.agents.utils.debate_history import latest_statement
+from tradingcrew.dataflows.config import set_config
+from tradingcrew.market_config import MODEL_PRESETS, get_dashscope_config, get_openrouter_config
+
+
+# Report field to agent name mapping
+REPORT_MAPPINGS = {
+    "market_report": "Market Analyst",
+    "sentiment_report": "Social Analyst",
+    "news_report": "News Analyst",
+    "fundamentals_report": "Fundamentals Analyst",
+    "investment_plan": "Research Manager",
+    "trader_investment_plan": "Trader",
+    "final_trade_decision": "Portfolio Manager",
 }
 
+# Debate history fields: (history key, speaker prefix, agent name)
+INVEST_DEBATE_SPEAKERS = (
+    ("bull_history", "Bull", "Bull Researcher"),
+    ("bear_history", "Bear", "Bear Researcher"),
+)
+RISK_DEBATE_SPEAKERS = (
+    ("risky_history", "Risky", "Risky Analyst"),
+    ("safe_history", "Safe", "Safe Analyst"),
+    ("neutral_history", "Neutral", "Neutral Analyst"),
+)
+
+
+# Error classification patterns (matched against the lowercased exception message)
+QUOTA_ERROR_RE = re.compile(
+    r"insufficient_quota|insufficient_balance|quota exceeded|rate limit"
+    r"|billing|payment required|account_deactivated"
+)
+TIMEOUT_ERROR_RE = re.compile(
+    r"timeout|timed out|connection|reset by peer|connection refused"
+    r"|network|unreachable|ssl|certificate"
+)
+
+
+def _classify_error(exc: BaseException) -> Tuple[str, str]:
+    """
+    Classify an analysis exception
+
+    Must be called from the except block so the traceback is available.
+
+    Returns:
+        (error_type, full_error) where error_type is "quota_error",
+        "timeout_error" or "error"
+    """
+    error_msg = str(exc).lower()
+    full_error = f"Analysis error: {str(exc)}\n{traceback.format_exc()}"
+
+    # Check for API quota exhaustion
+    if QUOTA_ERROR_RE.search(error_msg):
+        return "quota_error", full_error
+    # Check for timeout/network issues
+    if TIMEOUT_ERROR_RE.search(error_msg):
+        return "timeout_error", full_error
+    return "error", full_error
+
+
+# .env only needs to be read once per process
+_ENV_LOADED = False
+
+DEFAULT_ANALYSTS = ["market", "social", "news", "fundamentals"]
+
+
+class GraphPool:
+    """
+    Process-wide pool of idle TradingCrewGraph instances
+
+    Building a graph creates the LLM clients and tool nodes and compiles the
+    LangGraph state machine, which dominates time-to-first-token. Finished graphs
+    are kept per (market, analysts, model) key and handed to the next analysis
+    with the same key. Each graph is used by one analysis at a time.
+    """
+
+    def __init__(self, max_idle_per_key: int = 4):
+        """
+        Args:
+            max_idle_per_key: Maximum idle graphs retained per key
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: Dict[tuple, deque] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple, factory: Callable[[], Any]):
+        """Check out an idle graph for key, or build one with factory"""
+        with self._lock:
+            idle = self._idle.get(key)
+            graph = idle.pop() if idle else None
+
+        if graph is None:
+            return factory()
+
+        # Dataflow vendor config is process-global; restore this graph's market settings
+        set_config(graph.config)
+        return graph
+
+    def release(self, key: tuple, graph) -> None:
+        """Reset per-run state and return a graph to the pool"""
+        graph.curr_state = None
+        graph.ticker = None
+        graph.log_states_dict.clear()
+
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_key:
+                idle.append(graph)
+
+
+GRAPH_POOL = GraphPool()
+
 
 class AnalysisService:
     """
@@ -47,10 +148,13 @@ class AnalysisService:
         Args:
             config: TradingCrew config, can override defaults
         """
-        from dotenv import load_dotenv
+        global _ENV_LOADED
 
         # Load .env file first
-        load_dotenv()
+        if not _ENV_LOADED:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _ENV_LOADED = True
 
         self.custom_config = config
 
@@ -74,19 +178,14 @@ class AnalysisService:
         if not model:
             model = "deepseek-v3"
 
-        from tradingcrew.market_config import MODEL_PRESETS
-
         # Select config based on model preset provider
         preset = MODEL_PRESETS.get(model)
         if preset and preset["provider"] == "dashscope":
-            from tradingcrew.market_config import get_dashscope_config
             config = get_dashscope_config(market=market, model=model)
         elif preset and preset["provider"] == "openrouter":
-            from tradingcrew.market_config import get_openrouter_config
             config = get_openrouter_config(market=market, model=model)
         else:
             # Unknown model, use default
-            from tradingcrew.market_config import get_dashscope_config
             config = get_dashscope_config(market=market, model="deepseek-v3")
 
         # Apply custom config
@@ -99,8 +198,6 @@ class AnalysisService:
         """
         Create a new TradingCrewGraph instance
 
-        Creates a new instance for each analysis to avoid ChromaDB collection conflicts during concurrency.
-
         Args:
             market: Market type (A-share, US, HK)
             selected_analysts: List of enabled analysts
@@ -111,11 +208,42 @@ class AnalysisService:
         config = self._get_config(market, model)
 
         return TradingCrewGraph(
-            selected_analysts=selected_analysts or ["market", "social", "news", "fundamentals"],
+            selected_analysts=selected_analysts or DEFAULT_ANALYSTS,
             debug=False,
             config=config,
         )
 
+    def _graph_pool_key(
+        self, market: str, selected_analysts: List[str] = None, model: str = None
+    ) -> Optional[tuple]:
+        """Pool key for a graph, or None if a custom config makes it unshareable"""
+        if self.custom_config:
+            return None
+        return (market, tuple(selected_analysts or DEFAULT_ANALYSTS), model or "deepseek-v3")
+
+    def _acquire_graph(
+        self,
+        pool_key: Optional[tuple],
+        market: str,
+        selected_analysts: List[str] = None,
+        model: str = None,
+    ):
+        """
+        Check out a TradingCrewGraph for one analysis
+
+        Reuses an idle graph from GRAPH_POOL when possible; release it with _release_graph.
+        """
+        if pool_key is None:
+            return self._create_graph(market, selected_analysts, model)
+        return GRAPH_POOL.acquire(
+            pool_key, lambda: self._create_graph(market, selected_analysts, model)
+        )
+
+    def _release_graph(self, pool_key: Optional[tuple], graph) -> None:
+        """Return a graph checked out with _acquire_graph"""
+        if pool_key is not None and graph is not None:
+            GRAPH_POOL.release(pool_key, graph)
+
     def analyze_stream(
         self,
         ticker: str,
@@ -138,9 +266,11 @@ class AnalysisService:
             (agent_name, content) - Agent name and output content
             The last yield is ("__FINAL__", decision) for the final decision
         """
+        pool_key = self._graph_pool_key(market, selected_analysts, model)
+        graph = None
         try:
-            # Create new graph instance per analysis to avoid concurrency conflicts
-            graph = self._create_graph(market, selected_analysts, model)
+            # Check out a graph for exclusive use by this analysis
+            graph = self._acquire_graph(pool_key, market, selected_analysts, model)
 
             # Create initial state
             init_state = graph.propagator.create_initial_state(ticker, date)
@@ -172,37 +302,12 @@ class AnalysisService:
             yield ("__FINAL__", decision)
 
         except Exception as e:
-            error_msg = str(e).lower()
-            full_error = f"Analysis error: {str(e)}\n{traceback.format_exc()}"
-
-            # Check for API quota exhaustion
-            if any(kw in error_msg for kw in [
-                "insufficient_quota",
-                "insufficient_balance",
-                "quota exceeded",
-                "rate limit",
-                "billing",
-                "payment required",
-                "account_deactivated",
-            ]):
-                yield ("__QUOTA_ERROR__", full_error)
-
-            # Check for timeout/network issues
-            elif any(kw in error_msg for kw in [
-                "timeout",
-                "timed out",
-                "connection",
-                "reset by peer",
-                "connection refused",
-                "network",
-                "unreachable",
-                "ssl",
-                "certificate",
-            ]):
-                yield ("__TIMEOUT_ERROR__", full_error)
-
-            else:
-                yield ("__ERROR__", full_error)
+            error_type, full_error = _classify_error(e)
+            # Sync stream tags: __ERROR__, __QUOTA_ERROR__, __TIMEOUT_ERROR__
+            yield (f"__{error_type.upper()}__", full_error)
+
+        finally:
+            self._release_graph(pool_key, graph)
 
     def _extract_agent_updates(
         self,
@@ -221,78 +326,51 @@ class AnalysisService:
         """
         updates = []
 
-        # Report field to agent name mapping
-        report_mappings = {
-            "market_report": "Market Analyst",
-            "sentiment_report": "Social Analyst",
-            "news_report": "News Analyst",
-            "fundamentals_report": "Fundamentals Analyst",
-            "investment_plan": "Research Manager",
-            "trader_investment_plan": "Trader",
-            "final_trade_decision": "Portfolio Manager",
-        }
-
-        # Check report fields
-        for field, agent_name in report_mappings.items():
-            if field in chunk and chunk[field] and field not in processed:
-                content = chunk[field]
-                if content.strip():
-                    updates.append((agent_name, content))
-                    processed.add(field)
+        # Check report fields (only those present in this chunk)
+        for field in chunk.keys() & REPORT_MAPPINGS.keys():
+            content = chunk[field]
+            if content and field not in processed and content.strip():
+                updates.append((REPORT_MAPPINGS[field], content))
+                processed.add(field)
 
         # Check investment debate state
-        if "investment_debate_state" in chunk:
-            debate = chunk["investment_debate_state"]
-
-            # Bull Researcher
-            bull_key = "bull_history"
-            if bull_key in debate and debate[bull_key]:
-                cache_key = f"bull_{len(debate[bull_key])}"
+        debate = chunk.get("investment_debate_state")
+        if debate is not None:
+            for history_key, speaker, agent_name in INVEST_DEBATE_SPEAKERS:
+                history = debate.get(history_key)
+                if not history:
+                    continue
+                cache_key = f"{speaker.lower()}_{len(history)}"
                 if cache_key not in processed:
-                    latest = self._get_latest_statement(debate[bull_key], "Bull")
+                    latest = self._get_latest_statement(history, speaker)
                     if latest:
-                        updates.append(("Bull Researcher", latest))
-                        processed.add(cache_key)
-
-            # Bear Researcher
-            bear_key = "bear_history"
-            if bear_key in debate and debate[bear_key]:
-                cache_key = f"bear_{len(debate[bear_key])}"
-                if cache_key not in processed:
-                    latest = self._get_latest_statement(debate[bear_key], "Bear")
-                    if latest:
-                        updates.append(("Bear Researcher", latest))
+                        updates.append((agent_name, latest))
                         processed.add(cache_key)
 
             # Judge Decision
-            judge_key = "judge_decision"
-            if judge_key in debate and debate[judge_key] and "judge_decision" not in processed:
-                updates.append(("Research Manager", debate[judge_key]))
+            judge_decision = debate.get("judge_decision")
+            if judge_decision and "judge_decision" not in processed:
+                updates.append(("Research Manager", judge_decision))
                 processed.add("judge_decision")
 
         # Check risk debate state
-        if "risk_debate_state" in chunk:
-            risk = chunk["risk_debate_state"]
-
-            for analyst_key, agent_name in [
-                ("risky_history", "Risky Analyst"),
-                ("safe_history", "Safe Analyst"),
-                ("neutral_history", "Neutral Analyst"),
-            ]:
-                if analyst_key in risk and risk[analyst_key]:
-                    cache_key = f"{analyst_key}_{len(risk[analyst_key])}"
-                    if cache_key not in processed:
-                        latest = self._get_latest_statement(
-                            risk[analyst_key],
-                            analyst_key.split("_")[0].title()
-                        )
-                        if latest:
-                            updates.append((agent_name, latest))
-                            processed.add(cache_key)
+        risk = chunk.get("risk_debate_state")
+        if risk is not None:
+            for history_key, speaker, agent_name in RISK_DEBATE_SPEAKERS:
+                history = risk.get(history_key)
+                if not history:
+                    continue
+                cache_key = f"{history_key}_{len(history)}"
+                if cache_key not in processed:
+                    latest = self._get_latest_statement(history, speaker)
+                    if latest:
+                        updates.append((agent_name, latest))
+                        processed.add(cache_key)
 
             # Risk Judge Decision
-            if "judge_decision" in risk and risk["judge_decision"] and "risk_judge_decision" not in processed:
-                updates.append(("Risk Manager", risk["judge_decision"]))
+            judge_decision = risk.get("judge_decision")
+            if judge_decision and "risk_judge_decision" not in processed:
+                updates.append(("Risk Manager", judge_decision))
                 processed.add("risk_judge_decision")
 
         return updates
@@ -308,20 +386,7 @@ class AnalysisService:
         Returns:
             Latest statement content
         """
-        if not history:
-            return ""
-
-        # Split by speaker
-        statements = history.split(f"{speaker_prefix}")
-        if len(statements) > 1:
-            # Get the last statement
-            last = statements[-1]
-            # Clean prefix
-            if last.startswith(" Analyst:") or last.startswith(" Researcher:"):
-                last = last.split(":", 1)[-1].strip()
-            return last.strip()
-
-        return ""
+        return latest_statement(history, speaker_prefix)
 
     def get_agent_display_name(self, agent_name: str) -> str:
         """Get the display name for an agent"""
@@ -352,38 +417,29 @@ class AnalysisService:
             - ("node_end", agent_name, full_content): Agent finished
             - ("complete", None, decision): Analysis complete
             - ("error", None, error_msg): Error occurred
-        """
-        # Node name to agent name mapping
-        node_to_agent = {
-            "market_analyst": "Market Analyst",
-            "social_analyst": "Social Analyst",
-            "news_analyst": "News Analyst",
-            "fundamentals_analyst": "Fundamentals Analyst",
-            "bull_researcher": "Bull Researcher",
-            "bear_researcher": "Bear Researcher",
-            "research_manager": "Research Manager",
-            "invest_judge": "Research Manager",
-            "trader": "Trader",
-            "risky_debator": "Risky Analyst",
-            "safe_debator": "Safe Analyst",
-            "neutral_debator": "Neutral Analyst",
-            "risk_manager": "Risk Manager",
-            "risk_judge": "Risk Manager",
-            "portfolio_manager": "Portfolio Manager",
-        }
 
+            The analysts run concurrently, so their events interleave: track
+            tokens per agent, not per "current" agent.
+        """
+        pool_key = self._graph_pool_key(market, selected_analysts, model)
+        graph = None
         try:
-            # Create graph for this analysis
-            graph = self._create_graph(market, selected_analysts, model)
+            # Check out a graph for exclusive use by this analysis
+            graph = self._acquire_graph(pool_key, market, selected_analysts, model)
 
             # Use the new streaming method
             async for event_type, node_name, content in graph.propagate_streaming(ticker, date):
-                # Map node name to agent name
-                agent_name = node_to_agent.get(node_name, node_name) if node_name else None
-
                 if event_type == "complete":
                     yield ("complete", None, content)
-                elif event_type == "node_start":
+                    continue
+
+                # Map node name to agent name; internal nodes (tool calls,
+                # "Parallel Analysts", message clearing) are not agents
+                agent_name = NODE_TO_AGENT.get(node_name)
+                if agent_name is None:
+                    continue
+
+                if event_type == "node_start":
                     yield ("node_start", agent_name, None)
                 elif event_type == "token":
                     yield ("token", agent_name, content)
@@ -391,25 +447,13 @@ class AnalysisService:
                     yield ("node_end", agent_name, content)
 
         except Exception as e:
-            error_msg = str(e).lower()
-            full_error = f"Analysis error: {str(e)}\n{traceback.format_exc()}"
-
-            # Check API quota issues
-            if any(kw in error_msg for kw in [
-                "insufficient_quota", "insufficient_balance", "quota exceeded",
-                "rate limit", "billing", "payment required", "account_deactivated",
-            ]):
-                yield ("quota_error", None, full_error)
-            # Check timeout/network issues
-            elif any(kw in error_msg for kw in [
-                "timeout", "timed out", "connection", "reset by peer",
-                "connection refused", "network", "unreachable", "ssl", "certificate",
-            ]):
-                yield ("timeout_error", None, full_error)
-            else:
-                yield ("error", None, full_error)
+            error_type, full_error = _classify_error(e)
+            yield (error_type, None, full_error)
+
+        finally:
+            self._release_graph(pool_key, graph)
 
 
 def get_default_date() -> str:
     """Get default analysis date (today or last trading day)"""
-    return datetime.now().strftime("%Y-%m-%d")
+    return date.today().isoformat()
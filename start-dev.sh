@@ -29,7 +29,7 @@ export PYTHONPATH="${PYTHONPATH}:${PROJECT_ROOT}"
 start_python() {
     echo "Starting Python Analysis Service on port 8000..."
     cd "$PROJECT_ROOT"
-    python -m uvicorn analysis_service.main:app --host 127.0.0.1 --port 8000 --reload
+    python -m uvicorn analysis_service.main:app --host 127.0.0.1 --port 8000 --loop uvloop --http httptools --reload
 }
 
 start_web() {
@@ -0,0 +1,63 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from tradingcrew.dataflows import _ak_cache
+from tradingcrew.dataflows._ak_cache import _decode_frame, _encode_frame
+
+
+def _hist_frame():
+    return pd.DataFrame(
+        {
+            "日期": [date(2024, 1, 2), date(2024, 1, 3), None],
+            "股票代码": ["000001", "000001", "000001"],
+            "收盘": [10.5, np.nan, 10.8],
+            "成交量": [1200, 1300, 1400],
+            "时间": pd.to_datetime(["2024-01-02 15:00", None, "2024-01-04 15:00"]),
+            "value": ["贵州茅台", 1.5e11, 1],
+        }
+    )
+
+
+def test_frame_round_trip_keeps_values_and_dtypes():
+    df = _hist_frame()
+
+    pd.testing.assert_frame_equal(_decode_frame(_encode_frame(df)), df)
+
+
+def test_frame_round_trip_keeps_index():
+    df = _hist_frame().set_index("时间")
+
+    pd.testing.assert_frame_equal(_decode_frame(_encode_frame(df)), df)
+
+
+def test_redis_entry_is_json():
+    blob = _encode_frame(_hist_frame())
+
+    assert blob.startswith(b"{")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+def test_lookup_reads_entries_stored_by_another_process(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(_ak_cache, "_get_redis", lambda: redis)
+
+    def stock_zh_a_hist(**kwargs):
+        return _hist_frame()
+
+    _ak_cache.cache_store(stock_zh_a_hist, 60, _hist_frame(), symbol="000001")
+    _ak_cache.clear_ak_cache()
+
+    df = _ak_cache.cache_lookup(stock_zh_a_hist, 60, symbol="000001")
+    pd.testing.assert_frame_equal(df, _hist_frame())
@@ -0,0 +1,60 @@
+import json
+import math
+
+import pytest
+
+from tradingcrew.backtest import BacktestMetrics, BacktestResult, TradeRecord
+from tradingcrew.backtest import runner
+
+
+TRADES = [
+    TradeRecord("2024-01-02", "600519", "BUY", 100.0, 102.0, 2.0),
+    TradeRecord("2024-01-03", "600519", "HOLD", 102.0, 101.0, 0.0),
+    TradeRecord("2024-01-04", "600519", "SELL", 101.0, 99.0, 1.98),
+]
+
+
+def _result():
+    metrics = BacktestMetrics(total_trades=3, profit_factor=math.inf, sharpe_ratio=math.nan)
+    return BacktestResult("600519", "2024-01-02", "2024-01-04", TRADES, metrics, 3)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_save_to_json_writes_non_finite_metrics_the_same_way(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(runner, "orjson", None)
+    path = tmp_path / "result.json"
+
+    _result().save_to_json(str(path))
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["metrics"]["profit_factor"] == "Infinity"
+    assert saved["metrics"]["sharpe_ratio"] is None
+    assert saved["trades"][2]["return_pct"] == 1.98
+
+
+def test_trades_slice_returns_trade_book():
+    trades = _result().trades
+
+    head = trades[:2]
+    assert isinstance(head, runner.TradeBook)
+    assert head == TRADES[:2]
+    assert trades[1:] == TRADES[1:]
+    assert trades[::-1] == TRADES[::-1]
+    assert trades[5:] == []
+    assert trades[-1] == TRADES[-1]
+
+
+def test_trades_append_keeps_list_semantics():
+    result = _result()
+    assert len(result.to_dataframe()) == 3
+
+    extra = TradeRecord("2024-01-05", "600519", "BUY", 99.0, 100.0, 1.01)
+    result.trades.append(extra)
+
+    assert result.trades == TRADES + [extra]
+    assert result.to_dataframe()["date"].tolist()[-1] == "2024-01-05"
+    with pytest.raises(ValueError):
+        result.trades.append(TradeRecord("2024-01-05", "000001", "BUY", 1.0, 1.0, 0.0))
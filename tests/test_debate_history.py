@@ -0,0 +1,24 @@
+from tradingcrew.agents.utils.debate_history import latest_statement
+
+
+def test_latest_statement_returns_last_turn():
+    history = "Bull Analyst: Margins keep expanding.\nBull Analyst: Debt is falling every quarter."
+
+    assert latest_statement(history, "Bull") == "Debt is falling every quarter."
+
+
+def test_speaker_name_inside_statement_is_not_a_turn():
+    history = (
+        "Bull Analyst: Margins keep expanding.\n"
+        "Bull Analyst: The Bullish trend has room to run; Bull markets rarely stop here."
+    )
+
+    assert latest_statement(history, "Bull") == (
+        "The Bullish trend has room to run; Bull markets rarely stop here."
+    )
+    assert latest_statement("Bear Analyst: Bullish momentum is fading.", "Bull") == ""
+
+
+def test_researcher_label_and_empty_history():
+    assert latest_statement("Bull Researcher: Buy the dip.", "Bull") == "Buy the dip."
+    assert latest_statement("", "Bull") == ""
@@ -0,0 +1,47 @@
+import json
+import time
+
+from tradingcrew.dataflows import akshare_astock
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.params = []
+
+    def get(self, url, params=None, timeout=None):
+        self.params.append(params)
+        return FakeResponse(self.payload)
+
+
+PAYLOAD = {"data": {"fastNewsList": [
+    {"title": "Headline", "summary": "Summary text", "showTime": "2024-03-13 10:00:00", "code": "202403131234"},
+]}}
+
+
+def test_global_news_head_sends_fresh_req_trace(monkeypatch):
+    session = FakeSession(PAYLOAD)
+    monkeypatch.setattr(akshare_astock, "_http_session", session)
+
+    before = int(time.time() * 1000)
+    akshare_astock._global_news_head(1)
+    after = int(time.time() * 1000)
+
+    assert before <= int(session.params[0]["req_trace"]) <= after
+
+
+def test_global_news_content_comes_from_summary(monkeypatch):
+    monkeypatch.setattr(akshare_astock, "_http_session", FakeSession(PAYLOAD))
+
+    df = akshare_astock._global_news_head(1)
+    news = akshare_astock._select_fields(df, akshare_astock._GLOBAL_NEWS_FIELDS)
+
+    assert news["content"].tolist() == ["Summary text"]
@@ -0,0 +1,31 @@
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+
+from tradingcrew.agents.utils.llm_cache import FileLLMCache
+
+
+def test_lookup_returns_stored_generations(tmp_path):
+    cache = FileLLMCache(str(tmp_path))
+    cache.update("prompt", "llm", [ChatGeneration(message=AIMessage(content="BUY"))])
+
+    hit = cache.lookup("prompt", "llm")
+
+    assert hit is not None
+    assert hit[0].message.content == "BUY"
+    assert cache.lookup("other prompt", "llm") is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, capsys):
+    cache = FileLLMCache(str(tmp_path))
+    cache.update("prompt", "llm", [ChatGeneration(message=AIMessage(content="BUY"))])
+    cache._path("prompt", "llm").write_text("not json", encoding="utf-8")
+
+    assert cache.lookup("prompt", "llm") is None
+    assert "unreadable LLM cache entry" in capsys.readouterr().out
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = FileLLMCache(str(tmp_path), ttl_days=0)
+    cache.update("prompt", "llm", [ChatGeneration(message=AIMessage(content="BUY"))])
+
+    assert cache.lookup("prompt", "llm") is None
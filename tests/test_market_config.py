@@ -0,0 +1,30 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from tradingcrew.market_config import ASTOCK_CONFIG, get_market_config
+
+
+@pytest.mark.parametrize("market", ["A-share", "US", "HK"])
+def test_config_is_plain_and_serializable(market):
+    config = get_market_config(market, max_debate_rounds=3)
+
+    assert type(config["data_vendors"]) is dict
+    assert type(config["tool_vendors"]) is dict
+    assert copy.deepcopy(config) == config
+    assert pickle.loads(pickle.dumps(config)) == config
+    json.dumps(config)
+    assert config["max_debate_rounds"] == 3
+
+
+def test_modifying_a_config_leaves_the_base_unchanged():
+    config = get_market_config("A-share")
+    config["data_vendors"]["news_data"] = "google"
+    config["tool_vendors"]["get_news"] = "google"
+
+    fresh = get_market_config("A-share")
+    assert fresh["data_vendors"]["news_data"] == "akshare"
+    assert "get_news" not in fresh["tool_vendors"]
+    assert ASTOCK_CONFIG["data_vendors"]["news_data"] == "akshare"
@@ -0,0 +1,24 @@
+import pytest
+
+from tradingcrew.backtest import TradeBook, TradeRecord, calculate_metrics
+
+
+TRADES = [
+    TradeRecord("2024-01-02", "600519", "BUY", 100.0, 102.0, 2.0),
+    TradeRecord("2024-01-03", "600519", "HOLD", 102.0, 101.0, 0.0),
+    TradeRecord("2024-01-04", "600519", "SELL", 101.0, 103.0, -1.98),
+    TradeRecord("2024-01-05", "600519", "BUY", 103.0, 104.5, 1.46),
+]
+
+
+@pytest.mark.parametrize(
+    "trades",
+    [tuple(TRADES), TradeBook.from_records("600519", TRADES)],
+    ids=["tuple", "trade_book"],
+)
+def test_metrics_match_list_input(trades):
+    assert calculate_metrics(trades) == calculate_metrics(TRADES)
+
+
+def test_empty_trades():
+    assert calculate_metrics(()).total_trades == 0
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from tradingcrew.graph.signal_processing import SignalProcessor
+
+
+class RecordingLLM:
+    """Stand-in quick-thinking LLM that records calls and answers a fixed decision"""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=self.answer)
+
+
+def test_final_proposal_marker_is_parsed_locally():
+    llm = RecordingLLM("HOLD")
+    signal = "Strong momentum.\n\nFINAL TRANSACTION PROPOSAL: **SELL**"
+
+    assert SignalProcessor(llm).process_signal(signal) == "SELL"
+    assert llm.calls == 0
+
+
+def test_quoted_analyst_bold_goes_to_llm():
+    llm = RecordingLLM("HOLD")
+    signal = (
+        "The Risky Analyst argues we should **BUY** on momentum, but the downside "
+        "risk dominates. My recommendation is to Hold."
+    )
+
+    assert SignalProcessor(llm).process_signal(signal) == "HOLD"
+    assert llm.calls == 1
+
+
+def test_prompt_template_is_not_a_decision():
+    llm = RecordingLLM("BUY")
+    signal = "End with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**. I lean towards buying."
+
+    assert SignalProcessor(llm).process_signal(signal) == "BUY"
+    assert llm.calls == 1
+
+
+def test_quoted_trader_marker_goes_to_llm():
+    llm = RecordingLLM("SELL")
+    signal = (
+        "The trader's plan concluded: FINAL TRANSACTION PROPOSAL: **BUY**\n\n"
+        "The Safe Analyst's downside case outweighs it. My final recommendation is to Sell."
+    )
+
+    assert SignalProcessor(llm).process_signal(signal) == "SELL"
+    assert llm.calls == 1
+
+
+def test_trailing_marker_overrides_quoted_trader_marker():
+    llm = RecordingLLM("BUY")
+    signal = (
+        "Starting from the trader's plan (FINAL TRANSACTION PROPOSAL: **BUY**),\n"
+        "the risks argue for waiting.\n\n"
+        "FINAL TRANSACTION PROPOSAL: **HOLD**\n"
+    )
+
+    assert SignalProcessor(llm).process_signal(signal) == "HOLD"
+    assert llm.calls == 0
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingcrew.dataflows._ta_numba import INDICATOR_DISPATCH
+
+# OHLCV with flat-price runs and the indicators stockstats 0.6.5 (the version
+# pinned in requirements.txt) computes for it; regenerate with
+# _ohlcv_with_flat_days(300) and stockstats.wrap when the pin changes
+REFERENCE = Path(__file__).parent / "data" / "ta_stockstats_0_6_5.csv"
+
+
+def _ohlcv_with_flat_days(n=400, seed=7):
+    """Random-walk OHLCV with runs of repeated prices (suspensions, limit-up/down days)"""
+    rng = np.random.default_rng(seed)
+    close = np.round(20 + np.cumsum(rng.normal(0, 0.4, n)), 2)
+    high = np.round(close + rng.uniform(0, 0.5, n), 2)
+    low = np.round(close - rng.uniform(0, 0.5, n), 2)
+    for start in range(30, n, 45):
+        flat = slice(start, start + 3)
+        close[flat] = high[flat] = low[flat] = close[start]
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, n).astype(np.float64),
+        },
+        index=pd.date_range("2023-01-02", periods=n, freq="B", name="date"),
+    )
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return pd.read_csv(REFERENCE, index_col="date")
+
+
+@pytest.mark.parametrize("indicator", sorted(INDICATOR_DISPATCH))
+def test_kernel_matches_stockstats_reference(reference, indicator):
+    columns = {
+        name: reference[name].to_numpy(dtype=np.float64)
+        for name in ("open", "high", "low", "close", "volume")
+    }
+
+    actual = INDICATOR_DISPATCH[indicator](columns)
+
+    np.testing.assert_allclose(
+        actual, reference[indicator].to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+
+
+def test_reference_has_flat_price_days(reference):
+    assert (reference["close"].diff() == 0).sum() >= 10
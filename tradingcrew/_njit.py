@@ -0,0 +1,19 @@
+"""
+Optional Numba JIT
+
+Kernels decorated with njit are compiled when Numba is installed and run as
+plain Python otherwise. Callers should check NUMBA_AVAILABLE before routing
+large inputs to a kernel, since the uncompiled loop is slower than NumPy.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -6,18 +6,22 @@ from tradingcrew.dataflows.config import get_config
 
 
 def create_fundamentals_analyst(llm):
+    tools = [
+        get_fundamentals,
+        get_balance_sheet,
+        get_cashflow,
+        get_income_statement,
+    ]
+
+    # Bind the tool schemas once, not on every LLM call
+    llm_with_tools = llm.bind_tools(tools)
+    tool_names = ", ".join([tool.name for tool in tools])
+
     def fundamentals_analyst_node(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
 
-        tools = [
-            get_fundamentals,
-            get_balance_sheet,
-            get_cashflow,
-            get_income_statement,
-        ]
-
         # Output instruction
         chinese_instruction = """
 
@@ -49,11 +53,11 @@ def create_fundamentals_analyst(llm):
         )
 
         prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
+        prompt = prompt.partial(tool_names=tool_names)
         prompt = prompt.partial(current_date=current_date)
         prompt = prompt.partial(ticker=ticker)
 
-        chain = prompt | llm.bind_tools(tools)
+        chain = prompt | llm_with_tools
 
         result = chain.invoke(state["messages"])
 
@@ -7,16 +7,20 @@ from tradingcrew.dataflows.config import get_config
 
 def create_market_analyst(llm):
 
+    tools = [
+        get_stock_data,
+        get_indicators,
+    ]
+
+    # Bind the tool schemas once, not on every LLM call
+    llm_with_tools = llm.bind_tools(tools)
+    tool_names = ", ".join([tool.name for tool in tools])
+
     def market_analyst_node(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
 
-        tools = [
-            get_stock_data,
-            get_indicators,
-        ]
-
         # Output instruction
         chinese_instruction = """
 
@@ -71,11 +75,11 @@ Volume-Based Indicators:
         )
 
         prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
+        prompt = prompt.partial(tool_names=tool_names)
         prompt = prompt.partial(current_date=current_date)
         prompt = prompt.partial(ticker=ticker)
 
-        chain = prompt | llm.bind_tools(tools)
+        chain = prompt | llm_with_tools
 
         result = chain.invoke(state["messages"])
 
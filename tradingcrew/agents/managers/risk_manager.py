@@ -27,7 +27,7 @@ def create_risk_manager(llm, memory):
         # Output instruction
         chinese_instruction = """
 
-[Important] Please output your final trading decision professionally. Clearly provide a Buy/Sell/Hold recommendation.
+[Important] Please output your final trading decision professionally. Clearly provide a Buy/Sell/Hold recommendation, and conclude your response with 'FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**' stating your own decision.
 """
 
         prompt = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation: Buy, Sell, or Hold. Choose Hold only if strongly justified by specific arguments, not as a fallback when all sides seem valid. Strive for clarity and decisiveness.
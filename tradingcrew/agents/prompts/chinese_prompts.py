@@ -4,22 +4,8 @@ TradingCrew prompt instructions
 Instructions for LLM Agents to output analysis reports.
 """
 
-# Agent name mapping
-AGENT_NAMES_CN = {
-    "Market Analyst": "Market Analyst",
-    "Social Analyst": "Social Analyst",
-    "News Analyst": "News Analyst",
-    "Fundamentals Analyst": "Fundamentals Analyst",
-    "Bull Researcher": "Bull Researcher",
-    "Bear Researcher": "Bear Researcher",
-    "Research Manager": "Research Manager",
-    "Trader": "Trader",
-    "Risky Analyst": "Risky Analyst",
-    "Neutral Analyst": "Neutral Analyst",
-    "Safe Analyst": "Safe Analyst",
-    "Risk Manager": "Risk Manager",
-    "Portfolio Manager": "Portfolio Manager",
-}
+# Agent name mapping (defined in the agent registry)
+from ..registry import AGENT_NAMES_CN
 
 # Output instruction - appended to existing prompts
 CHINESE_OUTPUT_INSTRUCTION = """
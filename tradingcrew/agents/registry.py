@@ -0,0 +1,71 @@
+"""
+Agent registry
+
+Single source of truth for agent names: the display name shown to users,
+the localized name used in prompts, and the graph nodes each agent runs as.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class AgentInfo:
+    """Naming information for a single agent"""
+    display_name: str
+    chinese_name: str
+    node_names: Tuple[str, ...] = ()
+
+
+# Node names include the LangGraph node each agent runs as (e.g. "Risk Judge")
+AGENTS: Mapping[str, AgentInfo] = MappingProxyType({
+    "Market Analyst": AgentInfo(
+        "Market Analyst", "Market Analyst", ("market_analyst", "Market Analyst")
+    ),
+    "Social Analyst": AgentInfo(
+        "Social Analyst", "Social Analyst", ("social_analyst", "Social Analyst")
+    ),
+    "News Analyst": AgentInfo(
+        "News Analyst", "News Analyst", ("news_analyst", "News Analyst")
+    ),
+    "Fundamentals Analyst": AgentInfo(
+        "Fundamentals Analyst", "Fundamentals Analyst", ("fundamentals_analyst", "Fundamentals Analyst")
+    ),
+    "Bull Researcher": AgentInfo(
+        "Bull Researcher", "Bull Researcher", ("bull_researcher", "Bull Researcher")
+    ),
+    "Bear Researcher": AgentInfo(
+        "Bear Researcher", "Bear Researcher", ("bear_researcher", "Bear Researcher")
+    ),
+    "Research Manager": AgentInfo(
+        "Research Manager", "Research Manager", ("research_manager", "invest_judge", "Research Manager")
+    ),
+    "Trader": AgentInfo("Trader", "Trader", ("trader", "Trader")),
+    "Risky Analyst": AgentInfo(
+        "Risky Analyst", "Risky Analyst", ("risky_debator", "Risky Analyst")
+    ),
+    "Safe Analyst": AgentInfo(
+        "Safe Analyst", "Safe Analyst", ("safe_debator", "Safe Analyst")
+    ),
+    "Neutral Analyst": AgentInfo(
+        "Neutral Analyst", "Neutral Analyst", ("neutral_debator", "Neutral Analyst")
+    ),
+    "Risk Manager": AgentInfo(
+        "Risk Manager", "Risk Manager", ("risk_manager", "risk_judge", "Risk Judge")
+    ),
+    "Portfolio Manager": AgentInfo(
+        "Portfolio Manager", "Portfolio Manager", ("portfolio_manager",)
+    ),
+})
+
+# Read-only views derived from AGENTS
+AGENT_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(
+    {name: info.display_name for name, info in AGENTS.items()}
+)
+AGENT_NAMES_CN: Mapping[str, str] = MappingProxyType(
+    {name: info.chinese_name for name, info in AGENTS.items()}
+)
+NODE_TO_AGENT: Mapping[str, str] = MappingProxyType(
+    {node: info.display_name for info in AGENTS.values() for node in info.node_names}
+)
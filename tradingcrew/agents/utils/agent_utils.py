@@ -20,20 +20,20 @@ from tradingcrew.agents.utils.news_data_tools import (
     get_global_news
 )
 
-def create_msg_delete():
-    def delete_messages(state):
-        """Clear messages and add placeholder for Anthropic compatibility"""
-        messages = state["messages"]
-        
-        # Remove all messages
-        removal_operations = [RemoveMessage(id=m.id) for m in messages]
-        
-        # Add a minimal placeholder message
-        placeholder = HumanMessage(content="Continue")
-        
-        return {"messages": removal_operations + [placeholder]}
-    
-    return delete_messages
+def delete_messages(state):
+    """Clear messages and add placeholder for Anthropic compatibility"""
+    messages = state["messages"]
+
+    # Remove all messages
+    removal_operations = [RemoveMessage(id=m.id) for m in messages]
+
+    # Add a minimal placeholder message (a fresh one each time: the
+    # messages reducer assigns it an id, so it cannot be shared)
+    placeholder = HumanMessage(content="Continue")
 
+    return {"messages": removal_operations + [placeholder]}
 
-        
\ No newline at end of file
+
+def create_msg_delete():
+    """Return the message-clearing node (kept for backward compatibility)"""
+    return delete_messages
@@ -0,0 +1,45 @@
+"""
+Debate history parsing
+
+Debate histories are the speakers' turns joined by newlines, each turn
+starting with its label ("Bull Analyst:", "Risky Analyst:", ...).
+"""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def speaker_pattern(speaker_prefix: str) -> "re.Pattern[str]":
+    """Pattern matching a speaker's label at the start of a debate history line"""
+    return re.compile(rf"(?m)^{re.escape(speaker_prefix)}(?: Analyst| Researcher)?:\s*")
+
+
+def latest_statement(history: str, speaker_prefix: str) -> str:
+    """
+    Extract a speaker's latest statement from debate history
+
+    Only a label at the start of a line starts a turn, so the speaker's name
+    inside a statement (e.g. "Bullish" in a Bear argument) is not mistaken
+    for a new turn.
+
+    Args:
+        history: Full debate history
+        speaker_prefix: Speaker prefix (e.g. "Bull", "Bear")
+
+    Returns:
+        Latest statement content (everything after the last label)
+    """
+    if not history:
+        return ""
+
+    # Walk back from the end instead of scanning every turn in the history
+    pattern = speaker_pattern(speaker_prefix)
+    end = len(history)
+    while (idx := history.rfind(speaker_prefix, 0, end)) >= 0:
+        label = pattern.match(history, idx)
+        if label is not None:
+            return history[label.end():].strip()
+        end = idx
+
+    return ""
@@ -0,0 +1,103 @@
+"""
+On-disk LLM response cache
+
+A LangChain BaseCache that stores chat model responses as files, keyed on a
+hash of the model settings (model name, parameters, bound tools) and the
+prompt messages. Repeated runs over the same ticker and date, e.g. re-running
+a backtest, then skip the LLM round trip for every identical call.
+
+Enabled by setting "llm_cache_dir" in the config; responses older than the TTL
+are fetched again.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+# Days a cached response stays valid
+DEFAULT_TTL_DAYS = 90
+
+# Per-response metadata on earlier AI messages in a prompt: it differs between a
+# live call and a cache hit (token usage, provider ids), not the conversation
+_VOLATILE_MESSAGE_FIELDS = ("usage_metadata", "response_metadata")
+
+# Restrict deserialization to langchain_core classes where loads supports it
+# (langchain-core 0.3 has no allowed_objects and loads any registered class)
+_LOADS_KWARGS = (
+    {"allowed_objects": "core"}
+    if "allowed_objects" in inspect.signature(loads).parameters
+    else {}
+)
+
+warnings.filterwarnings("ignore", message="The function `loads` is in beta", module=__name__)
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Serialized prompt messages without per-response metadata"""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+
+    for message in messages:
+        kwargs = message.get("kwargs") if isinstance(message, dict) else None
+        if isinstance(kwargs, dict):
+            for field in _VOLATILE_MESSAGE_FIELDS:
+                kwargs.pop(field, None)
+    return json.dumps(messages, sort_keys=True, ensure_ascii=False)
+
+
+class FileLLMCache(BaseCache):
+    """LLM response cache stored as {cache_dir}/{hash[:2]}/{hash}.json"""
+
+    def __init__(self, cache_dir: str, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl_days * 24 * 3600
+
+    def _path(self, prompt: str, llm_string: str) -> Path:
+        digest = hashlib.blake2b(
+            f"{llm_string}\0{_normalize_prompt(prompt)}".encode("utf-8"), digest_size=20
+        ).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Cached generations for this prompt and model, or None"""
+        path = self._path(prompt, llm_string)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return loads(path.read_text(encoding="utf-8"), **_LOADS_KWARGS)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, NotImplementedError) as e:
+            print(f"Warning: unreadable LLM cache entry {path.name}, calling the model: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations for this prompt and model"""
+        path = self._path(prompt, llm_string)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename, so readers never see a partial entry
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(dumps(list(return_val)))
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"Warning: LLM cache write failed: {e}")
+
+    def clear(self, **kwargs) -> None:
+        """Delete every cached response"""
+        for path in self.cache_dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
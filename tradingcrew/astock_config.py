@@ -47,20 +47,18 @@ def get_astock_config(
     Returns:
         Configuration dictionary
     """
-    config = ASTOCK_CONFIG.copy()
-
-    if llm_provider is not None:
-        config["llm_provider"] = llm_provider
-    if deep_think_llm is not None:
-        config["deep_think_llm"] = deep_think_llm
-    if quick_think_llm is not None:
-        config["quick_think_llm"] = quick_think_llm
-    if max_debate_rounds is not None:
-        config["max_debate_rounds"] = max_debate_rounds
-    if max_risk_discuss_rounds is not None:
-        config["max_risk_discuss_rounds"] = max_risk_discuss_rounds
-
-    return config
+    overrides = {
+        key: value
+        for key, value in (
+            ("llm_provider", llm_provider),
+            ("deep_think_llm", deep_think_llm),
+            ("quick_think_llm", quick_think_llm),
+            ("max_debate_rounds", max_debate_rounds),
+            ("max_risk_discuss_rounds", max_risk_discuss_rounds),
+        )
+        if value is not None
+    }
+    return {**ASTOCK_CONFIG, **overrides}
 
 
 # Fast backtest config (fewer debate rounds for speed)
@@ -94,16 +92,15 @@ def get_ollama_config(
     Returns:
         Configuration dictionary
     """
-    config = ASTOCK_CONFIG.copy()
-    config.update({
+    return {
+        **ASTOCK_CONFIG,
         "llm_provider": "ollama",
         "backend_url": ollama_url,
         "deep_think_llm": model,
         "quick_think_llm": model,
         "max_debate_rounds": max_debate_rounds,
         "max_risk_discuss_rounds": max_risk_discuss_rounds,
-    })
-    return config
+    }
 
 
 # Ollama local deployment config (using Qwen2.5 7B, 32k context window)
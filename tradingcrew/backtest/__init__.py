@@ -14,7 +14,7 @@ from .trading_calendar import (
     get_hs300_constituents,
 )
 from .metrics import BacktestMetrics, calculate_metrics
-from .runner import BacktestRunner, BacktestResult, TradeRecord
+from .runner import BacktestRunner, BacktestResult, TradeBook, TradeRecord, load_state
 
 __all__ = [
     # Trading calendar
@@ -28,5 +28,7 @@ __all__ = [
     # Backtest runner
     "BacktestRunner",
     "BacktestResult",
+    "TradeBook",
     "TradeRecord",
+    "load_state",
 ]
@@ -10,15 +10,26 @@ Supported metrics:
 - Volatility
 """
 
-from dataclasses import dataclass
-from typing import List, TYPE_CHECKING
+from dataclasses import dataclass, fields
+from math import fsum, sqrt
+from operator import attrgetter
+from typing import List, Sequence, TYPE_CHECKING, Union
 import numpy as np
 
+from .._njit import NUMBA_AVAILABLE, njit
+
+# Series at least this long use the single-pass Numba kernels (when Numba is installed)
+NUMBA_MIN_RETURNS = 4096
+
 if TYPE_CHECKING:
-    from .runner import TradeRecord
+    from .runner import TradeBook, TradeRecord
+
+# Per-trade fields read by calculate_metrics
+_TRADE_DTYPE = np.dtype([("return_pct", np.float64), ("active", np.bool_)])
+_get_trade_fields = attrgetter("return_pct", "decision")
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestMetrics:
     """Backtest evaluation metrics"""
     win_rate: float = 0.0              # Win rate (%)
@@ -63,78 +74,86 @@ Streak Statistics:
 ========================================
 """
 
+    def to_tuple(self) -> tuple:
+        """Convert to a tuple of field values, in _METRIC_FIELDS order"""
+        return _get_metric_fields(self)
+
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        return {
-            "win_rate": self.win_rate,
-            "cumulative_return": self.cumulative_return,
-            "max_drawdown": self.max_drawdown,
-            "sharpe_ratio": self.sharpe_ratio,
-            "total_trades": self.total_trades,
-            "active_trades": self.active_trades,
-            "winning_trades": self.winning_trades,
-            "losing_trades": self.losing_trades,
-            "avg_return": self.avg_return,
-            "volatility": self.volatility,
-            "profit_factor": self.profit_factor,
-            "max_consecutive_wins": self.max_consecutive_wins,
-            "max_consecutive_losses": self.max_consecutive_losses,
-        }
-
-
-def calculate_metrics(trades: List["TradeRecord"]) -> BacktestMetrics:
+        return dict(zip(_METRIC_FIELDS, _get_metric_fields(self)))
+
+
+_METRIC_FIELDS = tuple(f.name for f in fields(BacktestMetrics))
+_get_metric_fields = attrgetter(*_METRIC_FIELDS)
+
+
+def calculate_metrics(trades: Union["TradeBook", Sequence["TradeRecord"]]) -> BacktestMetrics:
     """
     Calculate backtest evaluation metrics
 
     Args:
-        trades: List of TradeRecord
+        trades: TradeBook or sequence of TradeRecord
 
     Returns:
         BacktestMetrics object
     """
-    if not trades:
+    if not len(trades):
         return BacktestMetrics()
 
-    # Extract return series
-    returns = [t.return_pct for t in trades]
+    # Imported here: runner imports this module
+    from .runner import TradeBook
 
-    # Filter non-zero returns (BUY/SELL decisions)
-    active_trades_list = [(r, t) for r, t in zip(returns, trades) if t.decision != "HOLD"]
-    active_returns = [r for r, t in active_trades_list]
+    total_trades = len(trades)
+    if isinstance(trades, TradeBook):
+        # TradeBook: the columns are already arrays
+        returns = trades.return_pct
+        active = trades.decisions != "HOLD"
+    else:
+        # Extract return series and BUY/SELL mask in a single pass over the trades
+        records = np.fromiter(
+            ((r, d != "HOLD") for r, d in map(_get_trade_fields, trades)),
+            dtype=_TRADE_DTYPE,
+            count=total_trades,
+        )
+        returns = records["return_pct"]
+        active = records["active"]
+    active_returns = returns[active]
 
     # Basic statistics
-    total_trades = len(trades)
-    active_trades = len(active_returns)
+    active_trades = int(active_returns.size)
 
     if active_trades == 0:
         return BacktestMetrics(total_trades=total_trades)
 
     # Win rate
-    winning_trades = sum(1 for r in active_returns if r > 0)
-    losing_trades = sum(1 for r in active_returns if r < 0)
-    win_rate = (winning_trades / active_trades * 100) if active_trades > 0 else 0
+    winners = active_returns > 0
+    losers = active_returns < 0
+    winning_trades = int(winners.sum())
+    losing_trades = int(losers.sum())
+    win_rate = winning_trades / active_trades * 100
 
     # Cumulative return (simple sum)
-    cumulative_return = sum(returns)
+    cumulative_return = float(returns.sum())
 
     # Maximum drawdown
     max_drawdown = calculate_max_drawdown(returns)
 
     # Average return
-    avg_return = np.mean(active_returns) if active_returns else 0
+    active_sum = float(active_returns.sum())
+    avg_return = active_sum / active_trades
 
     # Volatility
-    volatility = np.std(active_returns) if len(active_returns) > 1 else 0
+    volatility = float(active_returns.std()) if active_trades > 1 else 0.0
 
     # Sharpe ratio (assuming risk-free rate = 0, annualization factor ~sqrt(252))
     if volatility > 0:
-        sharpe_ratio = (avg_return / volatility) * np.sqrt(252)
+        sharpe_ratio = (avg_return / volatility) * sqrt(252)
     else:
         sharpe_ratio = 0
 
-    # Profit factor
-    total_profit = sum(r for r in active_returns if r > 0)
-    total_loss = abs(sum(r for r in active_returns if r < 0))
+    # Profit factor (active_sum = total_profit - total_loss, so only the losses need a pass)
+    total_loss = float(-active_returns[losers].sum()) if losing_trades else 0.0
+    total_profit = active_sum + total_loss if winning_trades else 0.0
     profit_factor = (total_profit / total_loss) if total_loss > 0 else float('inf') if total_profit > 0 else 0
 
     # Streak statistics
@@ -157,7 +176,7 @@ def calculate_metrics(trades: List["TradeRecord"]) -> BacktestMetrics:
     )
 
 
-def calculate_max_drawdown(returns: List[float]) -> float:
+def calculate_max_drawdown(returns: Sequence[float]) -> float:
     """
     Calculate maximum drawdown
 
@@ -167,29 +186,25 @@ def calculate_max_drawdown(returns: List[float]) -> float:
     Returns:
         Maximum drawdown percentage
     """
-    if not returns:
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size == 0:
         return 0.0
 
-    # Calculate cumulative NAV curve
-    cumulative = [100.0]  # Initial NAV 100
-    for r in returns:
-        cumulative.append(cumulative[-1] * (1 + r / 100))
+    if NUMBA_AVAILABLE and returns.size >= NUMBA_MIN_RETURNS:
+        return float(_max_drawdown_kernel(returns))
 
-    # Calculate historical peak
-    peak = cumulative[0]
-    max_dd = 0.0
-
-    for value in cumulative:
-        if value > peak:
-            peak = value
-        if peak > 0:
-            drawdown = (peak - value) / peak * 100
-            max_dd = max(max_dd, drawdown)
+    # Calculate cumulative NAV curve, starting from an initial NAV of 100
+    nav = np.empty(returns.size + 1)
+    nav[0] = 100.0
+    np.cumprod(1.0 + returns * 0.01, out=nav[1:])
+    nav[1:] *= 100.0
 
-    return max_dd
+    # Drawdown from the running historical peak (never below the initial 100)
+    peak = np.maximum.accumulate(nav)
+    return float(((peak - nav) / peak).max() * 100)
 
 
-def calculate_consecutive_stats(returns: List[float]) -> tuple:
+def calculate_consecutive_stats(returns: Sequence[float]) -> tuple:
     """
     Calculate consecutive win/loss statistics
 
@@ -199,27 +214,63 @@ def calculate_consecutive_stats(returns: List[float]) -> tuple:
     Returns:
         (max_consecutive_wins, max_consecutive_losses)
     """
-    if not returns:
+    returns = np.asarray(returns, dtype=np.float64)
+
+    if NUMBA_AVAILABLE and returns.size >= NUMBA_MIN_RETURNS:
+        max_wins, max_losses = _consecutive_stats_kernel(returns)
+        return int(max_wins), int(max_losses)
+
+    # A zero return doesn't change the streak count, so drop it before run-length encoding
+    signs = np.sign(returns[returns != 0]).astype(np.int8)
+    if signs.size == 0:
         return 0, 0
 
+    # Run boundaries and lengths of equal-sign stretches
+    starts = np.flatnonzero(np.concatenate(([True], signs[1:] != signs[:-1])))
+    lengths = np.diff(np.append(starts, signs.size))
+    run_signs = signs[starts]
+
+    max_wins = int(lengths[run_signs == 1].max(initial=0))
+    max_losses = int(lengths[run_signs == -1].max(initial=0))
+    return max_wins, max_losses
+
+
+@njit(cache=True)
+def _max_drawdown_kernel(returns):
+    """Single-pass max drawdown (%) of a NAV curve starting at 100"""
+    growth = 1.0
+    peak = 100.0
+    max_dd = 0.0
+    for i in range(returns.shape[0]):
+        growth *= 1.0 + returns[i] * 0.01
+        nav = growth * 100.0
+        if nav > peak:
+            peak = nav
+        dd = (peak - nav) / peak
+        if dd > max_dd:
+            max_dd = dd
+    return max_dd * 100
+
+
+@njit(cache=True)
+def _consecutive_stats_kernel(returns):
+    """Single-pass max win/loss streaks; zero returns leave the streak unchanged"""
     max_wins = 0
     max_losses = 0
     current_wins = 0
     current_losses = 0
-
-    for r in returns:
+    for i in range(returns.shape[0]):
+        r = returns[i]
         if r > 0:
             current_wins += 1
             current_losses = 0
-            max_wins = max(max_wins, current_wins)
+            if current_wins > max_wins:
+                max_wins = current_wins
         elif r < 0:
             current_losses += 1
             current_wins = 0
-            max_losses = max(max_losses, current_losses)
-        else:
-            # r == 0, don't change streak count
-            pass
-
+            if current_losses > max_losses:
+                max_losses = current_losses
     return max_wins, max_losses
 
 
@@ -237,17 +288,21 @@ def calculate_sortino_ratio(returns: List[float], target_return: float = 0) -> f
     if not returns:
         return 0.0
 
+    # Small Python lists: math.fsum/sqrt avoid the NumPy array round-trip
     excess_returns = [r - target_return for r in returns]
+    mean_excess = fsum(excess_returns) / len(excess_returns)
     downside_returns = [r for r in excess_returns if r < 0]
 
     if not downside_returns:
-        return float('inf') if np.mean(excess_returns) > 0 else 0
+        return float('inf') if mean_excess > 0 else 0
 
-    downside_std = np.std(downside_returns)
+    downside_mean = fsum(downside_returns) / len(downside_returns)
+    downside_var = fsum((r - downside_mean) ** 2 for r in downside_returns) / len(downside_returns)
+    downside_std = sqrt(downside_var)
     if downside_std == 0:
         return 0
 
-    return (np.mean(excess_returns) / downside_std) * np.sqrt(252)
+    return (mean_excess / downside_std) * sqrt(252)
 
 
 def calculate_calmar_ratio(cumulative_return: float, max_drawdown: float) -> float:
@@ -6,8 +6,13 @@ Supports trading calendar functions for A-share, US, and HK markets.
 - US/HK: Uses exchange_calendars or pandas_market_calendars
 """
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from functools import lru_cache
+import os
+import time
+from types import MappingProxyType
+from typing import Any, FrozenSet, List, Mapping, Optional, Tuple
 import pandas as pd
 
 # A-share data source
@@ -16,84 +21,176 @@ try:
 except ImportError:
     ak = None
 
-# International market data source
+# International market data sources (either one is enough)
 try:
     import exchange_calendars as xcals
-    XCALS_AVAILABLE = True
 except ImportError:
-    try:
-        import pandas_market_calendars as mcal
-        XCALS_AVAILABLE = False
-        MCAL_AVAILABLE = True
-    except ImportError:
-        XCALS_AVAILABLE = False
-        MCAL_AVAILABLE = False
+    xcals = None
+
+try:
+    import pandas_market_calendars as mcal
+except ImportError:
+    mcal = None
 
+XCALS_AVAILABLE = xcals is not None
+MCAL_AVAILABLE = mcal is not None
 
-# Market code mapping
-MARKET_CALENDAR_CODES = {
+
+# Market code mapping (read-only)
+MARKET_CALENDAR_CODES: Mapping[str, str] = MappingProxyType({
     "A-share": "XSHG",  # Shanghai Stock Exchange (exchange_calendars)
     "US": "XNYS",       # New York Stock Exchange
     "HK": "XHKG",       # Hong Kong Stock Exchange
-}
+})
 
-# pandas_market_calendars codes
-MCAL_CODES = {
+# pandas_market_calendars codes (read-only)
+MCAL_CODES: Mapping[str, str] = MappingProxyType({
     "A-share": "SSE",   # Shanghai Stock Exchange
     "US": "NYSE",       # New York Stock Exchange
     "HK": "HKEX",       # Hong Kong Exchange
-}
+})
+
 
+# Empty calendar, returned when no calendar can be fetched
+_NO_TRADING_DAYS: Tuple[str, ...] = ()
 
-# Cache
-_calendar_cache: Dict[str, pd.DataFrame] = {}
+# On-disk cache shared across processes (AKShare calendar and CSI constituents)
+CACHE_DIR = os.getenv(
+    "TRADINGCREW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".tradingcrew")
+)
+CALENDAR_CACHE_TTL = 24 * 3600       # seconds
+CONSTITUENT_CACHE_TTL = 7 * 24 * 3600  # seconds
 
 
-def get_trading_calendar(market: str = "A-share") -> pd.DataFrame:
+def _read_disk_cache(name: str, ttl: float) -> Optional[Tuple[str, ...]]:
     """
-    Get trading calendar for the specified market
+    Read a cached list of codes/dates (one per line)
 
     Args:
-        market: Market type ("A-share", "US", "HK")
+        name: File name inside CACHE_DIR
+        ttl: Maximum file age in seconds
 
     Returns:
-        DataFrame containing trading dates
+        Tuple of values, or None if the file is missing, stale or empty
+    """
+    path = os.path.join(CACHE_DIR, name)
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, encoding="utf-8") as f:
+            values = tuple(f.read().split())
+    except OSError:
+        return None
+
+    return values or None
+
+
+def _write_disk_cache(name: str, values: Tuple[str, ...]) -> None:
+    """Write values (one per line) to CACHE_DIR; failures only disable the cache"""
+    path = os.path.join(CACHE_DIR, name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(values))
+        # Atomic swap so concurrent processes never read a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Cannot write cache file {path}: {e}")
+
+
+def _as_trading_days(dates) -> Tuple[str, ...]:
     """
-    global _calendar_cache
+    Normalize dates to sorted, de-duplicated yyyy-mm-dd strings
+
+    ISO dates sort lexicographically in date order, so lookups can bisect
+    the strings directly without parsing the query date.
+    """
+    return tuple(sorted(set(pd.DatetimeIndex(dates).strftime("%Y-%m-%d"))))
 
-    cache_key = market
-    if cache_key in _calendar_cache:
-        return _calendar_cache[cache_key]
 
+@lru_cache(maxsize=8)
+def _load_trading_calendar(market: str) -> Tuple[str, ...]:
+    """Fetch a market calendar; raises LookupError so failures are not cached"""
     if market == "A-share":
         # A-share uses akshare
-        df = _get_ashare_calendar()
+        dates = _get_ashare_calendar()
     else:
         # US/HK uses international calendar library
-        df = _get_international_calendar(market)
+        dates = _get_international_calendar(market)
+
+    if not dates:
+        raise LookupError(f"No trading calendar available for {market}")
+
+    return dates
+
+
+@lru_cache(maxsize=8)
+def _trading_day_set(market: str) -> FrozenSet[str]:
+    """Hashed view of a market calendar for O(1) membership tests"""
+    return frozenset(_load_trading_calendar(market))
+
+
+def get_trading_calendar(market: str = "A-share") -> Tuple[str, ...]:
+    """
+    Get trading calendar for the specified market
+
+    Args:
+        market: Market type ("A-share", "US", "HK")
+
+    Returns:
+        Sorted tuple of trading days (yyyy-mm-dd), empty if the calendar could not be fetched
+    """
+    try:
+        return _load_trading_calendar(market)
+    except LookupError:
+        return _NO_TRADING_DAYS
 
-    if not df.empty:
-        _calendar_cache[cache_key] = df
 
-    return df
+def clear_calendar_cache() -> None:
+    """Drop in-process calendar caches (the on-disk cache in CACHE_DIR expires by TTL)"""
+    _load_trading_calendar.cache_clear()
+    _trading_day_set.cache_clear()
+    _trading_days_in_range.cache_clear()
+    _next_trading_day.cache_clear()
+    _get_exchange_calendar.cache_clear()
+    _get_mcal_calendar.cache_clear()
 
 
-def _get_ashare_calendar() -> pd.DataFrame:
+def _get_ashare_calendar() -> Tuple[str, ...]:
     """Get A-share trading calendar"""
+    cached = _read_disk_cache("ashare_calendar.txt", CALENDAR_CACHE_TTL)
+    if cached is not None:
+        return cached
+
     if ak is None:
         print("Warning: akshare not installed, using fallback calendar for A-share")
-        return pd.DataFrame()
+        return _NO_TRADING_DAYS
 
     try:
         df = ak.tool_trade_date_hist_sina()
-        df["trade_date"] = pd.to_datetime(df["trade_date"])
-        return df
+        dates = _as_trading_days(df["trade_date"])
+        if dates:
+            _write_disk_cache("ashare_calendar.txt", dates)
+        return dates
     except Exception as e:
         print(f"Failed to fetch A-share trading calendar: {e}")
-        return pd.DataFrame()
+        return _NO_TRADING_DAYS
+
+
+@lru_cache(maxsize=None)
+def _get_exchange_calendar(cal_code: str) -> Any:
+    """Build an exchange_calendars calendar once per exchange code"""
+    return xcals.get_calendar(cal_code)
 
 
-def _get_international_calendar(market: str) -> pd.DataFrame:
+@lru_cache(maxsize=None)
+def _get_mcal_calendar(cal_code: str) -> Any:
+    """Build a pandas_market_calendars calendar once per exchange code"""
+    return mcal.get_calendar(cal_code)
+
+
+def _get_international_calendar(market: str) -> Tuple[str, ...]:
     """Get international market trading calendar"""
     # Get 5-year range calendar
     start_year = datetime.now().year - 3
@@ -102,31 +199,29 @@ def _get_international_calendar(market: str) -> pd.DataFrame:
     if XCALS_AVAILABLE:
         try:
             cal_code = MARKET_CALENDAR_CODES.get(market, "XNYS")
-            cal = xcals.get_calendar(cal_code)
+            cal = _get_exchange_calendar(cal_code)
             sessions = cal.sessions_in_range(
                 f"{start_year}-01-01",
                 f"{end_year}-12-31"
             )
-            df = pd.DataFrame({"trade_date": sessions})
-            return df
+            return _as_trading_days(sessions)
         except Exception as e:
             print(f"exchange_calendars failed to fetch {market} calendar: {e}")
 
     if MCAL_AVAILABLE:
         try:
             cal_code = MCAL_CODES.get(market, "NYSE")
-            cal = mcal.get_calendar(cal_code)
+            cal = _get_mcal_calendar(cal_code)
             schedule = cal.schedule(
                 start_date=f"{start_year}-01-01",
                 end_date=f"{end_year}-12-31"
             )
-            df = pd.DataFrame({"trade_date": schedule.index})
-            return df
+            return _as_trading_days(schedule.index)
         except Exception as e:
             print(f"pandas_market_calendars failed to fetch {market} calendar: {e}")
 
     print(f"Warning: Unable to fetch {market} trading calendar, using fallback")
-    return pd.DataFrame()
+    return _NO_TRADING_DAYS
 
 
 def is_trading_day(date: str, market: str = "A-share") -> bool:
@@ -140,15 +235,13 @@ def is_trading_day(date: str, market: str = "A-share") -> bool:
     Returns:
         Whether it is a trading day
     """
-    calendar = get_trading_calendar(market)
-    if calendar.empty:
+    try:
+        return date in _trading_day_set(market)
+    except LookupError:
         # Fallback: exclude weekends when calendar is unavailable
         date_dt = datetime.strptime(date, "%Y-%m-%d")
         return date_dt.weekday() < 5
 
-    date_dt = pd.to_datetime(date)
-    return date_dt in calendar["trade_date"].values
-
 
 def get_trading_days_in_range(
     start_date: str,
@@ -166,17 +259,20 @@ def get_trading_days_in_range(
     Returns:
         List of trading days (yyyy-mm-dd format)
     """
-    calendar = get_trading_calendar(market)
-    if calendar.empty:
+    try:
+        days = _trading_days_in_range(start_date, end_date, market)
+    except LookupError:
         return _fallback_trading_days(start_date, end_date)
 
-    start_dt = pd.to_datetime(start_date)
-    end_dt = pd.to_datetime(end_date)
+    # Callers own (and may mutate) the returned list; the cached tuple stays intact
+    return list(days)
 
-    mask = (calendar["trade_date"] >= start_dt) & (calendar["trade_date"] <= end_dt)
-    trading_days = calendar[mask]["trade_date"].tolist()
 
-    return [d.strftime("%Y-%m-%d") for d in trading_days]
+@lru_cache(maxsize=4096)
+def _trading_days_in_range(start_date: str, end_date: str, market: str) -> Tuple[str, ...]:
+    """Calendar slice for a date range; raises LookupError (uncached) without a calendar"""
+    calendar = _load_trading_calendar(market)
+    return calendar[bisect_left(calendar, start_date):bisect_right(calendar, end_date)]
 
 
 def _fallback_trading_days(start_date: str, end_date: str) -> List[str]:
@@ -204,23 +300,22 @@ def get_next_trading_day(date: str, market: str = "A-share") -> str:
     Returns:
         Next trading day yyyy-mm-dd
     """
-    calendar = get_trading_calendar(market)
-    date_dt = pd.to_datetime(date)
+    try:
+        return _next_trading_day(date, market)
+    except LookupError:
+        # No calendar, or beyond its range: skip weekends
+        return _weekday_fallback(date, 1)
 
-    if calendar.empty:
-        next_day = date_dt + timedelta(days=1)
-        while next_day.weekday() >= 5:
-            next_day += timedelta(days=1)
-        return next_day.strftime("%Y-%m-%d")
 
-    future_days = calendar[calendar["trade_date"] > date_dt]
-    if future_days.empty:
-        next_day = date_dt + timedelta(days=1)
-        while next_day.weekday() >= 5:
-            next_day += timedelta(days=1)
-        return next_day.strftime("%Y-%m-%d")
+@lru_cache(maxsize=4096)
+def _next_trading_day(date: str, market: str) -> str:
+    """First calendar day after date; raises LookupError (uncached) past the calendar's end"""
+    calendar = _load_trading_calendar(market)
+    idx = bisect_right(calendar, date)
+    if idx == len(calendar):
+        raise LookupError(f"{date} is beyond the {market} trading calendar")
 
-    return future_days.iloc[0]["trade_date"].strftime("%Y-%m-%d")
+    return calendar[idx]
 
 
 def get_previous_trading_day(date: str, market: str = "A-share") -> str:
@@ -235,22 +330,20 @@ def get_previous_trading_day(date: str, market: str = "A-share") -> str:
         Previous trading day yyyy-mm-dd
     """
     calendar = get_trading_calendar(market)
-    date_dt = pd.to_datetime(date)
+    idx = bisect_left(calendar, date)
+    if idx == 0:
+        # No calendar, or before its range: skip weekends
+        return _weekday_fallback(date, -1)
 
-    if calendar.empty:
-        prev_day = date_dt - timedelta(days=1)
-        while prev_day.weekday() >= 5:
-            prev_day -= timedelta(days=1)
-        return prev_day.strftime("%Y-%m-%d")
+    return calendar[idx - 1]
 
-    past_days = calendar[calendar["trade_date"] < date_dt]
-    if past_days.empty:
-        prev_day = date_dt - timedelta(days=1)
-        while prev_day.weekday() >= 5:
-            prev_day -= timedelta(days=1)
-        return prev_day.strftime("%Y-%m-%d")
 
-    return past_days.iloc[-1]["trade_date"].strftime("%Y-%m-%d")
+def _weekday_fallback(date: str, step: int) -> str:
+    """Fallback: step one day at a time (+1 forward, -1 backward), skipping weekends"""
+    day = pd.to_datetime(date) + timedelta(days=step)
+    while day.weekday() >= 5:
+        day += timedelta(days=step)
+    return day.strftime("%Y-%m-%d")
 
 
 def get_trading_days_count(
@@ -276,6 +369,54 @@ def get_trading_days_count(
 # Index constituent functions (by market)
 # ============================================================
 
+# Built-in constituent lists (immutable, shared across calls)
+_HS300_SAMPLE = (
+    "600519", "000858", "600036", "601318", "000001",
+    "600276", "000333", "002415", "600900", "601166",
+)
+
+_SP500_CONSTITUENTS = (
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA",
+    "META", "TSLA", "BRK-B", "UNH", "JNJ",
+    "JPM", "V", "XOM", "PG", "MA",
+    "HD", "CVX", "MRK", "LLY", "ABBV",
+)
+
+_NASDAQ100_CONSTITUENTS = (
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA",
+    "META", "TSLA", "AVGO", "COST", "ADBE",
+    "PEP", "CSCO", "NFLX", "AMD", "INTC",
+    "CMCSA", "TMUS", "TXN", "QCOM", "AMGN",
+)
+
+_DJIA_CONSTITUENTS = (
+    "AAPL", "MSFT", "JPM", "V", "UNH",
+    "HD", "JNJ", "WMT", "PG", "CVX",
+    "MRK", "DIS", "KO", "CSCO", "VZ",
+    "IBM", "AXP", "CAT", "GS", "MMM",
+    "NKE", "MCD", "BA", "HON", "TRV",
+    "DOW", "AMGN", "WBA", "CRM", "INTC",
+)
+
+_HSI_CONSTITUENTS = (
+    "0700.HK",  # Tencent
+    "9988.HK",  # Alibaba
+    "0005.HK",  # HSBC
+    "0941.HK",  # China Mobile
+    "1299.HK",  # AIA Group
+    "0388.HK",  # HKEX
+    "0883.HK",  # CNOOC
+    "0939.HK",  # CCB
+    "1398.HK",  # ICBC
+    "2318.HK",  # Ping An
+    "0027.HK",  # Galaxy Entertainment
+    "0011.HK",  # Hang Seng Bank
+    "0016.HK",  # Sun Hung Kai Properties
+    "0001.HK",  # CK Hutchison
+    "0002.HK",  # CLP Holdings
+)
+
+
 def get_index_constituents(market: str = "A-share", index_name: str = None) -> List[str]:
     """
     Get index constituent list
@@ -292,111 +433,114 @@ def get_index_constituents(market: str = "A-share", index_name: str = None) -> L
     """
     if market == "A-share":
         if index_name == "zz500":
-            return _get_zz500_constituents()
-        return _get_hs300_constituents()  # Default CSI 300
+            codes = _get_zz500_constituents()
+        else:
+            codes = _get_hs300_constituents()  # Default CSI 300
     elif market == "US":
         if index_name == "nasdaq100":
-            return _get_nasdaq100_constituents()
-        if index_name == "djia":
-            return _get_djia_constituents()
-        return _get_sp500_constituents()  # Default S&P 500
+            codes = _get_nasdaq100_constituents()
+        elif index_name == "djia":
+            codes = _get_djia_constituents()
+        else:
+            codes = _get_sp500_constituents()  # Default S&P 500
     elif market == "HK":
-        return _get_hsi_constituents()
+        codes = _get_hsi_constituents()
     else:
-        return []
+        codes = ()
+
+    # Hand callers their own list; the shared tuples stay untouched
+    return list(codes)
+
+
+# Constituent code column names seen in AKShare responses, in order of preference
+_CODE_COL_CANDIDATES = ("\u6210\u5206\u5238\u4ee3\u7801", "\u8bc1\u5238\u4ee3\u7801", "\u4ee3\u7801", "code")
+
+
+def _pick_code_col(df: pd.DataFrame) -> Optional[str]:
+    """Return the constituent code column of an AKShare DataFrame, or None"""
+    columns = set(df.columns)
+    return next((col for col in _CODE_COL_CANDIDATES if col in columns), None)
+
+
+@lru_cache(maxsize=16)
+def _fetch_csindex_cons(symbol: str) -> Optional[Tuple[str, ...]]:
+    """
+    Fetch CSI index constituents via AKShare (cached per session and on disk)
+
+    Args:
+        symbol: CSI index code (e.g. "000300")
+
+    Returns:
+        Tuple of stock codes, or None if the code column cannot be identified.
+        Fetch errors propagate and are not cached.
+    """
+    cache_name = f"csindex_{symbol}.txt"
+    cached = _read_disk_cache(cache_name, CONSTITUENT_CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    df = ak.index_stock_cons_csindex(symbol=symbol)
+    code_col = _pick_code_col(df)
+    if code_col is not None:
+        codes = tuple(df[code_col].astype(str).tolist())
+        if codes:
+            _write_disk_cache(cache_name, codes)
+        return codes
+
+    print(f"Warning: Cannot identify constituent code column, columns: {df.columns.tolist()}")
+    return None
+
+
+def clear_constituent_cache() -> None:
+    """Drop cached index constituents so the next call re-fetches them"""
+    _fetch_csindex_cons.cache_clear()
 
 
-def _get_hs300_constituents() -> List[str]:
+def _get_hs300_constituents() -> Tuple[str, ...]:
     """Get CSI 300 constituents"""
     if ak is None:
-        return [
-            "600519", "000858", "600036", "601318", "000001",
-            "600276", "000333", "002415", "600900", "601166",
-        ]
+        return _HS300_SAMPLE
 
     try:
-        df = ak.index_stock_cons_csindex(symbol="000300")
-        code_col = None
-        for col in ["\u6210\u5206\u5238\u4ee3\u7801", "\u8bc1\u5238\u4ee3\u7801", "\u4ee3\u7801", "code"]:
-            if col in df.columns:
-                code_col = col
-                break
-        if code_col:
-            return df[code_col].tolist()
+        codes = _fetch_csindex_cons("000300")
+        if codes is not None:
+            return codes
     except Exception as e:
         print(f"Failed to fetch CSI 300 constituents: {e}")
 
-    return ["600519", "000858", "600036", "601318", "000001"]
+    return _HS300_SAMPLE[:5]
 
 
-def _get_zz500_constituents() -> List[str]:
+def _get_zz500_constituents() -> Tuple[str, ...]:
     """Get CSI 500 constituents"""
     if ak is None:
-        return []
+        return ()
 
     try:
-        df = ak.index_stock_cons_csindex(symbol="000905")
-        code_col = None
-        for col in ["\u6210\u5206\u5238\u4ee3\u7801", "\u8bc1\u5238\u4ee3\u7801", "\u4ee3\u7801", "code"]:
-            if col in df.columns:
-                code_col = col
-                break
-        if code_col:
-            return df[code_col].tolist()
+        codes = _fetch_csindex_cons("000905")
+        if codes is not None:
+            return codes
     except Exception as e:
         print(f"Failed to fetch CSI 500 constituents: {e}")
 
-    return []
+    return ()
 
 
-def _get_sp500_constituents() -> List[str]:
+def _get_sp500_constituents() -> Tuple[str, ...]:
     """Get S&P 500 constituents"""
-    return [
-        "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA",
-        "META", "TSLA", "BRK-B", "UNH", "JNJ",
-        "JPM", "V", "XOM", "PG", "MA",
-        "HD", "CVX", "MRK", "LLY", "ABBV",
-    ]
+    return _SP500_CONSTITUENTS
 
 
-def _get_nasdaq100_constituents() -> List[str]:
+def _get_nasdaq100_constituents() -> Tuple[str, ...]:
     """Get NASDAQ 100 constituents"""
-    return [
-        "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA",
-        "META", "TSLA", "AVGO", "COST", "ADBE",
-        "PEP", "CSCO", "NFLX", "AMD", "INTC",
-        "CMCSA", "TMUS", "TXN", "QCOM", "AMGN",
-    ]
+    return _NASDAQ100_CONSTITUENTS
 
 
-def _get_djia_constituents() -> List[str]:
+def _get_djia_constituents() -> Tuple[str, ...]:
     """Get Dow Jones Industrial Average constituents"""
-    return [
-        "AAPL", "MSFT", "JPM", "V", "UNH",
-        "HD", "JNJ", "WMT", "PG", "CVX",
-        "MRK", "DIS", "KO", "CSCO", "VZ",
-        "IBM", "AXP", "CAT", "GS", "MMM",
-        "NKE", "MCD", "BA", "HON", "TRV",
-        "DOW", "AMGN", "WBA", "CRM", "INTC",
-    ]
+    return _DJIA_CONSTITUENTS
 
 
-def _get_hsi_constituents() -> List[str]:
+def _get_hsi_constituents() -> Tuple[str, ...]:
     """Get Hang Seng Index constituents"""
-    return [
-        "0700.HK",  # Tencent
-        "9988.HK",  # Alibaba
-        "0005.HK",  # HSBC
-        "0941.HK",  # China Mobile
-        "1299.HK",  # AIA Group
-        "0388.HK",  # HKEX
-        "0883.HK",  # CNOOC
-        "0939.HK",  # CCB
-        "1398.HK",  # ICBC
-        "2318.HK",  # Ping An
-        "0027.HK",  # Galaxy Entertainment
-        "0011.HK",  # Hang Seng Bank
-        "0016.HK",  # Sun Hung Kai Properties
-        "0001.HK",  # CK Hutchison
-        "0002.HK",  # CLP Holdings
-    ]
+    return _HSI_CONSTITUENTS
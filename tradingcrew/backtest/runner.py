@@ -6,12 +6,17 @@ Supports A-share, US, and HK stock backtesting.
 """
 
 from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 import time
 import json
+import math
 import os
+import pickle
+import threading
 
 # A-share data source
 try:
@@ -25,11 +30,37 @@ try:
 except ImportError:
     yf = None
 
+# Fast JSON encoder (stdlib json is used when unavailable)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..agents.utils.debate_history import latest_statement
 from .multi_market_calendar import get_trading_days_in_range, get_next_trading_day
 from .metrics import calculate_metrics, BacktestMetrics
 
 
-@dataclass
+# Return direction per decision: BUY profits when the price rises, SELL (short) when it falls
+_DECISION_SIGN = {"BUY": 1.0, "SELL": -1.0}
+_DECISIONS = frozenset(("BUY", "SELL", "HOLD"))
+
+# JSON stand-ins for infinite floats (e.g. profit_factor with no losing trade);
+# NaN is written as null. orjson and json would otherwise disagree (null vs Infinity)
+_JSON_INF = "Infinity"
+_JSON_NEG_INF = "-Infinity"
+
+# Symbols per batched yfinance download
+YF_BATCH_SIZE = 20
+
+# Concurrent AKShare requests when prefetching A-share prices
+PREFETCH_MAX_WORKERS = 8
+
+# Trading days that may start back-to-back before api_call_delay pacing applies
+RATE_LIMIT_BURST = 4
+
+
+@dataclass(slots=True)
 class TradeRecord:
     """Single trade record"""
     date: str
@@ -52,20 +83,200 @@ class TradeRecord:
         }
 
 
+@dataclass(slots=True)
+class PriceCache:
+    """Price data prepared once at cache insertion for array lookups"""
+    df: pd.DataFrame          # Sorted, de-duplicated, tz-naive index
+    index_arr: np.ndarray     # df.index as datetime64
+    close_arr: np.ndarray     # df["Close"] as float64
+
+    @classmethod
+    def prepare(cls, df: pd.DataFrame) -> "PriceCache":
+        """
+        Normalize a raw price frame and extract its lookup arrays
+
+        Args:
+            df: Price data indexed by date, with a "Close" column
+
+        Returns:
+            PriceCache object
+        """
+        if df.empty:
+            return cls(df, np.empty(0, dtype="datetime64[ns]"), np.empty(0, dtype=np.float64))
+
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+        return cls(df, df.index.to_numpy(), df["Close"].to_numpy(dtype=np.float64))
+
+    @property
+    def empty(self) -> bool:
+        return self.close_arr.size == 0
+
+
+def _json_safe(value: Any) -> Any:
+    """value with non-finite floats replaced by None or the infinity sentinels"""
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        if value != value:
+            return None
+        return _JSON_INF if value > 0 else _JSON_NEG_INF
+    return value
+
+
+@dataclass(slots=True, eq=False)
+class TradeBook:
+    """
+    Columnar trade store: one array per TradeRecord field
+
+    Indexing and iteration materialize TradeRecord objects on demand and
+    slicing returns a TradeBook, so the book can stand in for a
+    List[TradeRecord].
+    """
+    symbol: str
+    dates: np.ndarray
+    decisions: np.ndarray
+    price_at_decision: np.ndarray
+    price_next_day: np.ndarray
+    return_pct: np.ndarray
+    full_states: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(
+        cls,
+        symbol: str,
+        rows: List[tuple],
+        full_states: Optional[List[Dict[str, Any]]] = None,
+    ) -> "TradeBook":
+        """
+        Build from (date, decision, price_at_decision, price_next_day, return_pct) rows
+
+        Args:
+            symbol: Stock code
+            rows: Trade rows in date order
+            full_states: Per-trade graph states (optional)
+
+        Returns:
+            TradeBook object
+        """
+        dates, decisions, prices_at, prices_next, returns = zip(*rows) if rows else ((),) * 5
+        return cls(
+            symbol=symbol,
+            dates=np.array(dates, dtype=object),
+            decisions=np.array(decisions, dtype=object),
+            price_at_decision=np.array(prices_at, dtype=np.float64),
+            price_next_day=np.array(prices_next, dtype=np.float64),
+            return_pct=np.array(returns, dtype=np.float64),
+            full_states=list(full_states) if full_states else [{} for _ in rows],
+        )
+
+    @classmethod
+    def from_records(cls, symbol: str, records: List[TradeRecord]) -> "TradeBook":
+        """Build from a list of TradeRecord"""
+        rows = [
+            (t.date, t.decision, t.price_at_decision, t.price_next_day, t.return_pct)
+            for t in records
+        ]
+        return cls.from_rows(symbol, rows, [t.full_state for t in records])
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return TradeBook(
+                symbol=self.symbol,
+                dates=self.dates[idx],
+                decisions=self.decisions[idx],
+                price_at_decision=self.price_at_decision[idx],
+                price_next_day=self.price_next_day[idx],
+                return_pct=self.return_pct[idx],
+                full_states=self.full_states[idx],
+            )
+        return TradeRecord(
+            date=self.dates[idx],
+            symbol=self.symbol,
+            decision=self.decisions[idx],
+            price_at_decision=float(self.price_at_decision[idx]),
+            price_next_day=float(self.price_next_day[idx]),
+            return_pct=float(self.return_pct[idx]),
+            full_state=self.full_states[idx],
+        )
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TradeBook, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def append(self, record: TradeRecord):
+        """Append one TradeRecord (copies the column arrays)"""
+        self.extend([record])
+
+    def extend(self, records):
+        """
+        Append TradeRecord objects in order
+
+        Args:
+            records: Iterable of TradeRecord for this book's symbol
+        """
+        if isinstance(records, TradeBook):
+            other = records
+            symbols = {other.symbol} if len(other) else set()
+        else:
+            records = list(records)
+            other = TradeBook.from_records(self.symbol, records)
+            symbols = {t.symbol for t in records}
+        if symbols - {self.symbol}:
+            raise ValueError(f"Trade symbol {symbols - {self.symbol}} does not match book symbol {self.symbol}")
+        if len(other) == 0:
+            return
+        self.dates = np.concatenate([self.dates, other.dates])
+        self.decisions = np.concatenate([self.decisions, other.decisions])
+        self.price_at_decision = np.concatenate([self.price_at_decision, other.price_at_decision])
+        self.price_next_day = np.concatenate([self.price_next_day, other.price_next_day])
+        self.return_pct = np.concatenate([self.return_pct, other.return_pct])
+        self.full_states.extend(other.full_states)
+
+    def columns(self) -> Dict[str, Any]:
+        """Column arrays keyed like TradeRecord.to_dict()"""
+        return {
+            "date": self.dates,
+            "symbol": np.full(len(self), self.symbol, dtype=object),
+            "decision": self.decisions,
+            "price_at_decision": self.price_at_decision,
+            "price_next_day": self.price_next_day,
+            "return_pct": self.return_pct,
+        }
+
+
 @dataclass
 class BacktestResult:
     """Backtest result"""
     symbol: str
     start_date: str
     end_date: str
-    trades: List[TradeRecord]
+    trades: TradeBook
     metrics: BacktestMetrics
     total_trading_days: int
+    _df_cache: Optional[pd.DataFrame] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept a plain List[TradeRecord] as well
+        if not isinstance(self.trades, TradeBook):
+            self.trades = TradeBook.from_records(self.symbol, self.trades)
 
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert to DataFrame"""
-        records = [t.to_dict() for t in self.trades]
-        return pd.DataFrame(records)
+        """Convert to DataFrame (built once; rebuilt if trades were appended since)"""
+        if self._df_cache is None or len(self._df_cache) != len(self.trades):
+            self._df_cache = pd.DataFrame(self.trades.columns())
+        # Shallow copy so callers adding/dropping columns don't alter the cached frame
+        return self._df_cache.copy(deep=False)
 
     def save_to_csv(self, filepath: str):
         """Save trade records to CSV"""
@@ -74,20 +285,114 @@ class BacktestResult:
         print(f"Trade records saved to: {filepath}")
 
     def save_to_json(self, filepath: str):
-        """Save full results to JSON"""
-        result = {
+        """Save full results to JSON (infinite values as "Infinity"/"-Infinity", NaN as null)"""
+        result = _json_safe({
             "symbol": self.symbol,
             "start_date": self.start_date,
             "end_date": self.end_date,
             "total_trading_days": self.total_trading_days,
             "metrics": self.metrics.to_dict(),
-            "trades": [t.to_dict() for t in self.trades],
-        }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+            "trades": self.to_dataframe().to_dict("records"),
+        })
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(
+                    result,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
         print(f"Backtest results saved to: {filepath}")
 
 
+class StateStore:
+    """
+    Append-only pickle file for per-trade graph states
+
+    Keeps saved states out of memory during long batch backtests: each state
+    is written as it is produced and the trade keeps only a small reference.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "wb")
+        self._lock = threading.Lock()
+
+    def append(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write a state and return the reference to store in its place
+
+        Args:
+            state: Final graph state of one trading day
+
+        Returns:
+            {"_states_file": path, "_ref": offset}, or the state itself if it cannot be pickled
+        """
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Warning: State not picklable, keeping it in memory: {e}")
+            return state
+
+        # Concurrent symbols share one file; offsets must match their own records
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(data)
+        return {"_states_file": self.path, "_ref": offset}
+
+    def close(self):
+        self._file.close()
+
+
+def load_state(ref: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Load a state written by StateStore
+
+    Args:
+        ref: TradeRecord.full_state holding a StateStore reference
+
+    Returns:
+        The full graph state (ref itself if it is not a reference)
+    """
+    if "_ref" not in ref:
+        return ref
+
+    with open(ref["_states_file"], "rb") as f:
+        f.seek(ref["_ref"])
+        return pickle.load(f)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at `rate` per second up to `capacity`. acquire()
+    only sleeps for however long the next token is still outstanding, so time
+    already spent on the previous call counts toward the delay.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, blocking until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token even if it is not there yet; concurrent callers queue up behind it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
 class BacktestRunner:
     """
     Multi-market Backtest Runner
@@ -96,6 +401,18 @@ class BacktestRunner:
     Supports A-share, US, and HK markets.
     """
 
+    # Report field to agent name mapping
+    REPORT_MAPPINGS = {
+        "market_report": "Market Analyst",
+        "sentiment_report": "Social Analyst",
+        "news_report": "News Analyst",
+        "fundamentals_report": "Fundamentals Analyst",
+        "investment_plan": "Research Manager",
+        "trader_investment_plan": "Trader",
+        "final_trade_decision": "Portfolio Manager",
+    }
+    _REPORT_KEYS = frozenset(REPORT_MAPPINGS)
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -104,6 +421,7 @@ class BacktestRunner:
         api_call_delay: float = 1.0,
         debug: bool = False,
         save_states: bool = False,
+        max_workers: int = 1,
     ):
         """
         Initialize backtest runner
@@ -114,7 +432,9 @@ class BacktestRunner:
             enable_reflection: Whether to enable reflection mechanism
             api_call_delay: API call interval (seconds) to avoid rate limits
             debug: Debug mode
-            save_states: Whether to save full state to TradeRecord
+            save_states: Whether to save full state to TradeRecord (run_multiple with
+                an output_dir writes them to states.bin and keeps references)
+            max_workers: Number of symbols run_multiple backtests concurrently
         """
         self.config = config
         self.market = config.get("market", "A-share")  # Default A-share
@@ -123,12 +443,38 @@ class BacktestRunner:
         self.api_call_delay = api_call_delay
         self.debug = debug
         self.save_states = save_states
+        self.max_workers = max(1, max_workers)
 
         # Lazy-initialize TradingCrewGraph
         self._graph = None
 
         # Price data cache
-        self._price_cache: Dict[str, pd.DataFrame] = {}
+        self._price_cache: Dict[str, PriceCache] = {}
+
+        # On-disk store for saved states (set by run_multiple when output_dir is given)
+        self._state_store: Optional[StateStore] = None
+
+        # Paces trading days to at most one per api_call_delay (on average)
+        self._rate_limiter = (
+            TokenBucket(rate=1 / api_call_delay, capacity=RATE_LIMIT_BURST)
+            if api_call_delay > 0 else None
+        )
+
+    def _spawn_worker(self) -> "BacktestRunner":
+        """Create a runner with the same settings and its own graph, sharing the price cache"""
+        worker = BacktestRunner(
+            config=self.config,
+            selected_analysts=self.selected_analysts,
+            enable_reflection=self.enable_reflection,
+            api_call_delay=self.api_call_delay,
+            debug=self.debug,
+            save_states=self.save_states,
+        )
+        worker._price_cache = self._price_cache
+        # Concurrent symbols share one request budget
+        worker._rate_limiter = self._rate_limiter
+        worker._state_store = self._state_store
+        return worker
 
     def _get_graph(self):
         """Lazy-initialize graph"""
@@ -142,7 +488,7 @@ class BacktestRunner:
             )
         return self._graph
 
-    def _get_price_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    def _get_price_data(self, symbol: str, start_date: str, end_date: str) -> PriceCache:
         """
         Get price data (with caching)
 
@@ -150,7 +496,7 @@ class BacktestRunner:
         - A-share: akshare
         - US/HK: yfinance
         """
-        cache_key = f"{self.market}_{symbol}_{start_date}_{end_date}"
+        cache_key = self._price_cache_key(symbol, start_date, end_date)
 
         if cache_key not in self._price_cache:
             if self.market == "A-share":
@@ -158,10 +504,104 @@ class BacktestRunner:
             else:
                 df = self._get_yfinance_price(symbol, start_date, end_date)
 
-            self._price_cache[cache_key] = df
+            self._price_cache[cache_key] = PriceCache.prepare(df)
 
         return self._price_cache[cache_key]
 
+    def _price_cache_key(self, symbol: str, start_date: str, end_date: str) -> str:
+        """Key of a symbol's price range in the price cache"""
+        return f"{self.market}_{symbol}_{start_date}_{end_date}"
+
+    def _price_end_date(self, end_date: str) -> str:
+        """
+        End of the price range fetched for a backtest
+
+        The last decision day needs the next trading day's close, which is the
+        first trading day after end_date. One extra calendar day is added since
+        yfinance treats the end date as exclusive.
+        """
+        next_day = get_next_trading_day(end_date, market=self.market)
+        return (pd.to_datetime(next_day) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+    def _prefetch_prices(self, symbols: List[str], start_date: str, end_date: str):
+        """
+        Warm the price cache for a batch of symbols before backtesting them
+
+        Args:
+            symbols: List of stock codes
+            start_date: Backtest start date
+            end_date: Backtest end date
+        """
+        price_end = self._price_end_date(end_date)
+        missing = [
+            symbol for symbol in dict.fromkeys(symbols)
+            if self._price_cache_key(symbol, start_date, price_end) not in self._price_cache
+        ]
+        if not missing:
+            return
+
+        if self.market == "A-share":
+            # AKShare has no batch endpoint, so fetch the symbols concurrently instead
+            if ak is None:
+                return
+            with ThreadPoolExecutor(
+                max_workers=min(PREFETCH_MAX_WORKERS, len(missing)),
+                thread_name_prefix="prefetch",
+            ) as pool:
+                list(pool.map(
+                    lambda symbol: self._get_price_data(symbol, start_date, price_end),
+                    missing,
+                ))
+        else:
+            self._prefetch_yfinance(missing, start_date, price_end)
+
+    def _prefetch_yfinance(self, symbols: List[str], start_date: str, end_date: str):
+        """
+        Download US/HK price data for many symbols with batched yf.download calls
+
+        Symbols missing from a batch are left uncached and fall back to a
+        per-symbol fetch in _get_price_data.
+
+        Args:
+            symbols: List of stock codes
+            start_date: Start date
+            end_date: End date (already extended)
+        """
+        if yf is None:
+            return
+
+        for i in range(0, len(symbols), YF_BATCH_SIZE):
+            chunk = symbols[i:i + YF_BATCH_SIZE]
+            try:
+                data = yf.download(
+                    " ".join(chunk),
+                    start=start_date,
+                    end=end_date,
+                    group_by="ticker",
+                    threads=True,
+                    progress=False,
+                )
+            except Exception as e:
+                print(f"Batch price download failed for {len(chunk)} symbols: {e}")
+                continue
+
+            if data is None or data.empty:
+                continue
+
+            for symbol in chunk:
+                if isinstance(data.columns, pd.MultiIndex):
+                    if symbol not in data.columns.get_level_values(0):
+                        continue
+                    df = data[symbol]
+                else:
+                    df = data
+
+                # The batch frame spans every symbol's dates; drop the ones this symbol lacks
+                df = df.dropna(how="all")
+                if not df.empty:
+                    key = self._price_cache_key(symbol, start_date, end_date)
+                    self._price_cache[key] = PriceCache.prepare(df)
+
     def _get_ashare_price(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Get A-share price data (akshare)"""
         if ak is None:
@@ -204,24 +644,28 @@ class BacktestRunner:
             print(f"Failed to fetch {symbol} price data: {e}")
             return pd.DataFrame()
 
-    def _get_close_price(self, symbol: str, date: str, price_df: pd.DataFrame) -> float:
-        """Get closing price for the specified date"""
-        try:
-            date_dt = pd.to_datetime(date)
-            # Remove timezone info for comparison
-            if price_df.index.tz is not None:
-                date_dt = date_dt.tz_localize(price_df.index.tz)
-
-            if date_dt in price_df.index:
-                return float(price_df.loc[date_dt, "Close"])
-            # Try to find nearest trading day
-            mask = price_df.index <= date_dt
-            if mask.any():
-                return float(price_df[mask].iloc[-1]["Close"])
-        except Exception as e:
-            if self.debug:
-                print(f"Failed to get closing price for {date}: {e}")
-        return 0.0
+    def _get_close_prices(self, dates: List[str], prices: PriceCache) -> np.ndarray:
+        """
+        Get closing prices for many dates in one vectorized lookup
+
+        Each date resolves to its own close, or the nearest earlier trading day's
+        close when missing; dates before the first price row get 0.0.
+
+        Args:
+            dates: Dates yyyy-mm-dd
+            prices: Price data from _get_price_data
+
+        Returns:
+            Closing prices aligned with dates
+        """
+        if prices.empty:
+            return np.zeros(len(dates))
+
+        targets = np.array(dates, dtype="datetime64[D]").astype(prices.index_arr.dtype)
+        positions = np.searchsorted(prices.index_arr, targets, side="right") - 1
+        closes = prices.close_arr[positions]
+        closes[positions < 0] = 0.0
+        return closes
 
     def _calculate_single_return(
         self,
@@ -237,21 +681,18 @@ class BacktestRunner:
         - SELL: Profit if next day price falls (short logic)
         - HOLD: Zero return
         """
-        if price_at_decision == 0:
+        sign = _DECISION_SIGN.get(decision)
+        if sign is None or price_at_decision == 0:
             return 0.0
 
-        price_change_pct = (price_next_day - price_at_decision) / price_at_decision * 100
-
-        if decision == "BUY":
-            return price_change_pct
-        elif decision == "SELL":
-            return -price_change_pct  # Short: profit when price drops
-        else:  # HOLD
-            return 0.0
+        return sign * (price_next_day - price_at_decision) / price_at_decision * 100
 
     def _normalize_decision(self, decision: str) -> str:
         """Normalize decision string"""
         decision = decision.upper().strip()
+        # Well-formed outputs are exactly one of the decisions
+        if decision in _DECISIONS:
+            return decision
         if "BUY" in decision:
             return "BUY"
         elif "SELL" in decision:
@@ -325,24 +766,15 @@ class BacktestRunner:
         """
         updates = []
 
-        # Report field to agent name mapping
-        report_mappings = {
-            "market_report": "Market Analyst",
-            "sentiment_report": "Social Analyst",
-            "news_report": "News Analyst",
-            "fundamentals_report": "Fundamentals Analyst",
-            "investment_plan": "Research Manager",
-            "trader_investment_plan": "Trader",
-            "final_trade_decision": "Portfolio Manager",
-        }
-
-        # Check report fields
-        for field, agent_name in report_mappings.items():
-            if field in chunk and chunk[field] and field not in processed:
-                content = chunk[field]
-                if content.strip():
-                    updates.append((agent_name, content))
-                    processed.add(field)
+        # Check only the report fields present in this chunk and not yet sent
+        pending = (self._REPORT_KEYS & chunk.keys()) - processed
+        if pending:
+            for field, agent_name in self.REPORT_MAPPINGS.items():
+                if field in pending:
+                    content = chunk[field]
+                    if content and content.strip():
+                        updates.append((agent_name, content))
+                        processed.add(field)
 
         # Check investment debate state
         if "investment_debate_state" in chunk:
@@ -410,20 +842,7 @@ class BacktestRunner:
         Returns:
             Latest statement content
         """
-        if not history:
-            return ""
-
-        # Split by speaker
-        statements = history.split(f"{speaker_prefix}")
-        if len(statements) > 1:
-            # Get the last statement
-            last = statements[-1]
-            # Clean prefix
-            if last.startswith(" Analyst:") or last.startswith(" Researcher:"):
-                last = last.split(":", 1)[-1].strip()
-            return last.strip()
-
-        return ""
+        return latest_statement(history, speaker_prefix)
 
     def run(
         self,
@@ -470,15 +889,10 @@ class BacktestRunner:
                 total_trading_days=0,
             )
 
-        # Preload price data (extend date range to get next day price)
-        extended_end = pd.to_datetime(end_date) + pd.Timedelta(days=30)
-        price_df = self._get_price_data(
-            symbol,
-            start_date,
-            extended_end.strftime("%Y-%m-%d")
-        )
+        # Preload price data (through the trading day after end_date for next-day prices)
+        prices = self._get_price_data(symbol, start_date, self._price_end_date(end_date))
 
-        if price_df.empty:
+        if prices.empty:
             print(f"Warning: Unable to fetch price data for {symbol}")
             return BacktestResult(
                 symbol=symbol,
@@ -489,10 +903,17 @@ class BacktestRunner:
                 total_trading_days=0,
             )
 
+        # Resolve decision-day and next-day closes for the whole range up front
+        next_days = [get_next_trading_day(d, market=self.market) for d in trading_days]
+        closes = self._get_close_prices(trading_days + next_days, prices)
+        prices_at, prices_next = closes[:total_days], closes[total_days:]
+
         # Get graph instance
         graph = self._get_graph()
 
-        trades: List[TradeRecord] = []
+        # Trades are collected as rows and stored column-wise once the loop is done
+        rows: List[tuple] = []
+        states: List[Dict[str, Any]] = []
 
         for idx, trade_date in enumerate(trading_days):
             try:
@@ -501,6 +922,10 @@ class BacktestRunner:
                 if progress_callback:
                     progress_callback(idx + 1, total_days, trade_date)
 
+                # Wait for the API rate budget
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+
                 # Execute single-day decision
                 if stream_callback:
                     # Streaming execution with real-time agent output callback
@@ -515,9 +940,8 @@ class BacktestRunner:
                 decision = self._normalize_decision(decision)
 
                 # Get prices
-                price_at_decision = self._get_close_price(symbol, trade_date, price_df)
-                next_day = get_next_trading_day(trade_date, market=self.market)
-                price_next_day = self._get_close_price(symbol, next_day, price_df)
+                price_at_decision = float(prices_at[idx])
+                price_next_day = float(prices_next[idx])
 
                 # Calculate return
                 return_pct = self._calculate_single_return(
@@ -525,16 +949,13 @@ class BacktestRunner:
                 )
 
                 # Record trade
-                trade = TradeRecord(
-                    date=trade_date,
-                    symbol=symbol,
-                    decision=decision,
-                    price_at_decision=price_at_decision,
-                    price_next_day=price_next_day,
-                    return_pct=return_pct,
-                    full_state=final_state if self.save_states else {},
-                )
-                trades.append(trade)
+                rows.append((trade_date, decision, price_at_decision, price_next_day, return_pct))
+                if not self.save_states:
+                    states.append({})
+                elif self._state_store is not None:
+                    states.append(self._state_store.append(final_state))
+                else:
+                    states.append(final_state)
 
                 # Print result
                 print(f"| {decision:4s} | {price_at_decision:.2f} -> {price_next_day:.2f} | {return_pct:+.2f}%")
@@ -547,14 +968,12 @@ class BacktestRunner:
                         if self.debug:
                             print(f"  Reflection failed: {e}")
 
-                # API call delay
-                if self.api_call_delay > 0:
-                    time.sleep(self.api_call_delay)
-
             except Exception as e:
                 print(f"| Error: {e}")
                 continue
 
+        trades = TradeBook.from_rows(symbol, rows, states)
+
         # Calculate evaluation metrics
         metrics = calculate_metrics(trades)
 
@@ -603,22 +1022,57 @@ class BacktestRunner:
         print(f"Date range: {start_date} to {end_date}")
         print(f"{'#'*60}\n")
 
-        for idx, symbol in enumerate(symbols):
-            print(f"\n[{idx+1}/{len(symbols)}] Starting backtest for {symbol}")
-            print("-" * 40)
-
-            try:
-                result = self.run(symbol, start_date, end_date)
-                results[symbol] = result
-
-                # Save individual result
-                if output_dir:
-                    os.makedirs(output_dir, exist_ok=True)
-                    result.save_to_csv(os.path.join(output_dir, f"{symbol}_trades.csv"))
+        # Fetch every symbol's prices up front instead of one request per backtest
+        self._prefetch_prices(symbols, start_date, end_date)
+
+        # Spill saved states to disk instead of holding every symbol's states in memory
+        if self.save_states and output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            self._state_store = StateStore(os.path.join(output_dir, "states.bin"))
+
+        def run_symbol(runner: "BacktestRunner", symbol: str) -> BacktestResult:
+            result = runner.run(symbol, start_date, end_date)
+
+            # Save individual result
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                result.save_to_csv(os.path.join(output_dir, f"{symbol}_trades.csv"))
+            return result
+
+        if self.max_workers > 1 and len(symbols) > 1:
+            # The graph is stateful, so every concurrent symbol gets its own runner
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="backtest",
+            ) as pool:
+                futures = {
+                    pool.submit(run_symbol, self._spawn_worker(), symbol): symbol
+                    for symbol in symbols
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        results[symbol] = future.result()
+                    except Exception as e:
+                        print(f"Backtest failed for {symbol}: {e}")
 
-            except Exception as e:
-                print(f"Backtest failed for {symbol}: {e}")
-                continue
+            # Report in input order rather than completion order
+            results = {symbol: results[symbol] for symbol in symbols if symbol in results}
+        else:
+            for idx, symbol in enumerate(symbols):
+                print(f"\n[{idx+1}/{len(symbols)}] Starting backtest for {symbol}")
+                print("-" * 40)
+
+                try:
+                    results[symbol] = run_symbol(self, symbol)
+                except Exception as e:
+                    print(f"Backtest failed for {symbol}: {e}")
+                    continue
+
+        if self._state_store is not None:
+            self._state_store.close()
+            print(f"Trade states saved to: {self._state_store.path}")
+            self._state_store = None
 
         # Print summary
         print(f"\n{'#'*60}")
@@ -3,10 +3,12 @@ A-share Trading Calendar Utilities
 
 Provides trading day validation, date range generation, and CSI 300 constituent retrieval.
 Uses AKShare for real trading calendar data.
+
+The date helpers are A-share shortcuts over multi_market_calendar, which owns
+the cached calendar and its binary-search lookups.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List
 import pandas as pd
 
 try:
@@ -14,9 +16,10 @@ try:
 except ImportError:
     ak = None
 
+from . import multi_market_calendar as _mmc
+from .multi_market_calendar import _fetch_csindex_cons
 
-# Cached trading calendar
-_trading_days_cache: Optional[pd.DataFrame] = None
+_MARKET = "A-share"
 
 
 def get_trading_calendar() -> pd.DataFrame:
@@ -26,22 +29,7 @@ def get_trading_calendar() -> pd.DataFrame:
     Returns:
         DataFrame containing trading dates
     """
-    global _trading_days_cache
-
-    if _trading_days_cache is None:
-        if ak is None:
-            print("Warning: akshare not installed, using fallback calendar")
-            return pd.DataFrame()
-
-        try:
-            df = ak.tool_trade_date_hist_sina()
-            df["trade_date"] = pd.to_datetime(df["trade_date"])
-            _trading_days_cache = df
-        except Exception as e:
-            print(f"Failed to fetch trading calendar: {e}")
-            return pd.DataFrame()
-
-    return _trading_days_cache
+    return pd.DataFrame({"trade_date": pd.to_datetime(_mmc.get_trading_calendar(_MARKET))})
 
 
 def is_trading_day(date: str) -> bool:
@@ -54,14 +42,7 @@ def is_trading_day(date: str) -> bool:
     Returns:
         Whether it is a trading day
     """
-    calendar = get_trading_calendar()
-    if calendar.empty:
-        # Fallback: exclude weekends when calendar is unavailable
-        date_dt = datetime.strptime(date, "%Y-%m-%d")
-        return date_dt.weekday() < 5
-
-    date_dt = pd.to_datetime(date)
-    return date_dt in calendar["trade_date"].values
+    return _mmc.is_trading_day(date, _MARKET)
 
 
 def get_trading_days_in_range(
@@ -78,32 +59,7 @@ def get_trading_days_in_range(
     Returns:
         List of trading days (yyyy-mm-dd format)
     """
-    calendar = get_trading_calendar()
-    if calendar.empty:
-        # Fallback to simple weekday logic
-        return _fallback_trading_days(start_date, end_date)
-
-    start_dt = pd.to_datetime(start_date)
-    end_dt = pd.to_datetime(end_date)
-
-    mask = (calendar["trade_date"] >= start_dt) & (calendar["trade_date"] <= end_dt)
-    trading_days = calendar[mask]["trade_date"].tolist()
-
-    return [d.strftime("%Y-%m-%d") for d in trading_days]
-
-
-def _fallback_trading_days(start_date: str, end_date: str) -> List[str]:
-    """Fallback: exclude weekends"""
-    result = []
-    current = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-
-    while current <= end:
-        if current.weekday() < 5:  # Monday to Friday
-            result.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
-
-    return result
+    return _mmc.get_trading_days_in_range(start_date, end_date, _MARKET)
 
 
 def get_next_trading_day(date: str) -> str:
@@ -116,25 +72,7 @@ def get_next_trading_day(date: str) -> str:
     Returns:
         Next trading day yyyy-mm-dd
     """
-    calendar = get_trading_calendar()
-    date_dt = pd.to_datetime(date)
-
-    if calendar.empty:
-        # Fallback: skip weekends
-        next_day = date_dt + timedelta(days=1)
-        while next_day.weekday() >= 5:
-            next_day += timedelta(days=1)
-        return next_day.strftime("%Y-%m-%d")
-
-    future_days = calendar[calendar["trade_date"] > date_dt]
-    if future_days.empty:
-        # Beyond calendar range, use simple logic
-        next_day = date_dt + timedelta(days=1)
-        while next_day.weekday() >= 5:
-            next_day += timedelta(days=1)
-        return next_day.strftime("%Y-%m-%d")
-
-    return future_days.iloc[0]["trade_date"].strftime("%Y-%m-%d")
+    return _mmc.get_next_trading_day(date, _MARKET)
 
 
 def get_previous_trading_day(date: str) -> str:
@@ -147,24 +85,7 @@ def get_previous_trading_day(date: str) -> str:
     Returns:
         Previous trading day yyyy-mm-dd
     """
-    calendar = get_trading_calendar()
-    date_dt = pd.to_datetime(date)
-
-    if calendar.empty:
-        # Fallback
-        prev_day = date_dt - timedelta(days=1)
-        while prev_day.weekday() >= 5:
-            prev_day -= timedelta(days=1)
-        return prev_day.strftime("%Y-%m-%d")
-
-    past_days = calendar[calendar["trade_date"] < date_dt]
-    if past_days.empty:
-        prev_day = date_dt - timedelta(days=1)
-        while prev_day.weekday() >= 5:
-            prev_day -= timedelta(days=1)
-        return prev_day.strftime("%Y-%m-%d")
-
-    return past_days.iloc[-1]["trade_date"].strftime("%Y-%m-%d")
+    return _mmc.get_previous_trading_day(date, _MARKET)
 
 
 def get_hs300_constituents() -> List[str]:
@@ -191,19 +112,9 @@ def get_hs300_constituents() -> List[str]:
         ]
 
     try:
-        df = ak.index_stock_cons_csindex(symbol="000300")
-        # Column name may vary
-        code_col = None
-        for col in ["\u6210\u5206\u5238\u4ee3\u7801", "\u8bc1\u5238\u4ee3\u7801", "\u4ee3\u7801", "code"]:
-            if col in df.columns:
-                code_col = col
-                break
-
-        if code_col is None:
-            print(f"Warning: Cannot identify constituent code column, columns: {df.columns.tolist()}")
-            return []
-
-        return df[code_col].tolist()
+        # Cached per session; None when the code column cannot be identified
+        codes = _fetch_csindex_cons("000300")
+        return list(codes) if codes is not None else []
 
     except Exception as e:
         print(f"Failed to fetch CSI 300 constituents: {e}")
@@ -225,17 +136,8 @@ def get_zz500_constituents() -> List[str]:
         return []
 
     try:
-        df = ak.index_stock_cons_csindex(symbol="000905")
-        code_col = None
-        for col in ["\u6210\u5206\u5238\u4ee3\u7801", "\u8bc1\u5238\u4ee3\u7801", "\u4ee3\u7801", "code"]:
-            if col in df.columns:
-                code_col = col
-                break
-
-        if code_col is None:
-            return []
-
-        return df[code_col].tolist()
+        codes = _fetch_csindex_cons("000905")
+        return list(codes) if codes is not None else []
 
     except Exception as e:
         print(f"Failed to fetch CSI 500 constituents: {e}")
@@ -253,4 +155,4 @@ def get_trading_days_count(start_date: str, end_date: str) -> int:
     Returns:
         Number of trading days
     """
-    return len(get_trading_days_in_range(start_date, end_date))
+    return _mmc.get_trading_days_count(start_date, end_date, _MARKET)
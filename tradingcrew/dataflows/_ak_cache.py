@@ -0,0 +1,225 @@
+"""
+AKShare response cache
+
+Memoizes AKShare DataFrame responses in-process (LRU with per-entry TTL) and,
+when "akshare_cache_redis_url" is configured, in Redis so the cache is shared
+across processes. Redis entries are JSON (never pickle), so a writer to the
+shared Redis cannot run code in the workers. Agents often request the same ticker's data several times
+per run; cache hits skip the network round-trip entirely.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from .config import get_config
+
+
+# Cache lifetimes (seconds) per kind of endpoint
+NEWS_TTL = 60                      # Rolling news feeds
+LIVE_PRICE_TTL = 60                # OHLCV ranges that include today
+FUNDAMENTALS_TTL = 24 * 3600       # Company info, statements, pledge ratios
+HISTORY_TTL = 7 * 24 * 3600        # OHLCV ranges ending before today
+
+# In-process entries kept before evicting the least recently used
+MAX_LOCAL_ENTRIES = 256
+
+_local: "OrderedDict[str, Tuple[float, pd.DataFrame]]" = OrderedDict()
+_lock = threading.Lock()
+_redis_clients: Dict[str, Any] = {}
+_redis_lock = threading.Lock()
+
+# Column kind for object columns holding datetime.date values
+_DATE_KIND = "date"
+
+
+def price_ttl(end_date: str) -> int:
+    """
+    TTL for an OHLCV range: settled history is immutable, today's bar is not
+
+    Args:
+        end_date: Range end, yyyymmdd or yyyy-mm-dd
+    """
+    today = datetime.now().strftime("%Y%m%d")
+    return HISTORY_TTL if end_date.replace("-", "") < today else LIVE_PRICE_TTL
+
+
+def _cache_key(func_name: str, kwargs: Dict[str, Any]) -> str:
+    raw = repr((func_name, sorted(kwargs.items())))
+    return "tradingcrew:ak:v2:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _get_redis() -> Optional[Any]:
+    """Redis client for the configured URL (None when not configured)"""
+    url = get_config().get("akshare_cache_redis_url")
+    if not url or redis is None:
+        return None
+
+    with _redis_lock:
+        client = _redis_clients.get(url)
+        if client is None:
+            client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            _redis_clients[url] = client
+    return client
+
+
+def _encode_column(series: pd.Series) -> Tuple[str, list]:
+    """(kind, JSON-ready values) for one column or index"""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return str(series.dtype), [None if pd.isna(v) else v.isoformat() for v in series]
+    if series.dtype == object:
+        values = series.dropna()
+        if len(values) and all(isinstance(v, date) and not isinstance(v, datetime) for v in values):
+            return _DATE_KIND, [None if pd.isna(v) else v.isoformat() for v in series]
+    return str(series.dtype), series.tolist()
+
+
+def _decode_column(kind: str, values: list) -> pd.Series:
+    if kind == _DATE_KIND:
+        return pd.Series([None if v is None else date.fromisoformat(v) for v in values], dtype=object)
+    if kind.startswith("datetime64"):
+        return pd.Series(pd.to_datetime(values)).astype(kind)
+    return pd.Series(values, dtype=object if kind == "object" else None).astype(kind)
+
+
+def _encode_frame(df: pd.DataFrame) -> bytes:
+    """DataFrame as JSON bytes, with each column's dtype to restore it exactly"""
+    columns = [_encode_column(df[col]) for col in df.columns]
+    index = None
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        index = [*_encode_column(df.index.to_series()), df.index.name]
+    payload = {
+        "columns": list(df.columns),
+        "kinds": [kind for kind, _ in columns],
+        "data": [values for _, values in columns],
+        "index": index,
+    }
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_frame(blob: bytes) -> pd.DataFrame:
+    payload = json.loads(blob)
+    df = pd.DataFrame(
+        {
+            i: _decode_column(kind, values)
+            for i, (kind, values) in enumerate(zip(payload["kinds"], payload["data"]))
+        }
+    )
+    df.columns = payload["columns"]
+    if payload["index"] is not None:
+        kind, values, name = payload["index"]
+        df.index = pd.Index(_decode_column(kind, values), name=name)
+    return df
+
+
+def _store_local(key: str, ttl: float, df: pd.DataFrame) -> None:
+    with _lock:
+        _local[key] = (time.monotonic() + ttl, df)
+        _local.move_to_end(key)
+        while len(_local) > MAX_LOCAL_ENTRIES:
+            _local.popitem(last=False)
+
+
+def cache_lookup(func: Callable[..., pd.DataFrame], ttl: float, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Look up a cached AKShare response without calling func
+
+    Args:
+        func: AKShare function the response belongs to
+        ttl: Cache lifetime in seconds (for entries promoted from Redis)
+        **kwargs: Keyword arguments of the call
+
+    Returns:
+        Copy of the cached DataFrame, or None on a miss
+    """
+    key = _cache_key(func.__name__, kwargs)
+
+    with _lock:
+        entry = _local.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _local.move_to_end(key)
+                return entry[1].copy()
+            del _local[key]
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            blob = client.get(key)
+            df = _decode_frame(blob) if blob is not None else None
+        except Exception as e:
+            print(f"Warning: AKShare cache read failed, fetching live: {e}")
+        else:
+            if df is not None:
+                _store_local(key, ttl, df)
+                return df.copy()
+
+    return None
+
+
+def cache_store(func: Callable[..., pd.DataFrame], ttl: float, df: pd.DataFrame, **kwargs) -> None:
+    """
+    Store a response fetched outside cached_call (e.g. the async path)
+
+    Args:
+        func: AKShare function the response stands in for
+        ttl: Cache lifetime in seconds
+        df: Response DataFrame (empty frames are not cached)
+        **kwargs: Keyword arguments of the equivalent call
+    """
+    if df is None or df.empty:
+        return
+
+    key = _cache_key(func.__name__, kwargs)
+    _store_local(key, ttl, df)
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.setex(key, int(ttl), _encode_frame(df))
+        except Exception as e:
+            print(f"Warning: AKShare cache write failed: {e}")
+
+
+def cached_call(func: Callable[..., pd.DataFrame], ttl: float, **kwargs) -> pd.DataFrame:
+    """
+    Call an AKShare function through the cache
+
+    Empty results and exceptions are not cached. Redis errors fall back to
+    the live call.
+
+    Args:
+        func: AKShare function, e.g. ak.stock_zh_a_hist
+        ttl: Cache lifetime in seconds
+        **kwargs: Keyword arguments for func (part of the cache key)
+
+    Returns:
+        DataFrame returned by func (a copy, safe to modify)
+    """
+    df = cache_lookup(func, ttl, **kwargs)
+    if df is not None:
+        return df
+
+    df = func(**kwargs)
+    if df is None or df.empty:
+        return df
+
+    cache_store(func, ttl, df, **kwargs)
+    return df.copy()
+
+
+def clear_ak_cache() -> None:
+    """Drop the in-process AKShare cache (Redis entries expire by TTL)"""
+    with _lock:
+        _local.clear()
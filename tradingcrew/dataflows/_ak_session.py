@@ -0,0 +1,82 @@
+"""
+Pooled HTTP session for AKShare
+
+AKShare calls `requests.get(...)` directly, so every call opens a new
+TCP/TLS connection. install_pooled_session() points the `requests` name inside
+AKShare's modules at a shared keep-alive Session with connection pooling and
+retry/backoff on transient errors. Nothing outside AKShare is affected.
+"""
+
+import sys
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept alive per host
+POOL_SIZE = 20
+
+_install_lock = threading.Lock()
+_session = None
+
+
+class _PooledRequests:
+    """Stand-in for the requests module: request functions go through the shared Session"""
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def request(self, method, url, **kwargs):
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self._session.get(url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self._session.post(url, data=data, json=json, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self._session.head(url, **kwargs)
+
+    def __getattr__(self, name):
+        # Exceptions, Session, adapters, ... resolve to the real module
+        return getattr(requests, name)
+
+
+def _make_session() -> requests.Session:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(("GET", "HEAD")),
+        raise_on_status=False,  # Hand back the last response, as a plain requests call would
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def install_pooled_session() -> requests.Session:
+    """
+    Route AKShare's plain-requests HTTP calls through one pooled Session
+
+    Safe to call repeatedly; modules already patched are skipped. AKShare
+    modules that use curl_cffi instead of requests are left untouched.
+
+    Returns:
+        The shared Session
+    """
+    global _session
+    with _install_lock:
+        if _session is None:
+            _session = _make_session()
+        pooled = _PooledRequests(_session)
+
+        for name, module in list(sys.modules.items()):
+            if name.startswith("akshare") and getattr(module, "requests", None) is requests:
+                module.requests = pooled
+
+    return _session
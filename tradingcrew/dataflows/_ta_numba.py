@@ -0,0 +1,358 @@
+"""
+Numba kernels for the technical indicators served by get_indicators
+
+Each kernel reproduces the stockstats 0.6.5 (the version pinned in requirements)
+definition of the indicator (same windows, smoothing and fill rules), so
+output matches the stockstats path to floating-point rounding. Without Numba
+the kernels run as plain Python loops; callers should check NUMBA_AVAILABLE
+and fall back to stockstats.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+from .._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _ewm_mean(x, alpha, min_periods):
+    """pandas ewm(alpha=alpha, adjust=True, ignore_na=False).mean()"""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= min_periods else np.nan
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = x[i]
+        is_obs = cur == cur
+        if is_obs:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+# The rolling kernels follow pandas' online algorithms (Kahan-compensated sums,
+# Welford variance) step for step, so results match stockstats bit for bit
+# for the windows used here;
+# prices with two decimals often sit exactly on a 4-decimal rounding tie.
+
+@njit(cache=True)
+def _rolling_sum(x, window):
+    """rolling(window, min_periods=1).sum(), NaNs skipped"""
+    n = x.shape[0]
+    out = np.empty(n)
+    total = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    nobs = 0
+    same_count = 0
+    prev_value = x[0] if n > 0 else 0.0
+    for i in range(n):
+        # Remove the value leaving the window, then add the new one
+        if i >= window:
+            v = x[i - window]
+            if v == v:
+                nobs -= 1
+                y = -v - comp_remove
+                t = total + y
+                comp_remove = t - total - y
+                total = t
+        v = x[i]
+        if v == v:
+            nobs += 1
+            y = v - comp_add
+            t = total + y
+            comp_add = t - total - y
+            total = t
+            if v == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = v
+        if nobs == 0:
+            out[i] = np.nan
+        elif same_count >= nobs:
+            out[i] = prev_value * nobs
+        else:
+            out[i] = total
+    return out
+
+
+@njit(cache=True)
+def _rolling_mean(x, window):
+    """rolling(window, min_periods=1).mean(), NaNs skipped"""
+    n = x.shape[0]
+    out = np.empty(n)
+    total = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    nobs = 0
+    neg_count = 0
+    same_count = 0
+    prev_value = x[0] if n > 0 else 0.0
+    for i in range(n):
+        if i >= window:
+            v = x[i - window]
+            if v == v:
+                nobs -= 1
+                y = -v - comp_remove
+                t = total + y
+                comp_remove = t - total - y
+                total = t
+                if np.signbit(v):
+                    neg_count -= 1
+        v = x[i]
+        if v == v:
+            nobs += 1
+            y = v - comp_add
+            t = total + y
+            comp_add = t - total - y
+            total = t
+            if np.signbit(v):
+                neg_count += 1
+            if v == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = v
+        if nobs == 0:
+            out[i] = np.nan
+            continue
+        result = total / nobs
+        if same_count >= nobs:
+            result = prev_value
+        elif neg_count == 0 and result < 0:
+            result = 0.0
+        elif neg_count == nobs and result > 0:
+            result = 0.0
+        out[i] = result
+    return out
+
+
+@njit(cache=True)
+def _rolling_std(x, window):
+    """rolling(window, min_periods=1).std() (ddof=1), NaNs skipped"""
+    n = x.shape[0]
+    out = np.empty(n)
+    mean = 0.0
+    ssqdm = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    nobs = 0
+    same_count = 0
+    prev_value = x[0] if n > 0 else 0.0
+    for i in range(n):
+        if i >= window:
+            v = x[i - window]
+            if v == v:
+                nobs -= 1
+                if nobs:
+                    prev_mean = mean - comp_remove
+                    y = v - comp_remove
+                    t = y - mean
+                    comp_remove = t + mean - y
+                    mean -= t / nobs
+                    ssqdm -= (v - prev_mean) * (v - mean)
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+        v = x[i]
+        if v == v:
+            if v == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = v
+            nobs += 1
+            prev_mean = mean - comp_add
+            y = v - comp_add
+            t = y - mean
+            comp_add = t + mean - y
+            mean += t / nobs
+            ssqdm += (v - prev_mean) * (v - mean)
+        if nobs < 2:
+            out[i] = np.nan
+        elif same_count >= nobs:
+            out[i] = 0.0
+        else:
+            var = ssqdm / (nobs - 1)
+            out[i] = np.sqrt(var) if var > 0 else 0.0
+    return out
+
+
+@njit(cache=True)
+def _rsi_kernel(close, window):
+    n = close.shape[0]
+    up = np.zeros(n)
+    down = np.zeros(n)
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        if diff != diff:
+            up[i] = np.nan
+            down[i] = np.nan
+        elif diff > 0:
+            up[i] = diff
+        elif diff < 0:
+            down[i] = -diff
+    up_smma = _ewm_mean(up, 1.0 / window, 1)
+    down_smma = _ewm_mean(down, 1.0 / window, 1)
+    out = np.empty(n)
+    for i in range(n):
+        # 100 - 100 / (1 + up / down): NaN while both are 0 (e.g. the first bar)
+        if down_smma[i] != 0:
+            out[i] = 100.0 - 100.0 / (1.0 + up_smma[i] / down_smma[i])
+        elif up_smma[i] > 0:
+            out[i] = 100.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def _atr_kernel(high, low, close, window):
+    n = close.shape[0]
+    tr = np.empty(n)
+    for i in range(n):
+        # First bar: previous close is the bar's own close
+        prev_close = close[i - 1] if i > 0 else close[0]
+        v = max(high[i] - low[i], max(abs(high[i] - prev_close), abs(low[i] - prev_close)))
+        tr[i] = v if v == v else 0.0
+    return _ewm_mean(tr, 1.0 / window, 1)
+
+
+@njit(cache=True)
+def _vwma_kernel(tp, volume, window):
+    n = tp.shape[0]
+    tpv = tp * volume
+    rolling_tpv = _rolling_sum(tpv, window)
+    rolling_vol = _rolling_sum(volume, window)
+    out = np.zeros(n)
+    for i in range(n):
+        if rolling_vol[i] != 0:
+            out[i] = rolling_tpv[i] / rolling_vol[i]
+    return out
+
+
+@njit(cache=True)
+def _mfi_kernel(tp, volume, window):
+    n = tp.shape[0]
+    pos_flow = np.zeros(n)
+    neg_flow = np.zeros(n)
+    for i in range(n):
+        flow = tp[i] * volume[i]
+        if flow != flow:
+            flow = 0.0
+        # Flat (and unknown) typical-price days count as positive flow
+        if i > 0 and tp[i] - tp[i - 1] < 0:
+            neg_flow[i] = flow
+        else:
+            pos_flow[i] = flow
+    pos_sum = _rolling_sum(pos_flow, window)
+    neg_sum = _rolling_sum(neg_flow, window)
+    out = np.full(n, 0.5)
+    for i in range(window, n):
+        out[i] = 1.0 - 1.0 / (1.0 + pos_sum[i] / (neg_sum[i] + 1e-12))
+    return out
+
+
+def sma(close: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average (partial windows at the start)"""
+    return _rolling_mean(close, window)
+
+
+def ema(close: np.ndarray, window: int) -> np.ndarray:
+    """Exponential moving average with span=window"""
+    return _ewm_mean(close, 2.0 / (window + 1.0), 1)
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9):
+    """
+    MACD line, signal line and histogram
+
+    Returns:
+        (macd, macds, macdh)
+    """
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """Relative Strength Index (SMMA of gains/losses, 0-100)"""
+    return _rsi_kernel(close, window)
+
+
+def bbands(close: np.ndarray, window: int = 20, k: float = 2.0):
+    """
+    Bollinger bands
+
+    Returns:
+        (middle, upper, lower)
+    """
+    middle = _rolling_mean(close, window)
+    width = k * _rolling_std(close, window)
+    return middle, middle + width, middle - width
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 14) -> np.ndarray:
+    """Average True Range (SMMA of the true range)"""
+    return _atr_kernel(high, low, close, window)
+
+
+def vwma(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    """Volume-weighted moving average of the typical price"""
+    return _vwma_kernel(tp, volume, window)
+
+
+def mfi(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    """Money Flow Index as a 0-1 ratio (stockstats convention)"""
+    return _mfi_kernel(tp, volume, window)
+
+
+def typical_price(cols: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Typical price, as stockstats defines it
+
+    Args:
+        cols: float64 column arrays; amount/volume is used when "amount" is present
+
+    Returns:
+        amount / volume, or (close + high + low) / 3, with NaN replaced by 0
+    """
+    if "amount" in cols:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tp = cols["amount"] / cols["volume"]
+    else:
+        tp = (cols["close"] + cols["high"] + cols["low"]) / 3.0
+    return np.nan_to_num(tp, nan=0.0, posinf=np.inf, neginf=-np.inf)
+
+
+# Indicator name -> function of the frame's float64 column arrays
+INDICATOR_DISPATCH: Dict[str, Callable[[Dict[str, np.ndarray]], np.ndarray]] = {
+    "close_50_sma": lambda c: sma(c["close"], 50),
+    "close_200_sma": lambda c: sma(c["close"], 200),
+    "close_10_ema": lambda c: ema(c["close"], 10),
+    "macd": lambda c: macd(c["close"])[0],
+    "macds": lambda c: macd(c["close"])[1],
+    "macdh": lambda c: macd(c["close"])[2],
+    "rsi": lambda c: rsi(c["close"], 14),
+    "boll": lambda c: bbands(c["close"], 20)[0],
+    "boll_ub": lambda c: bbands(c["close"], 20)[1],
+    "boll_lb": lambda c: bbands(c["close"], 20)[2],
+    "atr": lambda c: atr(c["high"], c["low"], c["close"], 14),
+    "vwma": lambda c: vwma(typical_price(c), c["volume"], 14),
+    "mfi": lambda c: mfi(typical_price(c), c["volume"], 14),
+}
@@ -4,16 +4,22 @@ AKShare A-share data adapter
 Provides A-share data retrieval functions compatible with existing yfinance/alpha_vantage interfaces.
 Uses AKShare as data source, supporting:
 - Daily OHLCV data (stock_zh_a_hist)
-- Technical indicators (via stockstats)
+- Technical indicators (Numba kernels, or stockstats without Numba)
 - A-share news (stock_news_em)
 - Company fundamentals (stock_individual_info_em)
 """
 
-from typing import Annotated
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from typing import Annotated, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import json
 import os
+import threading
+import time
 
 try:
     import akshare as ak
@@ -27,7 +33,41 @@ except ImportError:
     wrap = None
     print("Warning: stockstats not installed. Run: pip install stockstats")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import get_config
+from ._ak_cache import cached_call, price_ttl, NEWS_TTL, FUNDAMENTALS_TTL
+from ._ak_session import install_pooled_session
+from ._ta_numba import NUMBA_AVAILABLE, INDICATOR_DISPATCH
+
+# Reuse keep-alive connections across AKShare calls (and for direct East Money requests)
+_http_session = install_pooled_session() if ak is not None else None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# AKShare stock_zh_a_hist column names -> get_stock_data output columns (in output order)
+_OHLCV_RENAME_FULL = {
+    "\u65e5\u671f": "Date",
+    "\u5f00\u76d8": "Open",
+    "\u6700\u9ad8": "High",
+    "\u6700\u4f4e": "Low",
+    "\u6536\u76d8": "Close",
+    "\u6210\u4ea4\u91cf": "Volume"
+}
+
+# AKShare stock_zh_a_hist column names -> stockstats column names
+_OHLCV_RENAME_LOWER = {
+    "\u65e5\u671f": "date",
+    "\u5f00\u76d8": "open",
+    "\u6536\u76d8": "close",
+    "\u6700\u9ad8": "high",
+    "\u6700\u4f4e": "low",
+    "\u6210\u4ea4\u91cf": "volume"
+}
 
 
 # === Technical indicator descriptions (consistent with y_finance.py) ===
@@ -47,6 +87,44 @@ INDICATOR_DESCRIPTIONS = {
     "mfi": "MFI: Money Flow Index. Similar to RSI but incorporates volume, measuring buying/selling pressure. Overbought/oversold thresholds at 80/20."
 }
 
+# Listed in the unsupported-indicator error (built once, not per call)
+_SUPPORTED_INDICATORS = list(INDICATOR_DESCRIPTIONS)
+
+
+# === Output field mappings: {field: (source columns in priority order, default)} ===
+_NEWS_FIELDS = {
+    "title": (("\u65b0\u95fb\u6807\u9898", "title"), "Untitled"),
+    "content": (("\u65b0\u95fb\u5185\u5bb9", "content"), ""),
+    "source": (("\u6587\u7ae0\u6765\u6e90", "source"), "Unknown"),
+    "pub_time": (("\u53d1\u5e03\u65f6\u95f4", "publish_time"), ""),
+}
+_GLOBAL_NEWS_FIELDS = {
+    "title": (("\u6807\u9898", "title"), ""),
+    "content": (("\u6458\u8981", "\u5185\u5bb9", "content"), ""),
+}
+_INFO_FIELDS = {
+    "item": (("item", "\u9879\u76ee"), ""),
+    "value": (("value", "\u503c"), ""),
+}
+
+
+def _select_fields(df: pd.DataFrame, fields: dict) -> pd.DataFrame:
+    """
+    Pick one source column per output field, so rows can be read as namedtuples
+
+    Args:
+        df: AKShare result
+        fields: {field: (source columns in priority order, default)}
+
+    Returns:
+        DataFrame with one column per field (the default when no source column exists)
+    """
+    selected = {}
+    for name, (candidates, default) in fields.items():
+        col = next((c for c in candidates if c in df.columns), None)
+        selected[name] = df[col] if col is not None else default
+    return pd.DataFrame(selected, index=df.index)
+
 
 # === Core stock data ===
 def get_stock_data(
@@ -75,7 +153,9 @@ def get_stock_data(
     try:
         # Call AKShare API
         # adjust="qfq" forward-adjusted, "hfq" backward-adjusted, "" unadjusted
-        df = ak.stock_zh_a_hist(
+        df = cached_call(
+            ak.stock_zh_a_hist,
+            price_ttl(end_fmt),
             symbol=symbol,
             period="daily",
             start_date=start_fmt,
@@ -83,42 +163,137 @@ def get_stock_data(
             adjust="qfq"  # Forward-adjusted
         )
 
-        if df.empty:
-            return f"No data found for stock {symbol} from {start_date} to {end_date}"
-
-        # Rename columns to match existing format
-        column_mapping = {
-            "\u65e5\u671f": "Date",
-            "\u5f00\u76d8": "Open",
-            "\u6536\u76d8": "Close",
-            "\u6700\u9ad8": "High",
-            "\u6700\u4f4e": "Low",
-            "\u6210\u4ea4\u91cf": "Volume",
-            "\u6210\u4ea4\u989d": "Amount",
-            "\u6da8\u8dcc\u5e45": "Change_Pct",
-            "\u6362\u624b\u7387": "Turnover"
-        }
-        df = df.rename(columns=column_mapping)
+        return _format_stock_data(df, symbol, start_date, end_date)
 
-        # Select key columns
-        cols = ["Date", "Open", "High", "Low", "Close", "Volume"]
-        available_cols = [c for c in cols if c in df.columns]
-        df = df[available_cols]
+    except Exception as e:
+        return f"Error fetching data for stock {symbol}: {str(e)}"
 
-        # Convert to CSV
-        csv_string = df.to_csv(index=False)
 
-        header = f"# A-share data {symbol} from {start_date} to {end_date}\n"
-        header += f"# Total records: {len(df)}\n"
-        header += f"# Retrieved at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+def _format_stock_data(df: pd.DataFrame, symbol: str, start_date: str, end_date: str) -> str:
+    """Render a stock_zh_a_hist frame (a private copy) as get_stock_data's CSV report"""
+    if df.empty:
+        return f"No data found for stock {symbol} from {start_date} to {end_date}"
 
-        return header + csv_string
+    # Select the key columns first, then rename the narrow frame to match existing format
+    df = df[[c for c in _OHLCV_RENAME_FULL if c in df.columns]]
+    df.rename(columns=_OHLCV_RENAME_FULL, inplace=True)
 
-    except Exception as e:
-        return f"Error fetching data for stock {symbol}: {str(e)}"
+    # Convert to CSV
+    csv_string = df.to_csv(index=False)
+
+    header = (
+        f"# A-share data {symbol} from {start_date} to {end_date}\n"
+        f"# Total records: {len(df)}\n"
+        f"# Retrieved at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    )
+
+    return header + csv_string
 
 
 # === Technical indicators ===
+# stockstats frames by (symbol, start, end), shared by requests for different indicators
+MAX_INDICATOR_FRAMES = 64
+_indicator_frames: "OrderedDict[tuple, tuple]" = OrderedDict()
+_indicator_frames_lock = threading.Lock()
+
+# Numeric columns of an indicator frame
+_OHLCV_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Computed when a frame is built; stockstats reuses their intermediate columns
+_PRECOMPUTED_INDICATORS = ("close_50_sma", "close_200_sma", "macd", "rsi", "boll")
+
+
+def _frame_columns(stock_df) -> Dict[str, np.ndarray]:
+    """OHLCV columns as float64 arrays for the Numba kernels"""
+    # Contiguous 1-D arrays: the kernels compile once for C layout and read sequentially
+    return {
+        name: np.ascontiguousarray(stock_df[name].to_numpy(), dtype=np.float64)
+        for name in _OHLCV_VALUE_COLUMNS
+    }
+
+
+def _get_indicator_frame(symbol: str, start_fmt: str, end_fmt: str):
+    """
+    Get a stockstats-wrapped OHLCV frame (cached until the price data's TTL expires)
+
+    Args:
+        symbol: A-share stock code
+        start_fmt: Start date yyyymmdd
+        end_fmt: End date yyyymmdd
+
+    Returns:
+        (StockDataFrame, lock guarding it, float64 column arrays for the Numba
+        kernels or None without Numba), or an error message string
+    """
+    key = (symbol, start_fmt, end_fmt)
+    with _indicator_frames_lock:
+        entry = _indicator_frames.get(key)
+        if entry is not None:
+            expires_at, stock_df, frame_lock, columns = entry
+            if expires_at > time.monotonic():
+                _indicator_frames.move_to_end(key)
+                return stock_df, frame_lock, columns
+            del _indicator_frames[key]
+
+    ttl = price_ttl(end_fmt)
+    df = cached_call(
+        ak.stock_zh_a_hist,
+        ttl,
+        symbol=symbol,
+        period="daily",
+        start_date=start_fmt,
+        end_date=end_fmt,
+        adjust="qfq"
+    )
+
+    if df.empty:
+        return f"No data found for stock {symbol}"
+
+    # Keep only the OHLCV columns, renamed for stockstats compatibility
+    df = df[[c for c in _OHLCV_RENAME_LOWER if c in df.columns]]
+    df.rename(columns=_OHLCV_RENAME_LOWER, inplace=True)
+
+    # Ensure date column exists and is properly formatted
+    if "date" not in df.columns:
+        return f"Data format error: missing date column"
+
+    # AKShare returns ISO dates; an explicit format skips per-call format inference
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", cache=True)
+
+    # Set date as index to prevent stockstats from parsing 'date' column name
+    df = df.set_index("date")
+
+    # Fix the value dtypes once at the boundary (volume arrives as int64), so neither
+    # stockstats nor the kernels convert again. float64, not float32: float32 shifts the
+    # 4-decimal output for larger prices and can't hold big volumes exactly
+    df = df.astype({c: np.float64 for c in _OHLCV_VALUE_COLUMNS if c in df.columns})
+
+    # Calculate the common indicators in one pass (the Numba kernels don't need it)
+    stock_df = wrap(df)
+    columns = _frame_columns(stock_df) if NUMBA_AVAILABLE else None
+    if columns is None:
+        for name in _PRECOMPUTED_INDICATORS:
+            try:
+                stock_df[name]
+            except Exception:
+                pass
+
+    frame_lock = threading.Lock()
+    with _indicator_frames_lock:
+        _indicator_frames[key] = (time.monotonic() + ttl, stock_df, frame_lock, columns)
+        _indicator_frames.move_to_end(key)
+        while len(_indicator_frames) > MAX_INDICATOR_FRAMES:
+            _indicator_frames.popitem(last=False)
+
+    return stock_df, frame_lock, columns
+
+
+@lru_cache(maxsize=1024)
+def _parse_day(date_str: str) -> datetime:
+    """Parse a yyyy-mm-dd date (memoized; agents repeat the same dates)"""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def get_indicators(
     symbol: Annotated[str, "A-share stock code"],
     indicator: Annotated[str, "Technical indicator name, e.g. macd, rsi, boll"],
@@ -128,7 +303,8 @@ def get_indicators(
     """
     Get A-share technical indicators
 
-    Uses stockstats library for calculation, consistent with existing yfinance implementation.
+    Uses the Numba kernels in _ta_numba when Numba is installed, otherwise the
+    stockstats library (consistent with existing yfinance implementation).
     Supported indicators: close_50_sma, close_200_sma, close_10_ema, macd, macds,
                 macdh, rsi, boll, boll_ub, boll_lb, atr, vwma, mfi
     """
@@ -138,85 +314,57 @@ def get_indicators(
         return "Error: stockstats not installed"
 
     if indicator not in INDICATOR_DESCRIPTIONS:
-        return f"Unsupported indicator {indicator}, available: {list(INDICATOR_DESCRIPTIONS.keys())}"
+        return f"Unsupported indicator {indicator}, available: {_SUPPORTED_INDICATORS}"
 
     try:
         # Fetch enough historical data for indicator calculation
-        curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+        curr_date_dt = _parse_day(curr_date)
         # Need extra data for long-period indicators like 200SMA
-        data_start = curr_date_dt - relativedelta(days=look_back_days + 300)
+        data_start = curr_date_dt - timedelta(days=look_back_days + 300)
 
         start_fmt = data_start.strftime("%Y%m%d")
         end_fmt = curr_date_dt.strftime("%Y%m%d")
 
-        df = ak.stock_zh_a_hist(
-            symbol=symbol,
-            period="daily",
-            start_date=start_fmt,
-            end_date=end_fmt,
-            adjust="qfq"
-        )
-
-        if df.empty:
-            return f"No data found for stock {symbol}"
-
-        # Rename columns for stockstats compatibility
-        df = df.rename(columns={
-            "\u65e5\u671f": "date",
-            "\u5f00\u76d8": "open",
-            "\u6536\u76d8": "close",
-            "\u6700\u9ad8": "high",
-            "\u6700\u4f4e": "low",
-            "\u6210\u4ea4\u91cf": "volume"
-        })
-
-        # Ensure date column exists and is properly formatted
-        if "date" not in df.columns:
-            return f"Data format error: missing date column"
-
-        df["date"] = pd.to_datetime(df["date"])
-
-        # Save date column for later filtering
-        dates = df["date"].copy()
-
-        # Set date as index to prevent stockstats from parsing 'date' column name
-        df = df.set_index("date")
-
-        # Calculate indicator using stockstats
-        stock_df = wrap(df)
-
-        # Trigger indicator calculation
-        try:
-            _ = stock_df[indicator]
-        except Exception as e:
-            return f"Error calculating indicator {indicator}: {str(e)}"
-
-        # Reset index and convert to regular DataFrame to avoid stockstats intercepting column access
-        result_df = pd.DataFrame(stock_df.reset_index())
-
-        # Filter to specified date range
-        before = curr_date_dt - relativedelta(days=look_back_days)
-        mask = (result_df["date"] >= before) & (result_df["date"] <= curr_date_dt)
-        result_df = result_df[mask].copy()
+        entry = _get_indicator_frame(symbol, start_fmt, end_fmt)
+        if isinstance(entry, str):
+            return entry
+        stock_df, frame_lock, columns = entry
+
+        # stockstats adds indicator columns in place; one thread at a time per frame
+        with frame_lock:
+            try:
+                if columns is not None and indicator in INDICATOR_DISPATCH:
+                    values = INDICATOR_DISPATCH[indicator](columns)
+                else:
+                    values = stock_df[indicator].to_numpy()
+            except Exception as e:
+                return f"Error calculating indicator {indicator}: {str(e)}"
+
+            dates = stock_df.index.to_numpy()
+
+        # Filter to specified date range (dates are sorted: binary search, slice views),
+        # then build only the two-column result (plain DataFrame, so access isn't
+        # intercepted by stockstats)
+        before = curr_date_dt - timedelta(days=look_back_days)
+        lo = np.searchsorted(dates, np.datetime64(before))
+        hi = np.searchsorted(dates, np.datetime64(curr_date_dt), side="right")
+        result_df = pd.DataFrame({"date": dates[lo:hi], indicator: values[lo:hi]})
 
         if result_df.empty:
             return f"No data found within the specified date range"
 
-        # Build output string
-        ind_string = ""
-        for _, row in result_df.iterrows():
-            date_str = row["date"].strftime("%Y-%m-%d")
-            value = row[indicator] if indicator in row else None
-            if pd.isna(value) or value is None:
-                ind_string += f"{date_str}: N/A\n"
-            else:
-                ind_string += f"{date_str}: {value:.4f}\n"
-
-        result = f"## {indicator} from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
-        result += ind_string + "\n\n"
-        result += INDICATOR_DESCRIPTIONS.get(indicator, "")
+        # Build output string ("date: value" per row, N/A for missing values)
+        # (the result frame always has the indicator column, so no membership check)
+        date_strs = result_df["date"].dt.strftime("%Y-%m-%d")
+        values = result_df[indicator].map("{:.4f}".format, na_action="ignore").fillna("N/A")
+        ind_string = "".join(date_strs + ": " + values + "\n")
 
-        return result
+        return "".join((
+            f"## {indicator} from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n",
+            ind_string,
+            "\n\n",
+            INDICATOR_DESCRIPTIONS.get(indicator, ""),
+        ))
 
     except Exception as e:
         return f"Error fetching indicator {indicator}: {str(e)}"
@@ -238,31 +386,67 @@ def get_news(
 
     try:
         # Use East Money stock news API
-        news_df = ak.stock_news_em(symbol=ticker)
+        news_df = cached_call(ak.stock_news_em, NEWS_TTL, symbol=ticker)
 
         if news_df.empty:
             return f"No news found for stock {ticker}"
 
-        news_str = f"## {ticker} related news ({start_date} to {end_date}):\n\n"
+        parts = [f"## {ticker} related news ({start_date} to {end_date}):\n\n"]
 
-        # Limit number of news items
-        for idx, row in news_df.head(10).iterrows():
-            title = row.get("\u65b0\u95fb\u6807\u9898", row.get("title", "Untitled"))
-            content = str(row.get("\u65b0\u95fb\u5185\u5bb9", row.get("content", "")))[:300]
-            source = row.get("\u6587\u7ae0\u6765\u6e90", row.get("source", "Unknown"))
-            pub_time = row.get("\u53d1\u5e03\u65f6\u95f4", row.get("publish_time", ""))
+        # Limit number of news items; fill and truncate text column-wise, not per row
+        news = _select_fields(news_df.head(10), _NEWS_FIELDS)
+        news["title"] = news["title"].fillna("Untitled")
+        news["content"] = news["content"].fillna("").astype(str).str.slice(0, 300)
 
-            news_str += f"### {title}\n"
-            news_str += f"Source: {source} | Time: {pub_time}\n"
-            news_str += f"{content}...\n\n"
+        for row in news.itertuples(index=False):
+            parts.append(
+                f"### {row.title}\n"
+                f"Source: {row.source} | Time: {row.pub_time}\n"
+                f"{row.content}...\n\n"
+            )
 
-        return news_str
+        return "".join(parts)
 
     except Exception as e:
         return f"Error fetching news: {str(e)}"
 
 
 # === Global news ===
+# East Money 7x24 fast-news list (the endpoint behind ak.stock_info_global_em)
+GLOBAL_NEWS_URL = "https://np-weblist.eastmoney.com/comm/web/getFastNewsList"
+
+
+def _global_news_head(page_size: int) -> pd.DataFrame:
+    """
+    First page_size items of ak.stock_info_global_em, same columns
+
+    AKShare always pulls 200 items into a DataFrame; this asks the endpoint for
+    page_size items and builds the frame from just those. Falls back to AKShare
+    if the direct request or its parsing fails.
+    """
+    try:
+        params = {
+            "client": "web",
+            "biz": "web_724",
+            "fastColumn": "102",
+            "sortEnd": "",
+            "pageSize": str(page_size),
+            "req_trace": str(int(time.time() * 1000)),
+        }
+        resp = _http_session.get(GLOBAL_NEWS_URL, params=params, timeout=15)
+        resp.raise_for_status()
+        items = _json_loads(resp.content)["data"]["fastNewsList"][:page_size]
+        return pd.DataFrame({
+            "\u6807\u9898": [item["title"] for item in items],
+            "\u6458\u8981": [item["summary"] for item in items],
+            "\u53d1\u5e03\u65f6\u95f4": [item["showTime"] for item in items],
+            "\u94fe\u63a5": [f"https://finance.eastmoney.com/a/{item['code']}.html" for item in items],
+        })
+    except Exception as e:
+        print(f"Warning: direct global news request failed, using AKShare: {e}")
+        return ak.stock_info_global_em().head(page_size)
+
+
 def get_global_news(
     curr_date: Annotated[str, "Current date yyyy-mm-dd"],
     look_back_days: Annotated[int, "Lookback days"] = 7,
@@ -273,26 +457,91 @@ def get_global_news(
         return "Error: akshare not installed"
 
     try:
-        # Use East Money global financial news
-        news_df = ak.stock_info_global_em()
+        # Use East Money global financial news (only the first `limit` items)
+        news_df = cached_call(_global_news_head, NEWS_TTL, page_size=limit)
 
         if news_df.empty:
             return "No global news found"
 
-        news_str = f"## Global financial headlines (as of {curr_date}):\n\n"
+        parts = [f"## Global financial headlines (as of {curr_date}):\n\n"]
 
-        for idx, row in news_df.head(limit).iterrows():
-            title = row.get("\u6807\u9898", row.get("title", ""))
-            content = str(row.get("\u5185\u5bb9", row.get("content", "")))[:400]
+        news = _select_fields(news_df.head(limit), _GLOBAL_NEWS_FIELDS)
+        news["title"] = news["title"].fillna("")
+        news["content"] = news["content"].fillna("").astype(str).str.slice(0, 400)
 
-            news_str += f"### {title}\n{content}...\n\n"
+        for row in news.itertuples(index=False):
+            parts.append(f"### {row.title}\n{row.content}...\n\n")
 
-        return news_str
+        return "".join(parts)
 
     except Exception as e:
         return f"Error fetching global news: {str(e)}"
 
 
+# === Rendered report cache ===
+# Fundamentals change at most quarterly: reports are memoized per (ticker, calendar day)
+REPORT_CACHE_SIZE = 1024
+
+
+class _NoReportData(LookupError):
+    """No data for the ticker: the message is returned to the caller but not cached"""
+
+
+def _report_day() -> str:
+    """Cache-key day, so memoized reports refresh daily"""
+    return datetime.now().strftime("%Y%m%d")
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _fundamentals_report(ticker: str, day: str) -> str:
+    # Use AKShare to get company overview
+    info_df = cached_call(ak.stock_individual_info_em, FUNDAMENTALS_TTL, symbol=ticker)
+
+    if info_df.empty:
+        raise _NoReportData(f"No fundamentals data found for stock {ticker}")
+
+    parts = [f"## {ticker} company overview:\n\n"]
+    parts.extend(
+        f"- {row.item}: {row.value}\n"
+        for row in _select_fields(info_df, _INFO_FIELDS).itertuples(index=False)
+    )
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _statement_report(fetch, title: str, ticker: str, day: str) -> str:
+    df = cached_call(fetch, FUNDAMENTALS_TTL, symbol=ticker)
+    if df.empty:
+        raise _NoReportData(f"No {title} found for stock {ticker}")
+
+    # Get most recent periods
+    return f"## {ticker} {title} (recent data):\n\n{df.head(5).to_string()}"
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _pledge_report(ticker: str, day: str) -> str:
+    # Stock pledge data as a proxy for insider transactions
+    df = cached_call(ak.stock_gpzy_pledge_ratio_em, FUNDAMENTALS_TTL)
+    # Filter for specific stock
+    if "\u80a1\u7968\u4ee3\u7801" in df.columns:
+        df = df[df["\u80a1\u7968\u4ee3\u7801"] == ticker]
+    elif "\u4ee3\u7801" in df.columns:
+        df = df[df["\u4ee3\u7801"] == ticker]
+
+    if df.empty:
+        raise _NoReportData(f"No shareholder transaction data found for stock {ticker}")
+
+    return f"## {ticker} shareholder pledge status:\n\n{df.head(10).to_string()}"
+
+
+def clear_fundamentals_cache() -> None:
+    """Drop the memoized fundamentals, statement and pledge reports"""
+    _fundamentals_report.cache_clear()
+    _statement_report.cache_clear()
+    _pledge_report.cache_clear()
+
+
 # === Company fundamentals ===
 def get_fundamentals(
     ticker: Annotated[str, "A-share stock code"],
@@ -303,20 +552,9 @@ def get_fundamentals(
         return "Error: akshare not installed"
 
     try:
-        # Use AKShare to get company overview
-        info_df = ak.stock_individual_info_em(symbol=ticker)
-
-        if info_df.empty:
-            return f"No fundamentals data found for stock {ticker}"
-
-        result = f"## {ticker} company overview:\n\n"
-        for _, row in info_df.iterrows():
-            item = row.get("item", row.get("\u9879\u76ee", ""))
-            value = row.get("value", row.get("\u503c", ""))
-            result += f"- {item}: {value}\n"
-
-        return result
-
+        return _fundamentals_report(ticker, _report_day())
+    except _NoReportData as e:
+        return str(e)
     except Exception as e:
         return f"Error fetching fundamentals data: {str(e)}"
 
@@ -332,14 +570,9 @@ def get_balance_sheet(
         return "Error: akshare not installed"
 
     try:
-        df = ak.stock_balance_sheet_by_report_em(symbol=ticker)
-        if df.empty:
-            return f"No balance sheet found for stock {ticker}"
-
-        # Get most recent periods
-        result = f"## {ticker} balance sheet (recent data):\n\n"
-        result += df.head(5).to_string()
-        return result
+        return _statement_report(ak.stock_balance_sheet_by_report_em, "balance sheet", ticker, _report_day())
+    except _NoReportData as e:
+        return str(e)
     except Exception as e:
         return f"Error fetching balance sheet: {str(e)}"
 
@@ -354,13 +587,9 @@ def get_cashflow(
         return "Error: akshare not installed"
 
     try:
-        df = ak.stock_cash_flow_sheet_by_report_em(symbol=ticker)
-        if df.empty:
-            return f"No cash flow statement found for stock {ticker}"
-
-        result = f"## {ticker} cash flow statement (recent data):\n\n"
-        result += df.head(5).to_string()
-        return result
+        return _statement_report(ak.stock_cash_flow_sheet_by_report_em, "cash flow statement", ticker, _report_day())
+    except _NoReportData as e:
+        return str(e)
     except Exception as e:
         return f"Error fetching cash flow statement: {str(e)}"
 
@@ -375,13 +604,9 @@ def get_income_statement(
         return "Error: akshare not installed"
 
     try:
-        df = ak.stock_profit_sheet_by_report_em(symbol=ticker)
-        if df.empty:
-            return f"No income statement found for stock {ticker}"
-
-        result = f"## {ticker} income statement (recent data):\n\n"
-        result += df.head(5).to_string()
-        return result
+        return _statement_report(ak.stock_profit_sheet_by_report_em, "income statement", ticker, _report_day())
+    except _NoReportData as e:
+        return str(e)
     except Exception as e:
         return f"Error fetching income statement: {str(e)}"
 
@@ -396,21 +621,9 @@ def get_insider_transactions(
         return "Error: akshare not installed"
 
     try:
-        # Stock pledge data as a proxy for insider transactions
-        df = ak.stock_gpzy_pledge_ratio_em()
-        # Filter for specific stock
-        if "\u80a1\u7968\u4ee3\u7801" in df.columns:
-            df = df[df["\u80a1\u7968\u4ee3\u7801"] == ticker]
-        elif "\u4ee3\u7801" in df.columns:
-            df = df[df["\u4ee3\u7801"] == ticker]
-
-        if df.empty:
-            return f"No shareholder transaction data found for stock {ticker}"
-
-        result = f"## {ticker} shareholder pledge status:\n\n"
-        result += df.head(10).to_string()
-        return result
-
+        return _pledge_report(ticker, _report_day())
+    except _NoReportData as e:
+        return str(e)
     except Exception as e:
         return f"Error fetching shareholder transaction data: {str(e)}"
 
@@ -421,3 +634,81 @@ def get_insider_sentiment(
 ) -> str:
     """Get insider sentiment (not directly supported for A-shares)"""
     return f"Insider sentiment indicators are not directly available for A-shares. Use major shareholder changes and stock pledge ratios as indirect measures (stock: {ticker})"
+
+
+# === Batch fetch ===
+# Concurrent AKShare requests (AKShare calls are network-bound and release the GIL)
+AK_MAX_WORKERS = int(os.getenv("TRADINGCREW_AK_WORKERS", "8"))
+
+
+def _fetch_jobs(ticker: str, start_date: str, end_date: str, curr_date: str) -> Dict[str, tuple]:
+    """Independent per-ticker fetches: {name: (function, args)}"""
+    return {
+        "stock_data": (get_stock_data, (ticker, start_date, end_date)),
+        "news": (get_news, (ticker, start_date, end_date)),
+        "fundamentals": (get_fundamentals, (ticker, curr_date)),
+        "balance_sheet": (get_balance_sheet, (ticker, "quarterly", curr_date)),
+        "cashflow": (get_cashflow, (ticker, "quarterly", curr_date)),
+        "income_statement": (get_income_statement, (ticker, "quarterly", curr_date)),
+    }
+
+
+def fetch_all(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    curr_date: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Fetch price data, news, fundamentals and financial statements concurrently
+
+    Args:
+        ticker: A-share stock code
+        start_date: Price/news start date yyyy-mm-dd
+        end_date: Price/news end date yyyy-mm-dd
+        curr_date: Date for fundamentals/statements (default end_date)
+
+    Returns:
+        {"stock_data": ..., "news": ..., "fundamentals": ..., "balance_sheet": ...,
+         "cashflow": ..., "income_statement": ...}
+    """
+    return fetch_many([ticker], start_date, end_date, curr_date)[ticker]
+
+
+def fetch_many(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    curr_date: Optional[str] = None,
+) -> Dict[str, Dict[str, str]]:
+    """
+    fetch_all for several tickers, sharing one worker pool
+
+    Args:
+        tickers: A-share stock codes
+        start_date: Price/news start date yyyy-mm-dd
+        end_date: Price/news end date yyyy-mm-dd
+        curr_date: Date for fundamentals/statements (default end_date)
+
+    Returns:
+        {ticker: fetch_all result}
+    """
+    curr_date = curr_date or end_date
+    jobs = {ticker: _fetch_jobs(ticker, start_date, end_date, curr_date) for ticker in tickers}
+    total = sum(len(ticker_jobs) for ticker_jobs in jobs.values())
+    if total == 0:
+        return {}
+
+    # Each getter reports its own errors as a string, so results never raise
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(AK_MAX_WORKERS, total)),
+        thread_name_prefix="akshare",
+    ) as pool:
+        futures = {
+            ticker: {name: pool.submit(func, *args) for name, (func, args) in ticker_jobs.items()}
+            for ticker, ticker_jobs in jobs.items()
+        }
+        return {
+            ticker: {name: future.result() for name, future in ticker_futures.items()}
+            for ticker, ticker_futures in futures.items()
+        }
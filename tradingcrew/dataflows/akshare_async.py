@@ -0,0 +1,226 @@
+"""
+Async AKShare A-share adapter
+
+Async variants of the akshare_astock getters, for callers already running in
+an event loop. Daily OHLCV goes straight to the East Money kline endpoint that
+ak.stock_zh_a_hist wraps, over a shared httpx.AsyncClient; the response is
+parsed exactly as AKShare parses it and stored in the AKShare cache, so sync
+callers (get_indicators, get_stock_data) reuse it. The other endpoints, and
+any failure on the direct path, run the sync getter in a worker thread.
+"""
+
+import asyncio
+import importlib.util
+import json
+import weakref
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._ak_cache import cache_lookup, cache_store, price_ttl
+from ._ak_session import POOL_SIZE
+from .akshare_astock import (
+    ak,
+    _fetch_jobs,
+    _format_stock_data,
+    get_balance_sheet,
+    get_cashflow,
+    get_fundamentals,
+    get_income_statement,
+    get_news,
+    get_stock_data,
+)
+
+
+# East Money daily kline endpoint (the one ak.stock_zh_a_hist calls)
+KLINE_URL = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+KLINE_TIMEOUT = 15.0
+
+# HTTP/2 needs the optional h2 package
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# stock_zh_a_hist column layout: kline fields, then the output column order
+_KLINE_COLUMNS = [
+    "\u65e5\u671f", "\u5f00\u76d8", "\u6536\u76d8", "\u6700\u9ad8", "\u6700\u4f4e",
+    "\u6210\u4ea4\u91cf", "\u6210\u4ea4\u989d", "\u632f\u5e45", "\u6da8\u8dcc\u5e45",
+    "\u6da8\u8dcc\u989d", "\u6362\u624b\u7387",
+]
+_HIST_COLUMNS = _KLINE_COLUMNS[:1] + ["\u80a1\u7968\u4ee3\u7801"] + _KLINE_COLUMNS[1:]
+_ADJUST_CODES = {"qfq": "1", "hfq": "2", "": "0"}
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# AsyncClient connections belong to the event loop that opened them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Shared keep-alive client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE),
+            timeout=KLINE_TIMEOUT,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_client() -> None:
+    """Close the running event loop's shared client (e.g. on service shutdown)"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _klines_to_frame(klines: List[str], symbol: str) -> pd.DataFrame:
+    """Parse kline rows the way ak.stock_zh_a_hist does"""
+    rows = [item.split(",") for item in klines]
+    if any(len(row) != len(_KLINE_COLUMNS) for row in rows):
+        raise ValueError("Unexpected kline field count")
+
+    df = pd.DataFrame(rows, columns=_KLINE_COLUMNS)
+    df["\u80a1\u7968\u4ee3\u7801"] = symbol
+    df["\u65e5\u671f"] = pd.to_datetime(df["\u65e5\u671f"], errors="coerce").dt.date
+    for col in _KLINE_COLUMNS[1:]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df[_HIST_COLUMNS]
+
+
+async def _afetch_hist(symbol: str, start_fmt: str, end_fmt: str, adjust: str = "qfq") -> pd.DataFrame:
+    """
+    Async ak.stock_zh_a_hist (daily), through the AKShare cache
+
+    Args:
+        symbol: A-share stock code
+        start_fmt: Start date yyyymmdd
+        end_fmt: End date yyyymmdd
+        adjust: "qfq", "hfq" or "" (unadjusted)
+
+    Returns:
+        DataFrame as returned by ak.stock_zh_a_hist (a copy, safe to modify)
+    """
+    kwargs = dict(symbol=symbol, period="daily", start_date=start_fmt, end_date=end_fmt, adjust=adjust)
+    ttl = price_ttl(end_fmt)
+    df = cache_lookup(ak.stock_zh_a_hist, ttl, **kwargs)
+    if df is not None:
+        return df
+
+    params = {
+        "fields1": "f1,f2,f3,f4,f5,f6",
+        "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f116",
+        "ut": "7eea3edcaed734bea9cbfc24409ed989",
+        "klt": "101",
+        "fqt": _ADJUST_CODES[adjust],
+        "secid": f"{1 if symbol.startswith('6') else 0}.{symbol}",
+        "beg": start_fmt,
+        "end": end_fmt,
+    }
+    resp = await _get_client().get(KLINE_URL, params=params)
+    resp.raise_for_status()
+    data = _loads(resp.content)["data"]
+    if not (data and data["klines"]):
+        return pd.DataFrame()
+
+    df = _klines_to_frame(data["klines"], symbol)
+    cache_store(ak.stock_zh_a_hist, ttl, df, **kwargs)
+    return df.copy()
+
+
+async def aget_stock_data(symbol: str, start_date: str, end_date: str) -> str:
+    """
+    Async get_stock_data: direct kline request, sync AKShare on any failure
+
+    Args:
+        symbol: Stock code, e.g. "600519" or "000001"
+        start_date: Start date yyyy-mm-dd
+        end_date: End date yyyy-mm-dd
+
+    Returns:
+        CSV-formatted stock data string
+    """
+    if ak is None:
+        return "Error: akshare not installed. Run: pip install akshare"
+
+    if httpx is not None:
+        try:
+            df = await _afetch_hist(symbol, start_date.replace("-", ""), end_date.replace("-", ""))
+            return _format_stock_data(df, symbol, start_date, end_date)
+        except Exception as e:
+            print(f"Warning: async kline fetch failed, falling back to AKShare: {e}")
+
+    return await asyncio.to_thread(get_stock_data, symbol, start_date, end_date)
+
+
+async def aget_news(ticker: str, start_date: str, end_date: str) -> str:
+    """Async get_news (sync getter in a worker thread)"""
+    return await asyncio.to_thread(get_news, ticker, start_date, end_date)
+
+
+async def aget_fundamentals(ticker: str, curr_date: Optional[str] = None) -> str:
+    """Async get_fundamentals (sync getter in a worker thread)"""
+    return await asyncio.to_thread(get_fundamentals, ticker, curr_date)
+
+
+async def aget_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: Optional[str] = None) -> str:
+    """Async get_balance_sheet (sync getter in a worker thread)"""
+    return await asyncio.to_thread(get_balance_sheet, ticker, freq, curr_date)
+
+
+async def aget_cashflow(ticker: str, freq: str = "quarterly", curr_date: Optional[str] = None) -> str:
+    """Async get_cashflow (sync getter in a worker thread)"""
+    return await asyncio.to_thread(get_cashflow, ticker, freq, curr_date)
+
+
+async def aget_income_statement(ticker: str, freq: str = "quarterly", curr_date: Optional[str] = None) -> str:
+    """Async get_income_statement (sync getter in a worker thread)"""
+    return await asyncio.to_thread(get_income_statement, ticker, freq, curr_date)
+
+
+# Sync getter -> async variant used by afetch_all
+_ASYNC_GETTERS = {
+    get_stock_data: aget_stock_data,
+    get_news: aget_news,
+    get_fundamentals: aget_fundamentals,
+    get_balance_sheet: aget_balance_sheet,
+    get_cashflow: aget_cashflow,
+    get_income_statement: aget_income_statement,
+}
+
+
+async def afetch_all(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    curr_date: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Async fetch_all: price data, news, fundamentals and statements concurrently
+
+    Args:
+        ticker: A-share stock code
+        start_date: Price/news start date yyyy-mm-dd
+        end_date: Price/news end date yyyy-mm-dd
+        curr_date: Date for fundamentals/statements (default end_date)
+
+    Returns:
+        Same keys as fetch_all
+    """
+    jobs = _fetch_jobs(ticker, start_date, end_date, curr_date or end_date)
+    # Each getter reports its own errors as a string, so gather never raises
+    results = await asyncio.gather(*(_ASYNC_GETTERS[func](*args) for func, args in jobs.values()))
+    return dict(zip(jobs, results))
@@ -13,10 +13,18 @@ DEFAULT_CONFIG = {
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    # Optional LLM API key (default: the provider's environment variable)
+    "api_key": None,
+    # Optional directory for caching LLM responses on disk (off when unset)
+    "llm_cache_dir": os.getenv("TRADINGCREW_LLM_CACHE_DIR"),
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Final states kept in memory per graph (oldest dropped first)
+    "max_log_states": 256,
+    # Optional Redis URL for sharing cached AKShare responses across processes
+    "akshare_cache_redis_url": os.getenv("TRADINGCREW_REDIS_URL"),
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
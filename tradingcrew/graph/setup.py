@@ -1,6 +1,9 @@
 # TradingCrew/graph/setup.py
 
+import asyncio
 from typing import Dict, Any
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import get_executor_for_config
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -11,6 +14,15 @@ from tradingcrew.agents.utils.agent_states import AgentState
 from .conditional_logic import ConditionalLogic
 
 
+# Analyst type -> state field holding its report
+ANALYST_REPORT_FIELDS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
 
@@ -65,28 +77,28 @@ class GraphSetup:
             analyst_nodes["market"] = create_market_analyst(
                 self.quick_thinking_llm
             )
-            delete_nodes["market"] = create_msg_delete()
+            delete_nodes["market"] = delete_messages
             tool_nodes["market"] = self.tool_nodes["market"]
 
         if "social" in selected_analysts:
             analyst_nodes["social"] = create_social_media_analyst(
                 self.quick_thinking_llm
             )
-            delete_nodes["social"] = create_msg_delete()
+            delete_nodes["social"] = delete_messages
             tool_nodes["social"] = self.tool_nodes["social"]
 
         if "news" in selected_analysts:
             analyst_nodes["news"] = create_news_analyst(
                 self.quick_thinking_llm
             )
-            delete_nodes["news"] = create_msg_delete()
+            delete_nodes["news"] = delete_messages
             tool_nodes["news"] = self.tool_nodes["news"]
 
         if "fundamentals" in selected_analysts:
             analyst_nodes["fundamentals"] = create_fundamentals_analyst(
                 self.quick_thinking_llm
             )
-            delete_nodes["fundamentals"] = create_msg_delete()
+            delete_nodes["fundamentals"] = delete_messages
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
         # Create researcher and manager nodes
@@ -109,18 +121,20 @@ class GraphSetup:
             self.deep_thinking_llm, self.risk_manager_memory
         )
 
+        # Each analyst runs its own tool loop in a subgraph with a private
+        # message history, so the analysts can run concurrently
+        analyst_graphs = {
+            analyst_type: self._build_analyst_graph(
+                analyst_type, node, delete_nodes[analyst_type], tool_nodes[analyst_type]
+            )
+            for analyst_type, node in analyst_nodes.items()
+        }
+
         # Create workflow
         workflow = StateGraph(AgentState)
 
-        # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
-
-        # Add other nodes
+        # Add the analyst fan-out node and the other nodes
+        workflow.add_node("Parallel Analysts", self._create_parallel_analysts(analyst_graphs))
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
@@ -131,30 +145,9 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        # All analysts run first, then the debate starts
+        workflow.add_edge(START, "Parallel Analysts")
+        workflow.add_edge("Parallel Analysts", "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -204,3 +197,60 @@ class GraphSetup:
 
         # Compile and return
         return workflow.compile()
+
+    def _build_analyst_graph(self, analyst_type, analyst_node, delete_node, tool_node):
+        """Compile one analyst's tool loop (analyst -> tools -> analyst ... -> clear)."""
+        name = analyst_type.capitalize()
+        current_analyst = f"{name} Analyst"
+        current_tools = f"tools_{analyst_type}"
+        current_clear = f"Msg Clear {name}"
+
+        graph = StateGraph(AgentState)
+        graph.add_node(current_analyst, analyst_node)
+        graph.add_node(current_clear, delete_node)
+        graph.add_node(current_tools, tool_node)
+
+        graph.add_edge(START, current_analyst)
+        graph.add_conditional_edges(
+            current_analyst,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            [current_tools, current_clear],
+        )
+        graph.add_edge(current_tools, current_analyst)
+        graph.add_edge(current_clear, END)
+
+        return graph.compile()
+
+    def _create_parallel_analysts(self, analyst_graphs):
+        """Create the node that runs every analyst subgraph concurrently.
+
+        The analysts have no data dependency on each other, so their LLM and
+        tool latency overlaps instead of adding up. Sync runs use a thread per
+        analyst, async runs gather the subgraphs on the event loop.
+        """
+
+        def merge(state, results):
+            update = {
+                ANALYST_REPORT_FIELDS[analyst_type]: result[ANALYST_REPORT_FIELDS[analyst_type]]
+                for analyst_type, result in zip(analyst_graphs, results)
+            }
+            # Leave the shared history as the last Msg Clear node used to
+            update.update(delete_messages(state))
+            return update
+
+        def parallel_analysts(state, config: RunnableConfig):
+            with get_executor_for_config(config) as executor:
+                futures = [
+                    executor.submit(graph.invoke, state, config)
+                    for graph in analyst_graphs.values()
+                ]
+                results = [future.result() for future in futures]
+            return merge(state, results)
+
+        async def aparallel_analysts(state, config: RunnableConfig):
+            results = await asyncio.gather(
+                *(graph.ainvoke(state, config) for graph in analyst_graphs.values())
+            )
+            return merge(state, results)
+
+        return RunnableLambda(parallel_analysts, afunc=aparallel_analysts, name="Parallel Analysts")
@@ -1,8 +1,18 @@
 # TradingCrew/graph/signal_processing.py
 
+import re
+
 from langchain_openai import ChatOpenAI
 
 
+# Explicit decision marker on the last line: "FINAL TRANSACTION PROPOSAL: **BUY**".
+# Only a trailing marker is the judge's own verdict; markers earlier in the
+# text quote the trader's plan, and a bare bold "**BUY**" quotes the analysts.
+# The "BUY/HOLD/SELL" prompt template is not a decision. Matched against
+# upper-cased text: a case-sensitive match is much faster than re.IGNORECASE
+_DECISION_RE = re.compile(r"[\s*#_]*FINAL TRANSACTION PROPOSAL:[\s*_]*(BUY|SELL|HOLD)[\s*_.!]*")
+
+
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
@@ -14,12 +24,19 @@ class SignalProcessor:
         """
         Process a full trading signal to extract the core decision.
 
+        Signals ending with a FINAL TRANSACTION PROPOSAL marker are parsed locally;
+        only ambiguous ones cost an LLM round trip.
+
         Args:
             full_signal: Complete trading signal text
 
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
+        decision = self._parse_explicit_decision(full_signal)
+        if decision is not None:
+            return decision
+
         messages = [
             (
                 "system",
@@ -29,3 +46,10 @@ class SignalProcessor:
         ]
 
         return self.quick_thinking_llm.invoke(messages).content
+
+    @staticmethod
+    def _parse_explicit_decision(full_signal: str):
+        """Return the decision stated by a trailing marker, else None."""
+        last_line = (full_signal or "").rstrip().rsplit("\n", 1)[-1]
+        match = _DECISION_RE.fullmatch(last_line.upper())
+        return match.group(1) if match else None
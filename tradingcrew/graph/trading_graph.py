@@ -1,21 +1,33 @@
 # TradingCrew/graph/trading_graph.py
 
+import asyncio
+import contextlib
+import importlib.util
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
+import httpx
 from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from langgraph.prebuilt import ToolNode
 
+# Fast JSON encoder (stdlib json is used when unavailable)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from tradingcrew.agents import *
 from tradingcrew.default_config import DEFAULT_CONFIG
 # ChromaDB memory disabled for concurrency performance
 # from tradingcrew.agents.utils.memory import FinancialSituationMemory
+from tradingcrew.agents.utils.llm_cache import FileLLMCache
 from tradingcrew.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -44,6 +56,208 @@ from .reflection import Reflector
 from .signal_processing import SignalProcessor
 
 
+# Events buffered between the graph run and a propagate_streaming consumer
+STREAM_QUEUE_SIZE = 1024
+_STREAM_END = object()
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process (later calls skip the mkdir syscalls)."""
+    os.makedirs(path, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _shared_tool_nodes() -> Dict[str, ToolNode]:
+    """Tool nodes per analyst, built once and shared by every graph (they hold no per-run state)."""
+    return {
+        "market": ToolNode(
+            [
+                # Core stock data tools
+                get_stock_data,
+                # Technical indicators
+                get_indicators,
+            ]
+        ),
+        "social": ToolNode(
+            [
+                # News tools for social media analysis
+                get_news,
+            ]
+        ),
+        "news": ToolNode(
+            [
+                # News and insider information
+                get_news,
+                get_global_news,
+                get_insider_sentiment,
+                get_insider_transactions,
+            ]
+        ),
+        "fundamentals": ToolNode(
+            [
+                # Fundamental analysis tools
+                get_fundamentals,
+                get_balance_sheet,
+                get_cashflow,
+                get_income_statement,
+            ]
+        ),
+    }
+
+
+# HTTP/2 needs the optional h2 package
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Connections per OpenAI-compatible backend, shared by all its models
+LLM_MAX_CONNECTIONS = 64
+LLM_MAX_KEEPALIVE = 32
+
+
+@lru_cache(maxsize=None)
+def _openai_http_clients(base_url: Optional[str], timeout: int) -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """HTTP/2 sync and async clients for one backend, so its concurrent LLM calls share a connection."""
+    limits = httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS, max_keepalive_connections=LLM_MAX_KEEPALIVE
+    )
+    return (
+        httpx.Client(http2=True, limits=limits, timeout=timeout),
+        httpx.AsyncClient(http2=True, limits=limits, timeout=timeout),
+    )
+
+
+def _date_key(trade_date) -> Any:
+    """log_states_dict key: the trade date as a date (str when not ISO formatted)"""
+    if isinstance(trade_date, date):
+        return trade_date
+    try:
+        return date.fromisoformat(str(trade_date))
+    except ValueError:
+        return str(trade_date)
+
+
+# Provider -> environment variable holding its API key
+_PROVIDER_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "dashscope": "DASHSCOPE_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+}
+
+
+def _resolve_api_key(config: Dict[str, Any], provider: str) -> Optional[str]:
+    """API key for the provider: config "api_key", else the provider's own env var.
+
+    OPENAI_API_KEY is only a fallback for OpenAI-compatible providers: the
+    market config getters overwrite it per call, so reading it here could pick
+    up another provider's key.
+    """
+    env_var = _PROVIDER_KEY_ENV.get(provider)
+    api_key = config.get("api_key") or (os.getenv(env_var) if env_var else None)
+    if not api_key and provider in ["ollama", "openrouter", "dashscope"]:
+        api_key = os.getenv("OPENAI_API_KEY")
+    return api_key or None
+
+
+@lru_cache(maxsize=None)
+def _llm_cache(cache_dir: str) -> FileLLMCache:
+    """One response cache per directory, shared by every client using it."""
+    return FileLLMCache(cache_dir)
+
+
+@lru_cache(maxsize=32)
+def _build_llm(
+    provider: str,
+    model: str,
+    base_url: Optional[str],
+    timeout: int,
+    cache_dir: Optional[str] = None,
+    api_key: Optional[str] = None,
+):
+    """Create a chat model client, shared by every graph with the same settings.
+
+    Client construction sets up HTTP clients and TLS contexts; sharing the
+    instance also shares its connection pool across graphs. The Anthropic and
+    Google SDKs are imported only when selected (each adds ~0.5s of imports).
+    With a cache_dir, responses are cached on disk (see llm_cache). The API
+    key is passed explicitly (and is part of the cache key), so a shared
+    client never depends on what the environment held when it was built.
+    """
+    # None leaves LangChain's default (global cache, if any) in place
+    cache = _llm_cache(cache_dir) if cache_dir else None
+    # No key: let the client library read its default environment variable
+    key_kwargs = {"api_key": api_key} if api_key else {}
+
+    if provider in ["openai", "ollama", "openrouter", "dashscope"]:
+        # Without h2, langchain_openai's default clients (already shared per
+        # base URL and timeout) are used
+        http_client, http_async_client = (
+            _openai_http_clients(base_url, timeout) if _HTTP2 else (None, None)
+        )
+        return ChatOpenAI(
+            model=model,
+            base_url=base_url,
+            streaming=True,
+            request_timeout=timeout,
+            cache=cache,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            **key_kwargs,
+        )
+    elif provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model,
+            base_url=base_url,
+            streaming=True,
+            timeout=timeout,
+            cache=cache,
+            **key_kwargs,
+        )
+    elif provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model,
+            timeout=timeout,
+            cache=cache,
+            **({"google_api_key": api_key} if api_key else {}),
+        )
+    raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+@lru_cache(maxsize=16)
+def _compile_graph(
+    analysts: Tuple[str, ...],
+    provider: str,
+    deep_model: str,
+    quick_model: str,
+    base_url: Optional[str],
+    timeout: int,
+    cache_dir: Optional[str] = None,
+    api_key: Optional[str] = None,
+):
+    """Compile the agent graph, shared by every graph with the same analysts and LLMs.
+
+    The compiled graph holds no per-run state, so graphs built from the same
+    settings reuse one instead of rebuilding and validating it each time.
+    """
+    graph_setup = GraphSetup(
+        _build_llm(provider, quick_model, base_url, timeout, cache_dir, api_key),
+        _build_llm(provider, deep_model, base_url, timeout, cache_dir, api_key),
+        dict(_shared_tool_nodes()),
+        None,  # bull_memory disabled
+        None,  # bear_memory disabled
+        None,  # trader_memory disabled
+        None,  # invest_judge_memory disabled
+        None,  # risk_manager_memory disabled
+        ConditionalLogic(),
+    )
+    return graph_setup.setup_graph(list(analysts))
+
+
 class TradingCrewGraph:
     """Main class that orchestrates the trading agents framework."""
 
@@ -67,53 +281,23 @@ class TradingCrewGraph:
         set_config(self.config)
 
         # Create necessary directories
-        os.makedirs(
-            os.path.join(self.config["project_dir"], "dataflows/data_cache"),
-            exist_ok=True,
-        )
+        _ensure_dir(os.path.join(self.config["project_dir"], "dataflows/data_cache"))
 
         # Initialize LLMs with streaming enabled
         # Set longer timeout (5 minutes) for cross-border network latency
         llm_timeout = self.config.get("llm_timeout", 300)
 
-        if self.config["llm_provider"].lower() in ["openai", "ollama", "openrouter", "dashscope"]:
-            self.deep_thinking_llm = ChatOpenAI(
-                model=self.config["deep_think_llm"],
-                base_url=self.config["backend_url"],
-                streaming=True,
-                request_timeout=llm_timeout,
-            )
-            self.quick_thinking_llm = ChatOpenAI(
-                model=self.config["quick_think_llm"],
-                base_url=self.config["backend_url"],
-                streaming=True,
-                request_timeout=llm_timeout,
-            )
-        elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(
-                model=self.config["deep_think_llm"],
-                base_url=self.config["backend_url"],
-                streaming=True,
-                timeout=llm_timeout,
-            )
-            self.quick_thinking_llm = ChatAnthropic(
-                model=self.config["quick_think_llm"],
-                base_url=self.config["backend_url"],
-                streaming=True,
-                timeout=llm_timeout,
-            )
-        elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(
-                model=self.config["deep_think_llm"],
-                timeout=llm_timeout,
-            )
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(
-                model=self.config["quick_think_llm"],
-                timeout=llm_timeout,
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
-        
+        provider = self.config["llm_provider"].lower()
+        backend_url = self.config["backend_url"]
+        cache_dir = self.config.get("llm_cache_dir")
+        api_key = _resolve_api_key(self.config, provider)
+        self.deep_thinking_llm = _build_llm(
+            provider, self.config["deep_think_llm"], backend_url, llm_timeout, cache_dir, api_key
+        )
+        self.quick_thinking_llm = _build_llm(
+            provider, self.config["quick_think_llm"], backend_url, llm_timeout, cache_dir, api_key
+        )
+
         # ChromaDB memory disabled for concurrency performance
         # Each session would create separate ChromaDB instances causing lock contention
         # self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
@@ -126,19 +310,6 @@ class TradingCrewGraph:
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
-        self.graph_setup = GraphSetup(
-            self.quick_thinking_llm,
-            self.deep_thinking_llm,
-            self.tool_nodes,
-            None,  # bull_memory disabled
-            None,  # bear_memory disabled
-            None,  # trader_memory disabled
-            None,  # invest_judge_memory disabled
-            None,  # risk_manager_memory disabled
-            self.conditional_logic,
-        )
-
         self.propagator = Propagator()
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
@@ -146,47 +317,24 @@ class TradingCrewGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
-
-        # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.log_states_dict = OrderedDict()  # date to full state dict, oldest first
+        self.max_log_states = self.config.get("max_log_states", 256)
+
+        # Set up the graph (analyst order does not affect it)
+        self.graph = _compile_graph(
+            tuple(sorted(set(selected_analysts))),
+            provider,
+            self.config["deep_think_llm"],
+            self.config["quick_think_llm"],
+            backend_url,
+            llm_timeout,
+            cache_dir,
+            api_key,
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
-        return {
-            "market": ToolNode(
-                [
-                    # Core stock data tools
-                    get_stock_data,
-                    # Technical indicators
-                    get_indicators,
-                ]
-            ),
-            "social": ToolNode(
-                [
-                    # News tools for social media analysis
-                    get_news,
-                ]
-            ),
-            "news": ToolNode(
-                [
-                    # News and insider information
-                    get_news,
-                    get_global_news,
-                    get_insider_sentiment,
-                    get_insider_transactions,
-                ]
-            ),
-            "fundamentals": ToolNode(
-                [
-                    # Fundamental analysis tools
-                    get_fundamentals,
-                    get_balance_sheet,
-                    get_cashflow,
-                    get_income_statement,
-                ]
-            ),
-        }
+        return dict(_shared_tool_nodes())
 
     def propagate(self, company_name, trade_date):
         """Run the trading agents graph for a company on a specific date."""
@@ -200,20 +348,51 @@ class TradingCrewGraph:
         args = self.propagator.get_graph_args()
 
         if self.debug:
-            # Debug mode with tracing
-            trace = []
+            # Debug mode with tracing; only the last state is kept
+            final_state = None
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
+                if chunk["messages"]:
                     chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
-
-            final_state = trace[-1]
+                final_state = chunk
         else:
             # Standard mode without tracing
             final_state = self.graph.invoke(init_agent_state, **args)
 
+        return self._finish_propagation(trade_date, final_state)
+
+    async def apropagate(self, company_name, trade_date):
+        """Async propagate, for callers already running in an event loop."""
+
+        self.ticker = company_name
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing; only the last state is kept
+            final_state = None
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                if chunk["messages"]:
+                    chunk["messages"][-1].pretty_print()
+                final_state = chunk
+        else:
+            # Standard mode without tracing
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state without blocking the event loop on file I/O
+        await asyncio.to_thread(self._log_state, trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def _finish_propagation(self, trade_date, final_state):
+        """Store and log the final state, then return it with the processed signal."""
         # Store current state for reflection
         self.curr_state = final_state
 
@@ -225,7 +404,7 @@ class TradingCrewGraph:
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -255,39 +434,66 @@ class TradingCrewGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingCrewStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+        key = _date_key(trade_date)
+        self.log_states_dict[key] = entry
+        self.log_states_dict.move_to_end(key)
+        while len(self.log_states_dict) > self.max_log_states:
+            self.log_states_dict.popitem(last=False)
 
-        with open(
-            f"eval_results/{self.ticker}/TradingCrewStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        # Save to file: each date's file holds only that date's state, so the
+        # write does not grow with the number of dates already logged
+        directory = os.path.abspath(f"eval_results/{self.ticker}/TradingCrewStrategy_logs/")
+        _ensure_dir(directory)
+        path = Path(directory) / f"full_states_log_{trade_date}.json"
+
+        if orjson is not None:
+            path.write_bytes(orjson.dumps({str(trade_date): entry}, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump({str(trade_date): entry}, f, indent=4)
+
+    def _reflection_jobs(self):
+        """(reflect method, memory) pairs for the memories that are enabled."""
+        jobs = [
+            (self.reflector.reflect_bull_researcher, "bull_memory"),
+            (self.reflector.reflect_bear_researcher, "bear_memory"),
+            (self.reflector.reflect_trader, "trader_memory"),
+            (self.reflector.reflect_invest_judge, "invest_judge_memory"),
+            (self.reflector.reflect_risk_manager, "risk_manager_memory"),
+        ]
+        return [
+            (reflect, getattr(self, name))
+            for reflect, name in jobs
+            if getattr(self, name, None) is not None
+        ]
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns.
 
+        The reflections are independent LLM calls, so they run concurrently.
+
         Note: Memory is currently disabled for concurrency performance.
         This method is a no-op until memory is re-enabled.
         """
-        # Memory disabled - skip reflection
-        pass
-        # self.reflector.reflect_bull_researcher(
-        #     self.curr_state, returns_losses, self.bull_memory
-        # )
-        # self.reflector.reflect_bear_researcher(
-        #     self.curr_state, returns_losses, self.bear_memory
-        # )
-        # self.reflector.reflect_trader(
-        #     self.curr_state, returns_losses, self.trader_memory
-        # )
-        # self.reflector.reflect_invest_judge(
-        #     self.curr_state, returns_losses, self.invest_judge_memory
-        # )
-        # self.reflector.reflect_risk_manager(
-        #     self.curr_state, returns_losses, self.risk_manager_memory
-        # )
+        jobs = self._reflection_jobs()
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [
+                executor.submit(reflect, self.curr_state, returns_losses, memory)
+                for reflect, memory in jobs
+            ]
+            for future in futures:
+                future.result()
+
+    async def areflect_and_remember(self, returns_losses):
+        """Async reflect_and_remember, for callers already running in an event loop."""
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(reflect, self.curr_state, returns_losses, memory)
+                for reflect, memory in self._reflection_jobs()
+            )
+        )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
@@ -297,12 +503,43 @@ class TradingCrewGraph:
         """
         Run the trading agents graph with token-level streaming.
 
+        The graph runs in a background task that fills a bounded queue, so a
+        consumer that is briefly slow (e.g. an SSE client) does not stall
+        reading the LLM responses.
+
         Yields:
             (event_type, node_name, content) tuples:
             - ("node_start", node_name, None): Node started processing
             - ("token", node_name, token): Token from LLM response
             - ("node_end", node_name, full_content): Node finished, with full content
         """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+        async def pump():
+            try:
+                async for event in self._stream_events(company_name, trade_date):
+                    await queue.put(event)
+            except Exception as e:
+                # Re-raised on the consumer side
+                await queue.put(e)
+            else:
+                await queue.put(_STREAM_END)
+
+        task = asyncio.create_task(pump())
+        try:
+            while (item := await queue.get()) is not _STREAM_END:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Consumer stopped early (or the stream failed): stop the graph run
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def _stream_events(self, company_name, trade_date):
+        """Event generator behind propagate_streaming (same event tuples)."""
         self.ticker = company_name
 
         # Initialize state
@@ -313,48 +550,48 @@ class TradingCrewGraph:
         # Remove stream_mode from args since we use a different mode for token streaming
         config = args.get("config", {})
 
-        current_node = None
-        accumulated_tokens = {}
+        # Per-node token buffers, joined once per node_end
+        accumulated_tokens: Dict[str, List[str]] = {}
         final_decision = "HOLD"
 
-        # Use astream with messages mode for token-level streaming
-        async for event in self.graph.astream(init_agent_state, stream_mode="messages", config=config):
-            # event is a tuple: (message_chunk, metadata)
-            if isinstance(event, tuple) and len(event) == 2:
+        # messages mode carries the tokens, updates mode marks when a node has
+        # finished; the analysts run concurrently inside subgraphs, so their
+        # tokens interleave and a change of node does not mean the last one ended
+        async for _namespace, mode, event in self.graph.astream(
+            init_agent_state,
+            stream_mode=["messages", "updates"],
+            config=config,
+            subgraphs=True,
+        ):
+            if mode == "messages":
+                # event is a tuple: (message_chunk, metadata)
                 chunk, metadata = event
-
-                # Get node name from metadata
                 node_name = metadata.get("langgraph_node", "")
+                if not node_name:
+                    continue
 
-                # Track node transitions
-                if node_name and node_name != current_node:
-                    # If we had a previous node, emit node_end
-                    if current_node and current_node in accumulated_tokens:
-                        yield ("node_end", current_node, accumulated_tokens[current_node])
-
-                        # If this was portfolio_manager, extract decision from content
-                        if current_node == "portfolio_manager":
-                            final_decision = self.process_signal(accumulated_tokens[current_node])
-
-                    # Emit node_start for new node
-                    current_node = node_name
-                    if node_name not in accumulated_tokens:
-                        accumulated_tokens[node_name] = ""
-                        yield ("node_start", node_name, None)
+                buffer = accumulated_tokens.get(node_name)
+                if buffer is None:
+                    buffer = accumulated_tokens[node_name] = []
+                    yield ("node_start", node_name, None)
 
                 # Extract token content from chunk
-                if hasattr(chunk, 'content') and chunk.content:
-                    token = chunk.content
-                    if current_node:
-                        accumulated_tokens[current_node] += token
-                        yield ("token", current_node, token)
-
-        # Emit final node_end if needed
-        if current_node and current_node in accumulated_tokens:
-            yield ("node_end", current_node, accumulated_tokens[current_node])
-
-            # If this was portfolio_manager, extract decision
-            if current_node == "portfolio_manager":
-                final_decision = self.process_signal(accumulated_tokens[current_node])
+                token = getattr(chunk, "content", None)
+                if token:
+                    buffer.append(token)
+                    yield ("token", node_name, token)
+
+            else:
+                # event maps each node that just finished to its state update
+                for node_name in event:
+                    buffer = accumulated_tokens.get(node_name)
+                    if buffer is None:
+                        continue
+                    full_content = "".join(buffer)
+                    yield ("node_end", node_name, full_content)
+
+                    # If this was portfolio_manager, extract decision from content
+                    if node_name == "portfolio_manager":
+                        final_decision = self.process_signal(full_content)
 
         yield ("complete", None, final_decision)
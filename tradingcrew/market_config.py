@@ -4,6 +4,10 @@ Multi-market configuration module
 Supports configuration management for A-share, US, and HK stock markets.
 """
 
+import re
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional
+
 from tradingcrew.default_config import DEFAULT_CONFIG
 
 
@@ -11,52 +15,95 @@ from tradingcrew.default_config import DEFAULT_CONFIG
 # Market definitions
 # ============================================================
 
-MARKET_INFO = {
-    "A-share": {
+MARKET_INFO = MappingProxyType({
+    "A-share": MappingProxyType({
         "name": "A-Share",
         "name_en": "A-Share (China)",
         "currency": "CNY",
         "trading_hours": "09:30-11:30, 13:00-15:00",
         "timezone": "Asia/Shanghai",
         "code_format": "6-digit number (e.g. 600519, 000001)",
-        "code_example": ["600519", "000858", "300750"],
+        "code_example": ("600519", "000858", "300750"),
         "data_vendor": "akshare",
-    },
-    "US": {
+    }),
+    "US": MappingProxyType({
         "name": "US Stock",
         "name_en": "US Stock",
         "currency": "USD",
         "trading_hours": "09:30-16:00 ET",
         "timezone": "America/New_York",
         "code_format": "Letter ticker (e.g. AAPL, MSFT)",
-        "code_example": ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"],
+        "code_example": ("AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"),
         "data_vendor": "yfinance",
-    },
-    "HK": {
+    }),
+    "HK": MappingProxyType({
         "name": "HK Stock",
         "name_en": "HK Stock",
         "currency": "HKD",
         "trading_hours": "09:30-12:00, 13:00-16:00 HKT",
         "timezone": "Asia/Hong_Kong",
         "code_format": "Number.HK (e.g. 0700.HK, 9988.HK)",
-        "code_example": ["0700.HK", "9988.HK", "0005.HK"],
+        "code_example": ("0700.HK", "9988.HK", "0005.HK"),
         "data_vendor": "yfinance",
-    },
-}
+    }),
+})
+
+
+# Ticker formats per market (see MARKET_INFO "code_format"), as one
+# alternation so a code is classified in a single match
+_TICKER_RE = re.compile(
+    r"(?P<a_share>\d{6})"
+    r"|(?P<hk>\d{4,5}(?i:\.HK))"
+    r"|(?P<us>[A-Z]{1,5})"
+)
+_TICKER_GROUP_MARKETS = {"a_share": "A-share", "hk": "HK", "us": "US"}
+
+
+def classify_ticker(code: str) -> Optional[str]:
+    """
+    Identify the market of a ticker from its format
+
+    Args:
+        code: Stock code, e.g. "600519", "AAPL", "0700.HK"
+
+    Returns:
+        "A-share", "US" or "HK", or None if the code matches no market format
+    """
+    match = _TICKER_RE.fullmatch(code.strip())
+    return _TICKER_GROUP_MARKETS[match.lastgroup] if match else None
+
+
+def classify_tickers(codes: Iterable[str]) -> List[Optional[str]]:
+    """
+    classify_ticker for many codes (e.g. a screening universe)
+
+    Args:
+        codes: Stock codes
+
+    Returns:
+        Market of each code, in order (None where unrecognized)
+    """
+    fullmatch = _TICKER_RE.fullmatch
+    markets = _TICKER_GROUP_MARKETS
+    return [
+        markets[match.lastgroup] if (match := fullmatch(code.strip())) else None
+        for code in codes
+    ]
 
 
 # ============================================================
 # A-share configuration
 # ============================================================
 
-ASTOCK_CONFIG = DEFAULT_CONFIG.copy()
-ASTOCK_CONFIG.update({
-    "data_vendors": {
+ASTOCK_CONFIG = MappingProxyType({
+    **DEFAULT_CONFIG,
+    "data_vendors": MappingProxyType({
         "core_stock_apis": "akshare",
         "technical_indicators": "akshare",
         "fundamental_data": "akshare",
         "news_data": "akshare",
-    },
+    }),
+    "tool_vendors": MappingProxyType(dict(DEFAULT_CONFIG["tool_vendors"])),
     "market": "A-share",
     "currency": "CNY",
     "trading_hours": "09:30-15:00",
@@ -67,14 +114,15 @@ ASTOCK_CONFIG.update({
 # US stock configuration
 # ============================================================
 
-USSTOCK_CONFIG = DEFAULT_CONFIG.copy()
-USSTOCK_CONFIG.update({
-    "data_vendors": {
+USSTOCK_CONFIG = MappingProxyType({
+    **DEFAULT_CONFIG,
+    "data_vendors": MappingProxyType({
         "core_stock_apis": "yfinance",
         "technical_indicators": "yfinance",
         "fundamental_data": "yfinance,alpha_vantage",  # yfinance primary, alpha_vantage fallback
         "news_data": "alpha_vantage,google",
-    },
+    }),
+    "tool_vendors": MappingProxyType(dict(DEFAULT_CONFIG["tool_vendors"])),
     "market": "US",
     "currency": "USD",
     "trading_hours": "09:30-16:00 ET",
@@ -85,24 +133,51 @@ USSTOCK_CONFIG.update({
 # HK stock configuration
 # ============================================================
 
-HKSTOCK_CONFIG = DEFAULT_CONFIG.copy()
-HKSTOCK_CONFIG.update({
-    "data_vendors": {
+HKSTOCK_CONFIG = MappingProxyType({
+    **DEFAULT_CONFIG,
+    "data_vendors": MappingProxyType({
         "core_stock_apis": "yfinance",
         "technical_indicators": "yfinance",
         "fundamental_data": "yfinance",
         "news_data": "google",  # HK stock news via Google News
-    },
+    }),
+    "tool_vendors": MappingProxyType(dict(DEFAULT_CONFIG["tool_vendors"])),
     "market": "HK",
     "currency": "HKD",
     "trading_hours": "09:30-16:00 HKT",
 })
 
 
+# Market -> base configuration
+_MARKET_CONFIGS = MappingProxyType({
+    "A-share": ASTOCK_CONFIG,
+    "US": USSTOCK_CONFIG,
+    "HK": HKSTOCK_CONFIG,
+})
+
+
 # ============================================================
 # Configuration getter functions
 # ============================================================
 
+def _market_base(market: str) -> dict:
+    """
+    Base configuration for a market as a new plain dict
+
+    The nested mappings (data_vendors, tool_vendors) are copied to plain dicts
+    too, so returned configs can be modified, deep-copied, pickled and
+    JSON-encoded without touching the read-only module constants.
+    """
+    try:
+        base = _MARKET_CONFIGS[market]
+    except KeyError:
+        raise ValueError(f"Unsupported market: {market}") from None
+    return {
+        key: dict(value) if isinstance(value, Mapping) else value
+        for key, value in base.items()
+    }
+
+
 def get_market_config(
     market: str,
     llm_provider: str = None,
@@ -125,29 +200,18 @@ def get_market_config(
     Returns:
         Configuration dictionary
     """
-    # Select base config
-    if market == "A-share":
-        config = ASTOCK_CONFIG.copy()
-    elif market == "US":
-        config = USSTOCK_CONFIG.copy()
-    elif market == "HK":
-        config = HKSTOCK_CONFIG.copy()
-    else:
-        raise ValueError(f"Unsupported market: {market}")
-
-    # Override optional parameters
-    if llm_provider is not None:
-        config["llm_provider"] = llm_provider
-    if deep_think_llm is not None:
-        config["deep_think_llm"] = deep_think_llm
-    if quick_think_llm is not None:
-        config["quick_think_llm"] = quick_think_llm
-    if max_debate_rounds is not None:
-        config["max_debate_rounds"] = max_debate_rounds
-    if max_risk_discuss_rounds is not None:
-        config["max_risk_discuss_rounds"] = max_risk_discuss_rounds
-
-    return config
+    overrides = {
+        key: value
+        for key, value in (
+            ("llm_provider", llm_provider),
+            ("deep_think_llm", deep_think_llm),
+            ("quick_think_llm", quick_think_llm),
+            ("max_debate_rounds", max_debate_rounds),
+            ("max_risk_discuss_rounds", max_risk_discuss_rounds),
+        )
+        if value is not None
+    }
+    return {**_market_base(market), **overrides}
 
 
 def get_openai_config(
@@ -170,58 +234,57 @@ def get_openai_config(
     Returns:
         Configuration dictionary
     """
-    config = get_market_config(market)
-    config.update({
+    return {
+        **_market_base(market),
         "llm_provider": "openai",
         "deep_think_llm": deep_think_model,
         "quick_think_llm": quick_think_model,
         "max_debate_rounds": max_debate_rounds,
         "max_risk_discuss_rounds": max_risk_discuss_rounds,
-    })
-    return config
+    }
 
 
 # ============================================================
 # Model presets
 # ============================================================
 
-MODEL_PRESETS = {
-    "deepseek-v3": {
+MODEL_PRESETS = MappingProxyType({
+    "deepseek-v3": MappingProxyType({
         "name": "DeepSeek V3",
         "description": "High cost-effectiveness, strong trading performance",
         "provider": "dashscope",
         "deep_think_model": "deepseek-v3",
         "quick_think_model": "deepseek-v3",
-    },
-    "qwen3-max": {
+    }),
+    "qwen3-max": MappingProxyType({
         "name": "Qwen3 Max",
         "description": "Top trading competition performer, highest returns",
         "provider": "dashscope",
         "deep_think_model": "qwen3-max",
         "quick_think_model": "qwen3-max",
-    },
-    "gpt-4o": {
+    }),
+    "gpt-4o": MappingProxyType({
         "name": "GPT-4o",
         "description": "OpenAI GPT-4o via OpenRouter",
         "provider": "openrouter",
         "deep_think_model": "openai/gpt-4o",
         "quick_think_model": "openai/gpt-4o-mini",
-    },
-    "claude-sonnet-4": {
+    }),
+    "claude-sonnet-4": MappingProxyType({
         "name": "Claude Sonnet 4",
         "description": "Anthropic Claude Sonnet 4 via OpenRouter",
         "provider": "openrouter",
         "deep_think_model": "anthropic/claude-sonnet-4",
         "quick_think_model": "anthropic/claude-sonnet-4",
-    },
-    "deepseek/deepseek-chat-v3-0324": {
+    }),
+    "deepseek/deepseek-chat-v3-0324": MappingProxyType({
         "name": "DeepSeek V3 (OpenRouter)",
         "description": "DeepSeek V3 via OpenRouter",
         "provider": "openrouter",
         "deep_think_model": "deepseek/deepseek-chat-v3-0324",
         "quick_think_model": "deepseek/deepseek-chat-v3-0324",
-    },
-}
+    }),
+})
 
 
 def get_dashscope_config(
@@ -258,16 +321,15 @@ def get_dashscope_config(
     # Get model preset
     preset = MODEL_PRESETS.get(model, MODEL_PRESETS["deepseek-v3"])
 
-    config = get_market_config(market)
-    config.update({
+    return {
+        **_market_base(market),
         "llm_provider": "dashscope",
         "backend_url": "https://dashscope.aliyuncs.com/compatible-mode/v1",
         "deep_think_llm": preset["deep_think_model"],
         "quick_think_llm": preset["quick_think_model"],
         "max_debate_rounds": max_debate_rounds,
         "max_risk_discuss_rounds": max_risk_discuss_rounds,
-    })
-    return config
+    }
 
 
 def get_openrouter_config(
@@ -308,13 +370,12 @@ def get_openrouter_config(
     # Get model preset
     preset = MODEL_PRESETS.get(model, MODEL_PRESETS["gpt-4o"])
 
-    config = get_market_config(market)
-    config.update({
+    return {
+        **_market_base(market),
         "llm_provider": "openrouter",
         "backend_url": "https://openrouter.ai/api/v1",
         "deep_think_llm": preset["deep_think_model"],
         "quick_think_llm": preset["quick_think_model"],
         "max_debate_rounds": max_debate_rounds,
         "max_risk_discuss_rounds": max_risk_discuss_rounds,
-    })
-    return config
+    }
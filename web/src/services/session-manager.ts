@@ -365,10 +365,9 @@ export class SessionManager {
         model: session.model,
       }
 
-      // Track current agent's accumulated content
-      let currentAgent = ''
-      let accumulatedContent = ''
-      let tokenCount = 0
+      // Accumulated content per agent: the analysts run concurrently, so
+      // their tokens interleave
+      const accumulatedContent: Record<string, string> = {}
 
       for await (const chunk of analysisClient.streamTokens(request)) {
         if (signal.aborted) return
@@ -383,9 +382,7 @@ export class SessionManager {
           case 'node_start':
             // Agent started processing
             if (agent) {
-              currentAgent = agent
-              accumulatedContent = ''
-              tokenCount = 0
+              accumulatedContent[agent] = ''
               session.currentAgent = agent
               this.saveSessions()
               sseManager.publish(sessionId, session)
@@ -395,9 +392,8 @@ export class SessionManager {
           case 'token':
             // Received token, accumulate and push in real-time
             if (agent && content) {
-              accumulatedContent += content
-              tokenCount++
-              session.reports[agent] = accumulatedContent
+              accumulatedContent[agent] = (accumulatedContent[agent] ?? '') + content
+              session.reports[agent] = accumulatedContent[agent]
 
               // Push every token for smooth typewriter effect
               sseManager.publish(sessionId, session)
@@ -413,8 +409,9 @@ export class SessionManager {
               this.saveSessions()
               sseManager.publish(sessionId, session)
             }
-            currentAgent = ''
-            accumulatedContent = ''
+            if (agent) {
+              delete accumulatedContent[agent]
+            }
             break
 
           case 'complete':